@@ -1,13 +1,395 @@
 """Command-line interface."""
 
+import json
+import os
+import sys
+from typing import Optional
+from typing import Type
+
 import click
 
+from . import bench as benchmarks
+from . import inspector
+from . import load as harness
+from . import stream
+from . import transcode
+from .generate import Generator
+from .messages.message import Message
+from .utils import importsubclasses
+
+
+def schema(module: str) -> dict:
+    """Import <Message> Classes Of Module(working directory importable)."""
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    return importsubclasses(module, Message)
+
+
+def message_class(target: str) -> Type[Message]:
+    """Import <Message> Class(module:Class).
+
+    Raises:
+        click.BadParameter: not module:Class or class not found.
+    """
+    module, _, name = target.partition(":")
+    classes = schema(module) if module and name else {}
+    if name not in classes:
+        raise click.BadParameter(
+            f"Expected module:Class of a <Message> but found {target}.",
+            param_hint="--schema",
+        )
+    return classes[name]
+
+
+def bench_row(result: dict, memory: bool = False) -> str:
+    """Text Row Of Benchmark Result."""
+    name = f"{result['name']:<40} {result['operation']:<11}"
+    if not memory:
+        return (
+            f"{name}{result['ns_per_op']:>12.1f} ns/op"
+            f"{result['ops_per_sec']:>14.1f} ops/s"
+            f"{result['bytes']:>8} B"
+        )
+    if "retained_bytes" in result:
+        return f"{name}{result['retained_bytes']:>12} B retained"
+    return (
+        f"{name}{result['alloc_bytes']:>12.1f} B/op"
+        f"{result['alloc_blocks']:>10.1f} blocks/op"
+        f"{result['peak_bytes']:>10} B peak"
+    )
+
+
+def report_budget(report: dict, budget: dict) -> bool:
+    """Echo Budget Violations(stderr).
 
-@click.command()
+    Returns:
+        (bool): any metric over budget.
+    """
+    violations = benchmarks.over_budget(report, budget)
+    for result in violations:
+        click.echo(
+            f"OVER BUDGET {result['name']} {result['operation']}: "
+            f"{result['metric']} {result['value']} > {result['budget']}",
+            err=True,
+        )
+    return bool(violations)
+
+
+def report_regressions(report: dict, baseline: dict, threshold: float) -> bool:
+    """Echo Regressions Against Baseline(stderr).
+
+    Returns:
+        (bool): any operation regressed.
+    """
+    regressions = benchmarks.compare(report, baseline, threshold)
+    for result in regressions:
+        click.echo(
+            f"REGRESSION {result['name']} {result['operation']}: "
+            f"{result['baseline_ns']:.1f} -> {result['ns_per_op']:.1f} ns/op "
+            f"(+{result['change']:.1%})",
+            err=True,
+        )
+    return bool(regressions)
+
+
+@click.group(invoke_without_command=True)
 @click.version_option()
 def main() -> None:
     """Renity."""
 
 
+@main.command()
+@click.option(
+    "--number", default=1000, show_default=True, help="Calls per round."
+)
+@click.option(
+    "--repeat", default=5, show_default=True, help="Rounds(best reported)."
+)
+@click.option(
+    "--filter", "pattern", default=None, help="Only matching scenarios."
+)
+@click.option("--json", "as_json", is_flag=True, help="Print JSON report.")
+@click.option(
+    "--output", type=click.Path(dir_okay=False), help="Write JSON report."
+)
+@click.option(
+    "--compare",
+    "baseline",
+    type=click.File("r"),
+    help="Flag regressions against baseline JSON report.",
+)
+@click.option(
+    "--threshold",
+    default=0.1,
+    show_default=True,
+    help="Allowed slowdown ratio before flagging.",
+)
+@click.option(
+    "--memory",
+    is_flag=True,
+    help="Allocations per operation & retained instance size.",
+)
+@click.option(
+    "--budget",
+    type=click.File("r"),
+    help='Fail when a metric exceeds budget JSON({name|"*": {op|"*": {metric: max}}}).',
+)
+def bench(
+    number: int,
+    repeat: int,
+    pattern: Optional[str],
+    as_json: bool,
+    output: Optional[str],
+    baseline: Optional[click.File],
+    threshold: float,
+    memory: bool,
+    budget: Optional[click.File],
+) -> None:
+    """Encode/decode throughput, latency & memory benchmarks."""
+    if memory:
+        report = benchmarks.run_memory(number=number, pattern=pattern)
+    else:
+        report = benchmarks.run(number=number, repeat=repeat, pattern=pattern)
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if as_json:
+        click.echo(json.dumps(report, indent=2))
+    else:
+        for result in report["results"]:
+            click.echo(bench_row(result, memory))
+
+    failed = False
+    if budget is not None:
+        failed = report_budget(report, json.load(budget))
+
+    if baseline is not None:
+        regressed = report_regressions(report, json.load(baseline), threshold)
+        failed = failed or regressed
+
+    if failed:
+        raise SystemExit(1)
+
+
+@main.command()
+@click.option(
+    "--scenario",
+    default="width:4",
+    show_default=True,
+    help="Benchmark scenario schema(see renity bench).",
+)
+@click.option(
+    "--server",
+    type=click.Choice(sorted(harness.SERVERS)),
+    default="asyncio",
+    show_default=True,
+)
+@click.option(
+    "--clients", default=4, show_default=True, help="Concurrent clients."
+)
+@click.option(
+    "--rate",
+    default=100.0,
+    show_default=True,
+    help="Messages/second per client(0 = unthrottled).",
+)
+@click.option("--duration", default=2.0, show_default=True, help="Seconds.")
+@click.option(
+    "--schema",
+    "target",
+    default=None,
+    help="<Message> class(module:Class) with generated payload"
+    "(overrides --scenario).",
+)
+@click.option(
+    "--seed", default=0, show_default=True, help="Generated payload seed."
+)
+def load(
+    scenario: str,
+    server: str,
+    clients: int,
+    rate: float,
+    duration: float,
+    target: Optional[str],
+    seed: int,
+) -> None:
+    """Loopback echo load test(latency percentiles)."""
+    if target:
+        message_cls = message_class(target)
+        message = Generator(message_cls, seed=seed).message()
+    else:
+        items = {item.name: item for item in benchmarks.scenarios()}
+        if scenario not in items:
+            raise click.BadParameter(
+                f"Expected one of {sorted(items)}.", param_hint="--scenario"
+            )
+        message_cls = items[scenario].message_cls
+        message = items[scenario].message
+
+    report = harness.run(
+        message_cls,
+        message,
+        server=server,
+        clients=clients,
+        rate=rate,
+        duration=duration,
+    )
+    click.echo(json.dumps(report, indent=2))
+
+    if report["errors"]:
+        raise SystemExit(1)
+
+
+@main.command()
+@click.argument("file", type=click.File("rb"))
+@click.option(
+    "--schema",
+    "module",
+    default=None,
+    help="Module path of <Message> classes(field keys of named messages).",
+)
+@click.option(
+    "--framed/--raw",
+    default=None,
+    help="Length-prefixed frames or one message [default: detect].",
+)
+@click.option(
+    "--summary", "summary_only", is_flag=True, help="Only print summary."
+)
+@click.option("--json", "as_json", is_flag=True, help="Print JSON report.")
+def inspect(
+    file: click.File,
+    module: Optional[str],
+    framed: Optional[bool],
+    summary_only: bool,
+    as_json: bool,
+) -> None:
+    """Per-field wire size breakdown of a message or framed file."""
+    classes = schema(module) if module else None
+    summary = inspector.Summary()
+    messages = []
+
+    for inspection in inspector.inspect_file(file, classes, framed):
+        summary.add(inspection)
+        if summary_only:
+            continue
+        if as_json:
+            messages.append(
+                {
+                    "type": inspection.type,
+                    "type_id": inspection.type_id,
+                    "size": inspection.size,
+                    "header_size": inspection.header_size,
+                    "rows": [row._asdict() for row in inspection.rows],
+                }
+            )
+            continue
+
+        click.echo(
+            f"{inspection.type} {inspection.size} B"
+            f"(header {inspection.header_size} B)"
+        )
+        click.echo(
+            f"  {'offset':>6} {'size':>5}  {'wire':<6} {'field':>5}  "
+            f"{'encoding':<12} {'key':<16} value"
+        )
+        for row in inspection.rows:
+            click.echo(
+                f"  {row.offset:>6} {row.size:>5}  {row.wire or '-':<6} "
+                f"{'-' if row.field is None else row.field:>5}  "
+                f"{row.encoding or '-':<12} {row.key:<16} {row.value!r}"
+            )
+
+    report = summary.as_dict()
+    if as_json:
+        if not summary_only:
+            report = {"messages": messages, "summary": report}
+        click.echo(json.dumps(report, indent=2, default=str))
+        return
+
+    click.echo(
+        f"{report['messages']} messages, {report['bytes']} B"
+        f"({report['avg_bytes']} B/message), type header "
+        f"{report['header_bytes']} B({report['header_share']:.1%})"
+    )
+    for field in report["fields"]:
+        click.echo(
+            f"  {field['type'] + '.' + field['key']:<32}"
+            f"{field['count']:>8} x{field['avg_bytes']:>9.2f} B"
+            f"{field['bytes']:>12} B{field['share']:>8.1%}"
+        )
+
+
+workers_option = click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    help="Worker processes(1 = in process).",
+)
+batch_size_option = click.option(
+    "--batch-size",
+    default=1000,
+    show_default=True,
+    help="Records per batch(2 x workers batches in flight).",
+)
+
+
+@main.command()
+@click.argument("module")
+@click.argument("source", type=click.File("r"), default="-")
+@click.argument("target", type=click.File("wb"), default="-")
+@click.option(
+    "--type", "_type", default=None, help='Type of lines without "type".'
+)
+@workers_option
+@batch_size_option
+def encode(
+    module: str,
+    source: click.File,
+    target: click.File,
+    _type: Optional[str],
+    workers: int,
+    batch_size: int,
+) -> None:
+    """NDJSON to length-prefixed frames(MODULE: <Message> classes)."""
+    schema(module)
+    try:
+        for frame in transcode.encode(
+            source, module, _type, workers=workers, batch_size=batch_size
+        ):
+            target.write(frame)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+
+
+@main.command()
+@click.argument("module")
+@click.argument("source", type=click.File("rb"), default="-")
+@click.argument("target", type=click.File("w"), default="-")
+@workers_option
+@batch_size_option
+def decode(
+    module: str,
+    source: click.File,
+    target: click.File,
+    workers: int,
+    batch_size: int,
+) -> None:
+    """Length-prefixed frames to NDJSON(MODULE: <Message> classes)."""
+    schema(module)
+    try:
+        for line in transcode.decode(
+            stream.frames(source),
+            module,
+            workers=workers,
+            batch_size=batch_size,
+        ):
+            target.write(line)
+    except (ValueError, EOFError) as e:
+        raise click.ClickException(str(e)) from e
+
+
 if __name__ == "__main__":
-    main(prog_name="burgos")  # pragma: no cover
+    main(prog_name="renity")  # pragma: no cover
@@ -0,0 +1,411 @@
+"""Renity Benchmarks.
+
+Encode/decode/round-trip throughput & per-message latency of:
+
+    * field:<Field> - one field of each built-in field type.
+    * width:<n> - messages of 1-8 IntFields(schemas are limited to 8 fields).
+    * payload:<size> - short/long strings, small/large packed lists.
+    * baseline:<json|struct>:<scenario> - stdlib equivalents.
+
+Memory mode(see run_memory) reports tracemalloc allocations per
+encode/decode/construct and retained size of decoded instances.
+
+Results are JSON serializable and comparable(see compare, over_budget).
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import struct
+import sys
+import timeit
+import tracemalloc
+from statistics import median
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Type
+
+from .fields import fields
+from .messages.message import Message
+
+
+# Field name: (field factory, sample value)
+FIELD_SAMPLES: Dict[str, tuple] = {
+    "BoolField": (fields.BoolField, True),
+    "IntField": (fields.IntField, 123456),
+    "FloatField": (fields.FloatField, 3.14159),
+    "Float32Field": (fields.Float32Field, 1.5),
+    "Fixed32Field": (fields.Fixed32Field, 4000000000),
+    "SFixed32Field": (fields.SFixed32Field, -123456),
+    "Fixed64IntField": (fields.Fixed64IntField, 2**40),
+    "SFixed64IntField": (fields.SFixed64IntField, -(2**40)),
+    "StringField": (fields.StringField, "hello"),
+    "EnumField": (
+        lambda: fields.EnumField(choices=("idle", "run", "jump")),
+        "run",
+    ),
+    "MapField": (
+        lambda: fields.MapField(fields.StringField(), fields.IntField()),
+        {"a": 1, "b": 2},
+    ),
+    "ListField": (
+        lambda: fields.ListField(
+            fields.IntField(),
+            fields.FloatField(),
+            fields.BoolField(),
+            fields.StringField(),
+        ),
+        [1, 2.5, True, "x"],
+    ),
+}
+
+
+class Scenario(NamedTuple):
+    """Benchmark Scenario.
+
+    Attributes:
+        name(str): scenario name.
+        message_cls(Message): <Message> sub-class.
+        message(dict): sample message.
+        struct_format(str): equivalent struct format(None when not fixed).
+    """
+
+    name: str
+    message_cls: Type[Message]
+    message: dict
+    struct_format: Optional[str] = None
+
+
+def scenario(
+    name: str, attrs: Dict[str, Any], message: dict, fmt: Optional[str] = None
+) -> Scenario:
+    """Build Scenario <Message> sub-class."""
+    cls_name = "Bench" + "".join(
+        part.capitalize() for part in name.replace(":", "_").split("_")
+    )
+    message_cls = type(cls_name, (Message,), attrs)
+    return Scenario(name, message_cls, message, fmt)
+
+
+def scenarios() -> List[Scenario]:
+    """Benchmark Scenarios.
+
+    Returns:
+        (list): field, width & payload scenarios.
+    """
+    result = []
+
+    for name, (factory, value) in FIELD_SAMPLES.items():
+        result.append(scenario(f"field:{name}", {"x": factory()}, {"x": value}))
+
+    for width in range(1, 9):
+        attrs = {f"f{idx}": fields.IntField() for idx in range(width)}
+        message = {f"f{idx}": idx * 1000 for idx in range(width)}
+        result.append(scenario(f"width:{width}", attrs, message, f"<{width}q"))
+
+    strings = {"short_string": "hi", "long_string": "x" * 1024}
+    for name, value in strings.items():
+        result.append(
+            scenario(
+                f"payload:{name}", {"x": fields.StringField()}, {"x": value}
+            )
+        )
+
+    lists = {"small_list": 4, "large_list": 64}
+    for name, size in lists.items():
+        attrs = {
+            "x": fields.ListField(*(fields.IntField() for _ in range(size)))
+        }
+        result.append(
+            scenario(
+                f"payload:{name}", attrs, {"x": list(range(size))}, f"<{size}q"
+            )
+        )
+
+    return result
+
+
+def operations(item: Scenario) -> Iterator[tuple]:
+    """Timed Callables of Scenario.
+
+    Yields:
+        (tuple): name, operation, callable, encoded size(bytes)
+    """
+    m_cls, message = item.message_cls, item.message
+    data = bytes(m_cls(message))
+
+    yield item.name, "encode", lambda: bytes(m_cls(message)), len(data)
+    yield item.name, "decode", lambda: m_cls(data), len(data)
+    yield item.name, "round-trip", lambda: m_cls(bytes(m_cls(message))), len(
+        data
+    )
+
+    # Stdlib baselines
+    name = f"baseline:json:{item.name}"
+    text = json.dumps(message).encode("utf-8")
+    yield name, "encode", lambda: json.dumps(message).encode("utf-8"), len(text)
+    yield name, "decode", lambda: json.loads(text), len(text)
+
+    if item.struct_format:
+        packer = struct.Struct(item.struct_format)
+        values = [v for value in message.values() for v in _flat(value)]
+        packed = packer.pack(*values)
+        name = f"baseline:struct:{item.name}"
+        yield name, "encode", lambda: packer.pack(*values), len(packed)
+        yield name, "decode", lambda: packer.unpack(packed), len(packed)
+
+
+def _flat(value: Any) -> list:
+    """Flatten packed list values."""
+    return list(value) if isinstance(value, list) else [value]
+
+
+def measure(fn: Callable, number: int, repeat: int) -> dict:
+    """Time Callable.
+
+    Args:
+        fn(callable): operation.
+        number(int): calls per round.
+        repeat(int): rounds.
+
+    Returns:
+        (dict): ns_per_op(best round), median_ns, ops_per_sec
+    """
+    rounds = [
+        total * 1e9 / number
+        for total in timeit.Timer(fn).repeat(repeat=repeat, number=number)
+    ]
+    best = min(rounds)
+    return {
+        "ns_per_op": round(best, 1),
+        "median_ns": round(median(rounds), 1),
+        "ops_per_sec": round(1e9 / best, 1) if best else 0.0,
+    }
+
+
+def run(
+    number: int = 1000, repeat: int = 5, pattern: Optional[str] = None
+) -> dict:
+    """Run Benchmarks.
+
+    Args:
+        number(int): calls per round.
+        repeat(int): rounds(best round is reported).
+        pattern(str): only scenarios containing pattern.
+
+    Returns:
+        (dict): environment & results.
+    """
+    results = []
+    for item in scenarios():
+        for name, operation, fn, size in operations(item):
+            if pattern and pattern not in name:
+                continue
+            results.append(
+                {
+                    "name": name,
+                    "operation": operation,
+                    "bytes": size,
+                    **measure(fn, number, repeat),
+                }
+            )
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "number": number,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float = 0.1) -> List[dict]:
+    """Regressions Against Baseline Report.
+
+    Args:
+        report(dict): current run(see run).
+        baseline(dict): previous run.
+        threshold(float): allowed slowdown ratio(0.1 = 10%).
+
+    Returns:
+        (list): results slower than baseline by more than threshold.
+    """
+    previous = {
+        (result["name"], result["operation"]): result.get("ns_per_op")
+        for result in baseline.get("results", [])
+    }
+
+    regressions = []
+    for result in report["results"]:
+        before = previous.get((result["name"], result["operation"]))
+        if not before or "ns_per_op" not in result:
+            continue
+        change = result["ns_per_op"] / before - 1
+        if change > threshold:
+            regressions.append(
+                {**result, "baseline_ns": before, "change": round(change, 4)}
+            )
+
+    return regressions
+
+
+def sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """Retained Size(sys.getsizeof walk).
+
+    * Follows containers, __dict__ & __slots__(classes are not followed).
+
+    Args:
+        obj(Any): object to measure.
+        seen(set): ids already counted(shared objects counted once).
+
+    Returns:
+        (int): bytes.
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen or isinstance(obj, type):
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(sizeof(k, seen) + sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(sizeof(item, seen) for item in obj)
+    elif not isinstance(obj, (str, bytes, bytearray, int, float)):
+        if hasattr(obj, "__dict__"):
+            size += sizeof(vars(obj), seen)
+        for cls in type(obj).__mro__:
+            for slot in cls.__dict__.get("__slots__", ()):
+                if hasattr(obj, slot):
+                    size += sizeof(getattr(obj, slot), seen)
+
+    return size
+
+
+def allocations(fn: Callable, number: int) -> dict:
+    """Allocations Per Call(tracemalloc).
+
+    Args:
+        fn(callable): operation.
+        number(int): calls(results kept alive until measured).
+
+    Returns:
+        (dict): alloc_bytes & alloc_blocks(retained per call),
+            peak_bytes(transient peak of one call).
+    """
+    # Warm-up(lazy per-class state, caches)
+    fn()
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+
+        before = tracemalloc.take_snapshot()
+        results = [fn() for _ in range(number)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    del results
+
+    return {
+        "alloc_bytes": round(sum(s.size_diff for s in stats) / number, 1),
+        "alloc_blocks": round(sum(s.count_diff for s in stats) / number, 1),
+        "peak_bytes": peak - start,
+    }
+
+
+def run_memory(number: int = 100, pattern: Optional[str] = None) -> dict:
+    """Run Memory Benchmarks.
+
+    Args:
+        number(int): calls per operation.
+        pattern(str): only scenarios containing pattern.
+
+    Returns:
+        (dict): environment & results(encode/decode/construct/instance).
+    """
+    results = []
+    for item in scenarios():
+        if pattern and pattern not in item.name:
+            continue
+
+        m_cls, message = item.message_cls, item.message
+        data = bytes(m_cls(message))
+        timed = {
+            "encode": lambda: bytes(m_cls(message)),
+            "decode": lambda: m_cls(data),
+            "construct": lambda: m_cls(message),
+        }
+
+        for operation, fn in timed.items():
+            results.append(
+                {
+                    "name": item.name,
+                    "operation": operation,
+                    **allocations(fn, number),
+                }
+            )
+
+        results.append(
+            {
+                "name": item.name,
+                "operation": "instance",
+                "retained_bytes": sizeof(m_cls(data)),
+            }
+        )
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "number": number,
+        "results": results,
+    }
+
+
+def over_budget(report: dict, budget: dict) -> List[dict]:
+    """Results Exceeding Budget.
+
+    * budget: {name | "*": {operation | "*": {metric: max}}}
+    * Exact name/operation budgets take precedence over "*".
+
+    Args:
+        report(dict): memory(or timing) report.
+        budget(dict): max value per metric.
+
+    Returns:
+        (list): name, operation, metric, value, budget of violations.
+    """
+    violations = []
+    for result in report["results"]:
+        name, operation = result["name"], result["operation"]
+        by_name = budget.get(name, budget.get("*", {}))
+        limits = by_name.get(operation, by_name.get("*", {}))
+
+        for metric, limit in limits.items():
+            value = result.get(metric)
+            if value is not None and value > limit:
+                violations.append(
+                    {
+                        "name": name,
+                        "operation": operation,
+                        "metric": metric,
+                        "value": value,
+                        "budget": limit,
+                    }
+                )
+
+    return violations
@@ -7,6 +7,8 @@ WIRE_TYPES = {
     1: "_i64",
     # LEN	string, bytes, embedded messages, packed repeated fields
     2: "_len",
+    # I32	fixed32, sfixed32, float
+    5: "_i32",
     # MESSAGE IDENTIFIER -> LEN: String
     7: "_message_type",
 }
@@ -15,6 +17,36 @@ WIRE_TYPES = {
 
 WIRE_MASK = 0b111
 
+# Validation Modes(see Message.validation)
+
+# Full validation(every message)
+STRICT = "strict"
+# No validation(inputs already validated)
+TRUSTED = "trusted"
+# Validate 1 in Message.sample_rate messages, count failures
+SAMPLED = "sampled"
+
+VALIDATION_MODES = (STRICT, TRUSTED, SAMPLED)
+
 # Encoder Constants
 
-FIELDS = {1: "001", 2: "010", 3: "011"}
+FIELDS = {1: "001", 2: "010", 3: "011", 4: "100", 5: "101"}
+
+# Frame Constants
+
+# Identifier TLV bit: frame flags(varint) follow identifier
+# Flagged values(varint) follow flags in FRAME_FLAGS order
+FRAME_FLAG = 0b01000000
+
+FRAME_FLAGS = {
+    # Snapshot sequence(varint) follows flags
+    "snapshot": 0b1,
+    # Delta baseline sequence(varint) follows sequence
+    "delta": 0b10,
+    # Batch row count(varint) follows, body is columnar
+    "batch": 0b100,
+    # Body(after frame header) is deflate compressed
+    "compressed": 0b1000,
+    # Body is one fixed-layout struct(see messages/layout.py)
+    "fixed": 0b10000,
+}
@@ -1,62 +1,79 @@
 """Decoder Module."""
 
 import codecs
+import struct
+import threading
 import typing
 
 from bitstring import Bits
 from bitstring import BitStream
 
+from ..constants import FRAME_FLAG
+from ..constants import FRAME_FLAGS
 from ..constants import WIRE_MASK
 from ..constants import WIRE_TYPES
+from ..messages.registry import Registry
+from ..utils import StringDef
+from ..utils import StringRef
 from .exceptions import InvalidMessage
+from .exceptions import UnknownMessageType
+from .exceptions import UnsupportedFrame
 
 
 # Static Module Message Decoder
 
+# Fixed-width struct formats [wire field]: format
+I64_FORMATS = {2: ">Q", 3: ">q"}
+I32_FORMATS = {1: ">f", 2: ">I", 3: ">i"}
 
-# Module Vars
-bits: BitStream = BitStream()
-decoded_bytes: dict = dict()
-length: int = 0
-attributes: list = []
-decoded_value: dict = dict()
-# Module Vars
 
+class State(threading.local):
+    """Decoder State Of Current Message(per thread).
 
-def decode(_bits):
-    """Decode Message."""
-    global bits
-    global decoded_bytes
-    global length
-    global attributes
-    global decoded_value
+    Attributes:
+        bits(BitStream): message bits(read position).
+        decoded_bytes(bytes): message bytes.
+        length(int): last bit position.
+        attributes(list): attribute bits of undecoded records.
+        decoded_value(dict): decoded values.
+    """
 
-    # Message Start
-    # Assert Message begins with 'Message Type(int): 7'
-    bits = BitStream(bytes=_bits)
-    decoded_bytes = bits.bytes
-    length = len(bits) - 1
-    attributes = []
-    decoded_value = {}
+    def __init__(self) -> None:
+        self.bits = BitStream()
+        self.decoded_bytes = b""
+        self.length = 0
+        self.attributes: list = []
+        self.decoded_value: dict = {}
 
-    # Get Message Type For Constructing Message
-    message_type = bits.read(8)
 
-    # Raise Exception if Message does not begin with Identifier
-    if message_type.int & WIRE_MASK != 7:
-        raise InvalidMessage(message_type.bin)
+# Module State(thread-local, decode is re-entrant across threads)
+state = State()
 
-    # Get Message Type from LEN: String Protocol
-    message_type, _ = base_len(data=bits, field=2)
 
-    # Update Decoded Dict with message_type
-    decoded_value["type"] = message_type
+def decode(_bits):
+    """Decode Message."""
+    identify(_bits)
+    bits = state.bits
+    decoded_value = state.decoded_value
+
+    # Compressed body(see serializers/compression.py)
+    if decoded_value.get("flags", 0) & FRAME_FLAGS["compressed"]:
+        raise UnsupportedFrame("Compressed", "Message.compression")
+
+    # Fixed-layout body has no tags(see messages/layout.py)
+    if decoded_value.get("flags", 0) & FRAME_FLAGS["fixed"]:
+        raise UnsupportedFrame("Fixed-layout", "Message.fixed_layout")
+
+    # Batch frame body is columnar(see messages/batch.py)
+    if "rows" in decoded_value:
+        return decoded_value
 
     # Read Attributes included in message
+    attributes = state.attributes
     for idx, x in enumerate(bits.read(8).bin):
         # Attributes Included/Absent On/Off = 1/0
         if x == "1":
-            attributes = [2 ** abs(idx - 7)] + attributes
+            attributes.insert(0, 2 ** abs(idx - 7))
 
     # Empty Message will not throw exception, but return message containing only type
     if bits.pos == len(bits):  # pragma: no cover
@@ -85,11 +102,110 @@ def decode(_bits):
     return decoded_value
 
 
+def identify(_bits) -> int:
+    """Decode Message Identifier.
+
+    * Message type(name or registry type_id)
+    * Frame header(see frame)
+
+    Args:
+        _bits(bytes): encoded message.
+
+    Returns:
+        position(int): byte offset of first byte after identifier/frame.
+
+    Raises:
+        InvalidMessage: message does not begin with identifier.
+        UnknownMessageType: type_id is not registered.
+    """
+    # Message Start
+    # Assert Message begins with 'Message Type(int): 7'
+    bits = state.bits = BitStream(bytes=_bits)
+    state.decoded_bytes = bits.bytes
+    state.length = len(bits) - 1
+    state.attributes = []
+    state.decoded_value = {}
+
+    # Get Message Type For Constructing Message
+    message_type = bits.read(8)
+
+    # Raise Exception if Message does not begin with Identifier
+    if message_type.int & WIRE_MASK != 7:
+        raise InvalidMessage(message_type.bin)
+
+    # Frame flags follow identifier
+    framed = message_type.uint & FRAME_FLAG
+
+    if message_type[2:5].uint == 1:
+        # Get Message Type from VARINT: Registry type_id
+        type_id, _ = base_varint(bits)
+        try:
+            message_type = Registry.names[type_id]
+        except KeyError as e:
+            raise UnknownMessageType(type_id) from e
+    else:
+        # Get Message Type from LEN: String Protocol
+        message_type, _ = base_len(data=bits, field=2)
+
+    # Update Decoded Dict with message_type
+    state.decoded_value["type"] = message_type
+
+    if framed:
+        frame()
+
+    return bits.pos // 8
+
+
+def record(_bits) -> typing.Any:
+    """Decode Single Record.
+
+    Args:
+        _bits(bytes): TLV + value of one field.
+
+    Returns:
+        value(Any): decoded value.
+    """
+    bits = state.bits = BitStream(bytes=_bits)
+    state.length = len(bits) - 1
+
+    # Get wire type/field of record
+    wire, field = tag()
+
+    # Advance pointer past TLV
+    bits.read(8)
+
+    value, _ = globals()[f"base{wire}"](bits, field)
+    return value
+
+
+def frame() -> None:
+    """Frame Header.
+
+    * Flags(varint) followed by flagged values(varint).
+    """
+    bits = state.bits
+    decoded_value = state.decoded_value
+
+    flags, _ = base_varint(bits)
+    decoded_value["flags"] = flags
+
+    # Snapshot sequence
+    if flags & FRAME_FLAGS["snapshot"]:
+        decoded_value["sequence"], _ = base_varint(bits)
+
+    # Delta baseline sequence
+    if flags & FRAME_FLAGS["delta"]:
+        decoded_value["baseline"], _ = base_varint(bits)
+
+    # Batch row count
+    if flags & FRAME_FLAGS["batch"]:
+        decoded_value["rows"], _ = base_varint(bits)
+
+
 def bytes(_bits):
     """Byte representation of decoded data."""
-    global decoded_bytes
     decode(_bits)
-    return decoded_bytes
+    return state.decoded_bytes
 
 
 def tag() -> tuple:
@@ -98,10 +214,8 @@ def tag() -> tuple:
     Returns:
         TLV(tuple): (Wire Type(str), Wire Field(int))
     """
-    global bits
-
     # Peek at TLV
-    _tag = bits.peek(8)
+    _tag = state.bits.peek(8)
 
     # Get Wire Type from TLV
     _wire = WIRE_TYPES[_tag.int & WIRE_MASK]
@@ -127,12 +241,9 @@ def advance():
     Raises:
         Exception: General Exception from advancing bit pointer.
     """
-    global bits
-    global length
-
     try:
         # Check if there are bits left
-        if bits.pos < length:
+        if state.bits.pos < state.length:
             # Get tag from current position
             wire, field = tag()
 
@@ -147,8 +258,7 @@ def advance():
 
 def next_attr():
     """Pop next attribute from queue."""
-    global attributes
-    return attributes.pop(0)
+    return state.attributes.pop(0)
 
 
 def base_wrapper(base_func: typing.Callable) -> typing.Callable:
@@ -162,7 +272,7 @@ def base_wrapper(base_func: typing.Callable) -> typing.Callable:
     """
 
     def wrapper(*args, **kwargs):
-        global bits
+        bits = state.bits
         # Get Wire Field Type
         _, field = tag()
 
@@ -246,6 +356,9 @@ def base_varint(data, field=0, *args, **kwargs):
     # Value is bool
     elif field == 3:
         value = bool(value)
+    # Value is string table reference
+    elif field == 5:
+        value = StringRef(value)
 
     return (value, length)
 
@@ -266,13 +379,14 @@ def _varint(*args, **kwargs):
     return base_varint(*args, **kwargs)
 
 
-def base_i64(data, *args, **kwargs):
-    """I64 (Float).
+def base_i64(data, field=1, *args, **kwargs):
+    """I64 (Float, Fixed64, SFixed64).
 
-    * Base call for unpacking 64-bit Floats
+    * Base call for unpacking 64-bit Floats/Integers
 
     Args:
         data(BitStream, bytes, bin...): Binary Data
+        field(int): Field type of I64 wire type.
         *args(Any): Optional*
         **kwargs(Any): Optional**
 
@@ -281,6 +395,10 @@ def base_i64(data, *args, **kwargs):
     """
     _bits = __get_stream(data)
 
+    if field in I64_FORMATS:
+        value = struct.unpack(I64_FORMATS[field], _bits.read(64).bytes)[0]
+        return (value, 64)
+
     float = _bits.read("float64")
     return (float, 64)
 
@@ -302,6 +420,43 @@ def _i64(*args, **kwargs):
     return base_i64(*args, **kwargs)
 
 
+def base_i32(data, field=1, *args, **kwargs):
+    """I32 (Float32, Fixed32, SFixed32).
+
+    * Base call for unpacking 32-bit Floats/Integers
+
+    Args:
+        data(BitStream, bytes, bin...): Binary Data
+        field(int): Field type of I32 wire type.
+        *args(Any): Optional*
+        **kwargs(Any): Optional**
+
+    Returns:
+        (tuple): value,length
+    """
+    _bits = __get_stream(data)
+
+    value = struct.unpack(I32_FORMATS[field], _bits.read(32).bytes)[0]
+    return (value, 32)
+
+
+@base_wrapper
+def _i32(*args, **kwargs):
+    """I32 Advance Method.
+
+    * Advance Message Deserialization and return value.
+    * 4 bytes for IEEE 754 binary32/fixed-width integers
+
+    Args:
+        *args(Any): Optional*
+        **kwargs(Any): Optional**
+
+    Returns:
+        Value/Function call into next Wire Type for deserialization.
+    """
+    return base_i32(*args, **kwargs)
+
+
 def base_len(data, field, *args, **kwargs):
     """Length Delimited Record.
 
@@ -322,6 +477,8 @@ def base_len(data, field, *args, **kwargs):
             List of Primitive Scalar Types
         Case 2:
             Decoded utf-8 String
+        Case 3:
+            Dict of Primitive Scalar Types
     """
     _bits = __get_stream(data)
 
@@ -337,12 +494,20 @@ def base_len(data, field, *args, **kwargs):
     if field == 1:
         # LEN: Packed - Unpack List
         value: typing.Any = unpack(length * 8)
-    elif field == 2:
+    elif field == 3:
+        # LEN: Map - Unpack alternating keys/values
+        items = unpack(length * 8)
+        value = dict(zip(items[::2], items[1::2]))
+    elif field in (2, 4):
         # LEN: String decode utf-8 String
         value = _bits.read(length * 8)
 
         value = codecs.decode(value.bytes, "utf-8")
 
+        # String table definition
+        if field == 4:
+            value = StringDef(value)
+
     else:
         raise AttributeError("LEN: Field does not exist.")
 
@@ -381,7 +546,7 @@ def unpack(_length: int) -> list:
     Raises:
         TypeError: Expects, cannot nest list, tuple, dict etc.
     """
-    global bits
+    bits = state.bits
 
     unpacked = []
 
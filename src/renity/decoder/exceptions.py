@@ -1,5 +1,10 @@
 """Decoder Module Exceptions."""
 
+from ..fields.constants import INVALID_CHOICE_INDEX
+from ..fields.constants import MESSAGE_TOO_LARGE
+from ..fields.constants import UNKNOWN_MESSAGE_TYPE
+from ..fields.constants import UNSUPPORTED_FRAME
+
 
 class InvalidMessage(Exception):
     """Invalid Message Exception."""
@@ -12,3 +17,43 @@ class InvalidMessage(Exception):
         self.message = _message
         self.code = 3101
         super().__init__(_message)
+
+
+class UnknownMessageType(Exception):
+    """Unknown Message Type Exception."""
+
+    def __init__(self, type_id: int) -> None:
+        _message = f"No Message registered for type_id {type_id}."
+        self.message = _message
+        self.code = UNKNOWN_MESSAGE_TYPE
+        super().__init__(_message)
+
+
+class UnsupportedFrame(Exception):
+    """Unsupported Frame Exception."""
+
+    def __init__(self, frame: str, decoder: str) -> None:
+        _message = f"{frame} frame must be decoded with {decoder}."
+        self.message = _message
+        self.code = UNSUPPORTED_FRAME
+        super().__init__(_message)
+
+
+class InvalidChoiceIndex(Exception):
+    """Invalid Choice Index Exception."""
+
+    def __init__(self, index: int, size: int) -> None:
+        _message = f"Choice index {index} out of range for {size} choices."
+        self.message = _message
+        self.code = INVALID_CHOICE_INDEX
+        super().__init__(_message)
+
+
+class MessageTooLarge(Exception):
+    """Message Too Large Exception."""
+
+    def __init__(self, max_size: int) -> None:
+        _message = f"Decompressed message exceeds {max_size} bytes."
+        self.message = _message
+        self.code = MESSAGE_TOO_LARGE
+        super().__init__(_message)
@@ -1,5 +1,6 @@
 """Encoder Module."""
 
+import struct
 import typing
 from math import ceil
 from typing import Any
@@ -11,29 +12,37 @@ from renity.fields.fields import ListField
 
 from ..constants import FIELDS
 from ..constants import WIRE_TYPES
+from ..utils import StringDef
+from ..utils import StringRef
 
 
 class Encoder:
     """Encoder.
 
     Attributes:
-        _varint(dict): valid types (int32,sint32,bool)
-        _i64(dict): valid types (fixed64)
-        _len(dict): valid types (list(packed), string)
-        _message_type(dict): string
+        _varint(dict): valid types (int32,sint32,bool,enum)
+        _i64(dict): valid types (fixed64, ufixed64, sfixed64)
+        _i32(dict): valid types (float32, fixed32, sfixed32)
+        _len(dict): valid types (list(packed), string, dict(map))
+        _message_type(dict): type_id, string
     """
 
-    _varint = {1: "_int32", 2: "_sint32", 3: "_bool"}
-    _i64 = {1: "fixed64"}
-    _len = {1: "_packed", 2: "_string"}
-    _message_type = {2: "_string"}
+    _varint = {1: "_int32", 2: "_sint32", 3: "_bool", 4: "_enum"}
+    _i64 = {1: "fixed64", 2: "_ufixed64", 3: "_sfixed64"}
+    _i32 = {1: "_float32", 2: "_fixed32", 3: "_sfixed32"}
+    _len = {1: "_packed", 2: "_string", 3: "_map"}
+    _message_type = {1: "_type_id", 2: "_string"}
 
     @classmethod
-    def encode(cls, _fields: list) -> bytes:
+    def encode(
+        cls, _fields: list, header: str = "", elide: bool = True
+    ) -> bytes:
         """Encode Message.
 
         Args:
             _fields(list): field(Field), key(str), value(Any), bit(int) Quartet
+            header(str): frame header bit-str(flags + values) after identifier
+            elide(bool): omit values equal to field default
 
         Returns:
             _bits(str): binary representation of encoded values
@@ -49,20 +58,13 @@ class Encoder:
         # iterate fields + encode
         for field, _, value, bit in _fields:
             if value is not None:
-                # Get wire type from Field
-                _wire_type = WIRE_TYPES[field.wire]
-
-                # Get wire field from Field
-                _wire_field = field.field
-
-                # Get corresponding encoder protocol name
-                wire = getattr(cls, _wire_type)[_wire_field]
-
-                # Get corresponding encoder protocol from name
-                _encoder = getattr(cls, wire)
+                # Elide value equal to pre-encoded default(see default_record)
+                default_record = field.default_record if elide else None
+                if default_record is not None and value is field.default:
+                    continue
 
                 # Encode field
-                record = _encoder(value, field, f"{field.wire:0b}".zfill(3))
+                record = cls.record(value, field)
 
                 # message_type(Used for constructing messages does not have a bit)
                 # set and continue loop
@@ -70,17 +72,115 @@ class Encoder:
                     identifier = record
                     continue
 
+                if record == default_record:
+                    continue
+
                 # Append encoded field to records list
                 records.append(record)
 
                 # Mark corresponding attribute bit
                 attributes += bit
 
+        # Flag identifier TLV(see constants.FRAME_FLAG)
+        if header:
+            identifier = "11" + identifier[2:] + header
+
         result: bytes = BitStream(
             bin=identifier + f"{attributes:0b}".zfill(8) + "".join(records)
         ).bytes
         return result
 
+    @classmethod
+    def record(cls, value: Any, field: Any) -> str:
+        """Encode Record.
+
+        Args:
+            value(Any): value to encode.
+            field(Field): field of value.
+
+        Returns:
+            (str): TLV + value bit-str
+        """
+        # Encode field with corresponding encoder protocol
+        return cls.protocol(field, value)(
+            value, field, f"{field.wire:0b}".zfill(3)
+        )
+
+    @classmethod
+    def protocol(cls, field: Any, value: Any = None) -> typing.Callable:
+        """Encoder Protocol of Field.
+
+        Args:
+            field(Field): field of value.
+            value(Any): value to encode(multi-type fields, see wire_field).
+
+        Returns:
+            (callable): encoder protocol
+        """
+        # [wire_type]: {[wire_field]: protocol name}
+        wire = getattr(cls, WIRE_TYPES[field.wire])[field.wire_field(value)]
+        return getattr(cls, wire)
+
+    @classmethod
+    def size(cls, value: Any, field: Any) -> int:
+        """Encoded Record Size.
+
+        * Computes byte length of record without encoding it.
+
+        Args:
+            value(Any): value to measure.
+            field(Field): field of value.
+
+        Returns:
+            (int): record length in bytes(TLV included).
+        """
+        if value is None:
+            return 0
+
+        # String table reference is a VARINT record(see _string)
+        if isinstance(value, StringRef):
+            return 1 + cls.varint_size(value)
+
+        wire, wire_field = field.wire, field.wire_field(value)
+
+        # VARINT
+        if wire == 0:
+            if wire_field == 3:
+                return 2
+            if wire_field == 4:
+                value = field.index[value]
+            elif wire_field == 2:
+                value = (value << 1) ^ (value >> 31)
+            return 1 + cls.varint_size(value)
+
+        # I64 / I32
+        if wire in (1, 5):
+            return 9 if wire == 1 else 5
+
+        # LEN
+        if wire_field == 2:
+            body = len(value.encode("utf-8"))
+        elif wire_field == 3:
+            body = sum(
+                cls.size(k, field.key_field) + cls.size(v, field.value_field)
+                for k, v in value.items()
+            )
+        else:
+            pairs = (
+                zip(field.sub_fields, value)
+                if field.sorted
+                else field.match(value)[0]
+            )
+            body = sum(cls.size(item, sub) for sub, item in pairs)
+
+        # Tag + Length(Int32 TLV + Varint) + Body
+        return 2 + cls.varint_size(body) + body
+
+    @staticmethod
+    def varint_size(value: int) -> int:
+        """Varint byte length."""
+        return max(1, ceil(value.bit_length() / 7))
+
     def __getitem__(self, wire: str) -> Any:
         """Override.
 
@@ -108,6 +208,36 @@ class Encoder:
 
         return tag + value
 
+    @classmethod
+    def _type_id(cls, _: str, field: typing.Any, *args: typing.Any) -> str:
+        """Message Identifier Protocol(compact).
+
+        Args:
+            field(TypeField): type field with registered type_id.
+            args(list): arbitrary args
+
+        Returns:
+            (str): Identifier TLV + Varint(type_id).
+        """
+        return "1" + f"0{FIELDS[1]}111" + cls.varint(field.type_id)
+
+    @classmethod
+    def _enum(
+        cls, _value: typing.Any, field: typing.Any, *args: typing.Any
+    ) -> str:
+        """Enum Protocol.
+
+        Args:
+            _value(Any): member of field choices.
+            field(EnumField): field containing precomputed choice index.
+            args(list): arbitrary args
+
+        Returns:
+            (str): Binary String representation of choice index.
+        """
+        # Generate Binary Protocol Message from TLV + Varint(index)
+        return "1" + f"0{FIELDS[4]}000" + cls.varint(field.index[_value])
+
     @classmethod
     def varint(
         cls,
@@ -189,6 +319,52 @@ class Encoder:
         result: str = "1" + f"{FIELDS[1]}001".zfill(7) + _bits.bin
         return result
 
+    @classmethod
+    def _fixed(cls, fmt: str, value: typing.Any, field: int, wire: str) -> str:
+        """Fixed-Width Protocol.
+
+        Args:
+            fmt(str): big-endian struct format.
+            value(Any): value to encode.
+            field(int): wire field.
+            wire(str): wire key.
+
+        Returns:
+            (str): TLV + fixed-width value bit-str
+        """
+        # Generate Tag
+        _tag = "1" + f"0{FIELDS[field]}{wire}"
+
+        # Pack value into fixed number of bytes
+        _bits = "".join(f"{byte:08b}" for byte in struct.pack(fmt, value))
+
+        return _tag + _bits
+
+    @classmethod
+    def _ufixed64(cls, value: int, *args: typing.Any) -> str:
+        """64bit Unsigned Int."""
+        return cls._fixed(">Q", value, 2, "001")
+
+    @classmethod
+    def _sfixed64(cls, value: int, *args: typing.Any) -> str:
+        """64bit Signed Int."""
+        return cls._fixed(">q", value, 3, "001")
+
+    @classmethod
+    def _float32(cls, value: float, *args: typing.Any) -> str:
+        """32bit Float."""
+        return cls._fixed(">f", value, 1, "101")
+
+    @classmethod
+    def _fixed32(cls, value: int, *args: typing.Any) -> str:
+        """32bit Unsigned Int."""
+        return cls._fixed(">I", value, 2, "101")
+
+    @classmethod
+    def _sfixed32(cls, value: int, *args: typing.Any) -> str:
+        """32bit Signed Int."""
+        return cls._fixed(">i", value, 3, "101")
+
     @classmethod
     def _string(cls, value: str, _: Any = None, wire: str = "010") -> str:
         """LEN: String.
@@ -200,14 +376,21 @@ class Encoder:
         Returns:
             (str): result
         """
-        # Generate Tag
-        _tag = "1" + f"0{FIELDS[2]}{wire}"
+        # String table reference(see messages/strings.py)
+        if isinstance(value, StringRef):
+            return "1" + f"0{FIELDS[5]}000" + cls.varint(value)
+
+        # Generate Tag(string table definition or string)
+        _tag = (
+            "1" + f"0{FIELDS[4 if isinstance(value, StringDef) else 2]}{wire}"
+        )
 
-        # Convert string to bits
-        _bits = "".join(format(ord(i), "08b") for i in value)
+        # Encode once: byte count is the length prefix
+        _bytes = value.encode("utf-8")
+        _length = cls._int32(len(_bytes))
 
-        # Get 8bit length
-        _length = cls._int32(int(len(_bits) / 8))
+        # Convert utf-8 string to bits
+        _bits = "".join(format(byte, "08b") for byte in _bytes)
 
         # Return Binary Protocol for LEN: String
         return _tag + _length + _bits
@@ -229,14 +412,23 @@ class Encoder:
         # Generate TLV
         _tag = "1" + f"0{FIELDS[1]}010"
 
-        # Initialize Bits String
+        # Sub-field per value(unordered: matched by type, see Field.match)
+        if field.sorted:
+            pairs = [
+                (sub, values[idx]) for idx, sub in enumerate(field.sub_fields)
+            ]
+        else:
+            pairs, _, __ = field.match(values)
+
+        # Initialize Bits String & body length(see size)
         _bits = ""
+        _body = 0
         try:
             # Iterate Subfields
-            for idx, sub in enumerate(field.sub_fields):
+            for sub, value in pairs:
                 try:
-                    # Get TLV Field
-                    _wire_field = sub.field
+                    # Get TLV Field(multi-type fields depend on value)
+                    _wire_field = sub.wire_field(value)
                 except IndexError:
                     # If value is not in list continue to next iteration
                     continue
@@ -251,12 +443,49 @@ class Encoder:
                 _encoder = getattr(cls, wire)
 
                 # Call encoder func
-                record = _encoder(values[idx], field)
+                record = _encoder(value, sub)
 
                 # Append returned record
                 _bits += record
+                _body += cls.size(value, sub)
 
             # Return Binary Protocol for LEN: Packed List
-            return _tag + cls._int32(int(len(_bits) / 8)) + _bits
+            return _tag + cls._int32(_body) + _bits
         except Exception as e:
             raise e
+
+    @classmethod
+    def _map(cls, values: dict, field: Any, __: Any = None) -> str:
+        """Map value(dict).
+
+        * Single LEN record of alternating key/value records.
+
+        Args:
+            values(dict): dict of (any scalar type)
+            field(MapField): key_field & value_field of MapField
+
+        Returns:
+            (str): result
+        """
+        # Generate TLV
+        _tag = "1" + f"0{FIELDS[3]}010"
+
+        key_field = field.key_field
+        value_field = field.value_field
+
+        # Length prefix computed up front(see size)
+        _length = cls._int32(
+            sum(
+                cls.size(key, key_field) + cls.size(value, value_field)
+                for key, value in values.items()
+            )
+        )
+
+        # Encode key/value records in a single pass
+        records = [_tag, _length]
+        for key, value in values.items():
+            records.append(cls.protocol(key_field, key)(key, key_field))
+            records.append(cls.protocol(value_field, value)(value, value_field))
+
+        # Return Binary Protocol for LEN: Map
+        return "".join(records)
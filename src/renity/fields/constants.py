@@ -5,6 +5,14 @@ Field Exception codes.
 
 INVALID_MESSAGE = 3101
 
+UNKNOWN_MESSAGE_TYPE = 3102
+
+UNSUPPORTED_FRAME = 3103
+
+INVALID_CHOICE_INDEX = 3104
+
+MESSAGE_TOO_LARGE = 3105
+
 REQUIRED_MESSAGE_FIELD = 3013
 
 INCORRECT_MESSAGE_TYPE = 3014
@@ -15,6 +23,16 @@ TOO_MANY_VALUES = 3016
 
 MISSING_PRIMITIVE = 3017
 
+VALUE_OUT_OF_RANGE = 3018
+
+TYPE_ID_COLLISION = 3019
+
+SCHEMA_MISMATCH = 3020
+
+MISSING_BASELINE = 3021
+
+INVALID_CHOICE = 3022
+
 """Wire Types.
 
 Wire Type Constants
@@ -22,15 +40,26 @@ Wire Type Constants
 VARINT = 0  #: int32, int64, uint32, uint64, sint32, sint64, bool, enum
 I64 = 1  #: fixed64, sfixed64, double
 LEN = 2  #: string, bytes, embedded messages, packed repeated fields
+I32 = 5  #: fixed32, sfixed32, float
 TYPE = 7  #: MESSAGE IDENTIFIER -> LEN: String
 
 """Wire Fields.
 
 Wire Field Constants
 """
+TYPE_ID = 1
 BOOL = 3
+ENUM = 4
 PACKED = 1
 INT32 = 1
 STR = 2
+MAP = 3
+STR_DEF = 4
+STR_REF = 5
 FIXED64 = 1
 SINT32 = 2
+UFIXED64 = 2
+SFIXED64 = 3
+FLOAT32 = 1
+FIXED32 = 2
+SFIXED32 = 3
@@ -2,20 +2,41 @@
 
 from __future__ import annotations
 
+from enum import Enum
+from typing import Any
+from typing import Optional
+from typing import Sequence
+from typing import Type
+from typing import Union
+
+from renity.decoder.exceptions import InvalidChoiceIndex
 from renity.validators.exceptions import IncorrectMessageType
+from renity.validators.exceptions import InvalidChoice
+from renity.validators.exceptions import RequiredMessageField
+from renity.validators.validators import FloatRangeValidator
+from renity.validators.validators import MapValidator
 from renity.validators.validators import MessageTypeValidator
 from renity.validators.validators import OverflowValidator
+from renity.validators.validators import RangeValidator
 from renity.validators.validators import SubFieldValidator
 
 from .constants import BOOL
+from .constants import ENUM
+from .constants import FIXED32
 from .constants import FIXED64
+from .constants import FLOAT32
+from .constants import I32
 from .constants import I64
 from .constants import INT32
 from .constants import LEN
+from .constants import MAP
 from .constants import PACKED
+from .constants import SFIXED32
+from .constants import SFIXED64
 from .constants import SINT32
 from .constants import STR
 from .constants import TYPE
+from .constants import UFIXED64
 from .constants import VARINT
 from .interface import Field
 
@@ -26,6 +47,13 @@ __all__ = (
     "StringField",
     "FloatField",
     "ListField",
+    "Float32Field",
+    "Fixed32Field",
+    "SFixed32Field",
+    "Fixed64IntField",
+    "SFixed64IntField",
+    "EnumField",
+    "MapField",
 )
 
 
@@ -61,13 +89,20 @@ class IntField(Field):
     def get_field_value(self):
         """Field Type From List.
 
+        Returns:
+            field(int): field type from list of options.
+        """
+        return self.wire_field(self.value)
+
+    def wire_field(self, value: Any) -> int:
+        """Wire Field Of Value(int32 | sint32).
+
         Returns:
             field(int): field type from list of options.
 
         Raises:
             IncorrectMessageType: Expected value of type <int>.
         """
-        value = self.value
         try:
             if not value or value >= 0:
                 field_type = 1
@@ -93,6 +128,65 @@ class BoolField(Field):
     data_type = bool
 
 
+class EnumField(Field):
+    """Enum Field.
+
+    Built-in Field used to de/serialize VARINT: index of choice.
+
+    * Encode through precomputed choice -> index dict.
+    * Decode through index -> choice tuple.
+
+    Args:
+        choices(Enum, Sequence): Enum subclass or sequence of choices.
+    """
+
+    wire = VARINT
+    field = ENUM
+    data_type = object
+
+    def __init__(
+        self, choices: Union[Type[Enum], Sequence[Any]] = (), **kwargs: Any
+    ):
+        self.choices = tuple(choices)
+        self.index = {choice: idx for idx, choice in enumerate(self.choices)}
+
+        if len(self.index) != len(self.choices):
+            raise ValueError(f"Duplicate choices found in {self.choices}.")
+
+        super().__init__(**kwargs)
+
+        if self.default is not None:
+            self.validate(self.default)
+
+    def decode(self, value: Any) -> Any:
+        """Choice from wire index.
+
+        Raises:
+            InvalidChoiceIndex: index out of choice table range.
+        """
+        if not 0 <= value < len(self.choices):
+            raise InvalidChoiceIndex(value, len(self.choices))
+        return self.choices[value]
+
+    def validate(self, value):
+        """Explicit Built-in Field Validation.
+
+        * Choice table membership check.
+        """
+        if value is None:
+            if self.required:
+                raise RequiredMessageField(self.key, self.__class__)
+            return True
+
+        try:
+            if value in self.index:
+                return True
+        except TypeError:
+            pass
+
+        raise InvalidChoice(value, self.choices)
+
+
 class ListField(Field):
     """List Field.
 
@@ -111,6 +205,44 @@ class ListField(Field):
     ]
 
 
+class MapField(Field):
+    """Map Field.
+
+    Built-in Field used to de/serialize LEN: Map(alternating packed keys & values).
+
+    Args:
+        key_field(Field): field of every key(primitive).
+        value_field(Field): field of every value(primitive).
+    """
+
+    wire = LEN
+    field = MAP
+    data_type = dict
+    validators = [MapValidator]
+
+    def __init__(
+        self,
+        key_field: Optional[Field] = None,
+        value_field: Optional[Field] = None,
+        **kwargs: Any,
+    ):
+        for sub in (key_field, value_field):
+            if sub is not None and sub.data_type in (list, dict):
+                raise TypeError(
+                    "TypeError: Expected primitive, cannot nest data structures in map."
+                )
+
+        self.key_field = key_field
+        self.value_field = value_field
+        super().__init__(**kwargs)
+
+    def decode(self, value: Any) -> Any:
+        """Convert decoded keys/values."""
+        key_decode = self.key_field.decode
+        value_decode = self.value_field.decode
+        return {key_decode(k): value_decode(v) for k, v in value.items()}
+
+
 class FloatField(Field):
     """Float Field.
 
@@ -122,6 +254,81 @@ class FloatField(Field):
     data_type = float
 
 
+class Float32Field(Field):
+    """Float32 Field.
+
+    Built-in Field used to de/serialize I32: Fixed 32-bit float.
+
+    * Precision is reduced to IEEE 754 binary32 on the wire.
+    * Finite values must fit binary32(inf/nan are encoded as is).
+    """
+
+    wire = I32
+    field = FLOAT32
+    data_type = float
+    minimum = -3.4028235e38
+    maximum = 3.4028235e38
+    validators = [FloatRangeValidator]
+
+
+class Fixed32Field(Field):
+    """Fixed32 Field.
+
+    Built-in Field used to de/serialize I32: Fixed 32-bit unsigned integer.
+
+    * Smaller than VARINT for large, evenly distributed values(hashes, ids).
+    """
+
+    wire = I32
+    field = FIXED32
+    data_type = int
+    minimum = 0
+    maximum = 2**32 - 1
+    validators = [RangeValidator]
+
+
+class SFixed32Field(Field):
+    """SFixed32 Field.
+
+    Built-in Field used to de/serialize I32: Fixed 32-bit signed integer.
+    """
+
+    wire = I32
+    field = SFIXED32
+    data_type = int
+    minimum = -(2**31)
+    maximum = 2**31 - 1
+    validators = [RangeValidator]
+
+
+class Fixed64IntField(Field):
+    """Fixed64 Int Field.
+
+    Built-in Field used to de/serialize I64: Fixed 64-bit unsigned integer.
+    """
+
+    wire = I64
+    field = UFIXED64
+    data_type = int
+    minimum = 0
+    maximum = 2**64 - 1
+    validators = [RangeValidator]
+
+
+class SFixed64IntField(Field):
+    """SFixed64 Int Field.
+
+    Built-in Field used to de/serialize I64: Fixed 64-bit signed integer.
+    """
+
+    wire = I64
+    field = SFIXED64
+    data_type = int
+    minimum = -(2**63)
+    maximum = 2**63 - 1
+    validators = [RangeValidator]
+
+
 class StringField(Field):
     """String Field.
 
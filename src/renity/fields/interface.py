@@ -5,7 +5,9 @@ Instances of this class are used to define a message's schema.
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any
+from typing import Optional
 from typing import Union
 
 from ..validators.exceptions import MissingPrimitiveException
@@ -13,6 +15,7 @@ from ..validators.interface import Validator
 from ..validators.validators import IncorrectFieldType
 from ..validators.validators import RequiredField
 from ..validators.validators import UnorderedValidator
+from ..validators.validators import compile_chain
 
 
 class FieldMeta(type):
@@ -94,10 +97,14 @@ class Field(metaclass=FieldMeta):
         sub_fields(list): list of subclass instances (for packed wire type).
 
         sorted(bool): default=True flag for ordered list of
-        subclasses **Warning: False(Experimental)**
+        subclasses, False matches values to sub_fields by type(see match).
+
+        default_record(str): pre-encoded default, set on <Message> sub-class
+        creation when defaults are elided.
     """
 
     data_type: Any = None
+    default_record: Optional[str] = None
     validators: list = []
     field: Union[int, tuple[int, int]] = 0
     __value: Any = None
@@ -114,8 +121,10 @@ class Field(metaclass=FieldMeta):
         cls.required = required
         cls.sorted = sorted
         cls.__initialize_sub_fields(sub_fields)
+        cls.__initialize_sub_index()
         cls._set_default_value(default)
         cls.__initialize_validator()
+        cls.__compile_validator()
 
     @property
     def value(self):
@@ -125,7 +134,7 @@ class Field(metaclass=FieldMeta):
     @value.setter
     def value(self, _val):
         sub_field_length = len(self.sub_fields)
-        if sub_field_length:
+        if sub_field_length and self.sorted:
             for idx in range(sub_field_length):
                 self.sub_fields[idx].value = _val[idx]
         self.__value = _val
@@ -152,8 +161,65 @@ class Field(metaclass=FieldMeta):
             )
         self.sub_fields = sub_fields
 
+    def __initialize_sub_index(self) -> None:
+        """Type Index of Unordered Sub-Fields.
+
+        * data_type: sub_fields(declaration order)
+
+        Raises:
+            TypeError: sub-field data_type cannot be matched by value type.
+        """
+        self.sub_index: dict = {}
+        if self.sorted:
+            return
+
+        for sub in self.sub_fields:
+            data_type = getattr(sub, "data_type", None)
+            if data_type is object or isinstance(data_type, tuple):
+                raise TypeError(
+                    f"TypeError: Unordered sub-field requires a single concrete data_type but found {sub}."
+                )
+            if data_type is not None:
+                self.sub_index.setdefault(data_type, []).append(sub)
+
+    def match(self, values: Union[list, tuple]) -> tuple:
+        """Match Unordered Values To Sub-Fields.
+
+        * O(n): value type(then its bases) -> next unused sub-field.
+
+        Args:
+            values(list): unordered packed values.
+
+        Returns:
+            (tuple): (sub-field, value) pairs in value order,
+                unexpected values, unmatched sub-fields.
+        """
+        pending = {
+            data_type: iter(subs) for data_type, subs in self.sub_index.items()
+        }
+        pairs = []
+        unexpected = []
+        used = set()
+
+        for value in values:
+            for data_type in type(value).__mro__:
+                subs = pending.get(data_type)
+                sub = next(subs, None) if subs is not None else None
+                if sub is not None:
+                    pairs.append((sub, value))
+                    used.add(id(sub))
+                    break
+            else:
+                unexpected.append(value)
+
+        missing = [sub for sub in self.sub_fields if id(sub) not in used]
+        return pairs, unexpected, missing
+
     def __initialize_validator(self) -> None:
         data = self.data_type
+        # Frozen maps(decode cache, see utils.freeze) validate as dict
+        if data is dict:
+            data = (dict, MappingProxyType)
         root = Validator(field=self, data_type=data)
         self.validator = root
         return self.__chain_validation()
@@ -184,15 +250,42 @@ class Field(metaclass=FieldMeta):
                     )
                 root.add(_validator_subclass)
 
+    def __compile_validator(self) -> None:
+        """Compiled Validation(see validators.compile_chain).
+
+        * Overridden validate(explicit built-in validation) is used as is.
+        """
+        if type(self).validate is Field.validate:
+            self.check = compile_chain(self)
+        else:
+            self.check = self.validate
+
+    def wire_field(self, value: Any) -> Any:
+        """Wire Field Of Value.
+
+        * Override for multi-type fields(wire field depends on value).
+        """
+        return self.field
+
+    def decode(self, value: Any) -> Any:
+        """Wire Value Conversion.
+
+        * Override to convert decoded wire value into field value.
+        * Traverse sub_fields(sorted/unordered packed list).
+        """
+        if self.sub_fields and isinstance(value, list):
+            if not self.sorted:
+                pairs, unexpected, _ = self.match(value)
+                return [sub.decode(item) for sub, item in pairs] + unexpected
+            return [
+                sub.decode(item) for sub, item in zip(self.sub_fields, value)
+            ]
+        return value
+
     def validate(self, value):
         """Field Validation.
 
         * Validate field
         * Traverse/validate sub_fields
         """
-        results = [self.validator.verify(value)]
-        if self.sorted:
-            for idx, sub in enumerate(self.sub_fields):
-                results.append(sub.validate(value[idx]))
-
-        return all(results)
+        return self.check(value)
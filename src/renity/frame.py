@@ -0,0 +1,110 @@
+"""Renity Frame.
+
+Byte level split/join of message identifier, frame header & body.
+
+    * Identifier: TLV(wire 7) + type_id(varint) | LEN: String
+    * Frame header: flags(varint) + flagged values(varint)
+      (present when identifier TLV has FRAME_FLAG set)
+    * Body: attributes + records
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+from typing import Tuple
+
+from .constants import FRAME_FLAG
+from .constants import FRAME_FLAGS
+from .constants import WIRE_MASK
+from .decoder.exceptions import InvalidMessage
+from .utils import pack_varints
+from .utils import unpack_varints
+
+
+# Flags followed by a value(varint), in header order
+VALUE_FLAGS = (
+    FRAME_FLAGS["snapshot"],
+    FRAME_FLAGS["delta"],
+    FRAME_FLAGS["batch"],
+)
+
+
+class Frame(NamedTuple):
+    """Split Frame.
+
+    Attributes:
+        identifier(bytes): identifier TLV + type(frame flag cleared).
+        flags(int): frame flags.
+        values(tuple): flagged values in header order.
+        body(bytes): attributes + records.
+    """
+
+    identifier: bytes
+    flags: int
+    values: Tuple[int, ...]
+    body: bytes
+
+
+def identifier_end(data: bytes) -> int:
+    """Byte Offset After Identifier.
+
+    Args:
+        data(bytes): encoded message.
+
+    Returns:
+        (int): offset of frame header/body.
+
+    Raises:
+        InvalidMessage: message does not begin with identifier.
+    """
+    tag = data[0]
+    if tag & WIRE_MASK != 7:
+        raise InvalidMessage(f"{tag:08b}")
+
+    # VARINT: type_id
+    if (tag >> 3) & 0b111 == 1:
+        _, pos = unpack_varints(data, 1, 1)
+        return pos
+
+    # LEN: Int32 TLV + Varint(length) + String
+    (length,), pos = unpack_varints(data, 2, 1)
+    return pos + length
+
+
+def split(data: bytes) -> Frame:
+    """Split Frame.
+
+    Args:
+        data(bytes): encoded message.
+
+    Returns:
+        (Frame): identifier, flags, values, body
+    """
+    pos = identifier_end(data)
+    identifier = bytes([data[0] & ~FRAME_FLAG]) + data[1:pos]
+
+    if not data[0] & FRAME_FLAG:
+        return Frame(identifier, 0, (), data[pos:])
+
+    (flags,), pos = unpack_varints(data, pos, 1)
+    count = sum(1 for flag in VALUE_FLAGS if flags & flag)
+    values, pos = unpack_varints(data, pos, count)
+
+    return Frame(identifier, flags, tuple(values), data[pos:])
+
+
+def join(frame: Frame) -> bytes:
+    """Join Frame.
+
+    Args:
+        frame(Frame): identifier, flags, values, body
+
+    Returns:
+        (bytes): encoded message.
+    """
+    if not frame.flags:
+        return frame.identifier + frame.body
+
+    header = pack_varints((frame.flags, *frame.values))
+    tag = bytes([frame.identifier[0] | FRAME_FLAG])
+    return tag + frame.identifier[1:] + bytes(header) + frame.body
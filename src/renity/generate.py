@@ -0,0 +1,176 @@
+"""Synthetic Message Generator.
+
+Random valid messages of a <Message> sub-class from its field schema:
+
+    * Field types, fixed-width ranges, enum choices.
+    * ListField sub-field layout(unordered lists are shuffled).
+    * Required fields always present, optional fields by presence.
+
+Streams are lazy(one message at a time) and reproducible by seed.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+import struct
+from typing import Any
+from typing import Iterator
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from .fields.constants import I32
+from .messages.message import Message
+
+
+# IntField(int32/sint32) limits
+INT32 = (-(2**31), 2**31 - 1)
+
+
+class Distribution(NamedTuple):
+    """Value Distributions.
+
+    Attributes:
+        string_length(tuple): min/max string length.
+        int_range(tuple): min/max ints(clipped to field range).
+        float_range(tuple): min/max floats(uniform).
+        map_size(tuple): min/max map items.
+        presence(float): probability an optional field is present.
+        alphabet(str): string characters.
+    """
+
+    string_length: Tuple[int, int] = (1, 16)
+    int_range: Tuple[int, int] = (-1000, 1000)
+    float_range: Tuple[float, float] = (-1000.0, 1000.0)
+    map_size: Tuple[int, int] = (0, 4)
+    presence: float = 0.5
+    alphabet: str = string.ascii_letters + string.digits
+
+
+class Generator:
+    """Synthetic Message Generator.
+
+    Args:
+        message_cls(Message): <Message> sub-class.
+        seed(Any): random seed(reproducible streams).
+        distribution(dict): Distribution overrides.
+
+    Example:
+        >>> from renity import Message, IntField
+        >>> class Point(Message):
+        ...     x = IntField(required=True)
+        >>> Generator(Point, seed=1, int_range=(0, 9)).message()
+        {'type': 'Point', 'x': 2}
+    """
+
+    # data_type: generator method
+    GENERATORS = {
+        dict: "_map",
+        bool: "_bool",
+        int: "_int",
+        float: "_float",
+        str: "_str",
+    }
+
+    def __init__(
+        self, message_cls: Type[Message], seed: Any = None, **distribution: Any
+    ) -> None:
+        self.message_cls = message_cls
+        self.random = random.Random(seed)
+        self.distribution = Distribution(**distribution)
+
+    def message(self) -> dict:
+        """Random Message Dict."""
+        rand = self.random
+        presence = self.distribution.presence
+        message = {"type": self.message_cls.__name__}
+
+        for key in self.message_cls._bits.values():
+            field = self.message_cls._fields[key]
+            if field.required or rand.random() < presence:
+                message[key] = self.value(field)
+
+        return message
+
+    def value(self, field: Any) -> Any:
+        """Random Value of Field.
+
+        Raises:
+            TypeError: unsupported field data_type.
+        """
+        rand = self.random
+
+        if hasattr(field, "choices"):
+            return rand.choice(field.choices)
+
+        if field.sub_fields:
+            values = [self.value(sub) for sub in field.sub_fields]
+            if not field.sorted:
+                rand.shuffle(values)
+            return values
+
+        data_type = field.data_type
+        generator = self.GENERATORS.get(data_type)
+        if generator is None:
+            raise TypeError(
+                f"Cannot generate value of {data_type} for {field}."
+            )
+        return getattr(self, generator)(field)
+
+    def _map(self, field: Any) -> dict:
+        """Random Map(key_field: value_field)."""
+        low, high = self.distribution.map_size
+        items = {}
+        for _ in range(self.random.randint(low, high)):
+            items[self.value(field.key_field)] = self.value(field.value_field)
+        return items
+
+    def _bool(self, field: Any) -> bool:
+        """Random Bool."""
+        return self.random.random() < 0.5
+
+    def _int(self, field: Any) -> int:
+        """Random Int(within field range)."""
+        low, high = self.distribution.int_range
+        field_low, field_high = (
+            getattr(field, "minimum", INT32[0]),
+            getattr(field, "maximum", INT32[1]),
+        )
+        low, high = max(low, field_low), min(high, field_high)
+        if low > high:
+            low, high = field_low, field_high
+        return self.random.randint(low, high)
+
+    def _float(self, field: Any) -> float:
+        """Random Float."""
+        value = self.random.uniform(*self.distribution.float_range)
+        # 32bit float fields round-trip exactly
+        if field.wire == I32:
+            value = struct.unpack("<f", struct.pack("<f", value))[0]
+        return value
+
+    def _str(self, field: Any) -> str:
+        """Random String."""
+        rand = self.random
+        dist = self.distribution
+        length = rand.randint(*dist.string_length)
+        return "".join(rand.choice(dist.alphabet) for _ in range(length))
+
+    def dicts(self, count: Optional[int] = None) -> Iterator[dict]:
+        """Lazy Message Dicts(infinite when count is None)."""
+        produced = 0
+        while count is None or produced < count:
+            yield self.message()
+            produced += 1
+
+    def encoded(self, count: Optional[int] = None) -> Iterator[bytes]:
+        """Lazy Encoded Messages(infinite when count is None)."""
+        message_cls = self.message_cls
+        for message in self.dicts(count):
+            yield bytes(message_cls(message))
+
+    def __iter__(self) -> Iterator[dict]:
+        """Infinite Message Dicts."""
+        return self.dicts()
@@ -0,0 +1,362 @@
+"""Renity Message Inspector.
+
+Byte level breakdown of encoded messages:
+
+    * Rows: identifier(type), frame header, attributes & one row per record
+      with byte offset, encoded size, wire type, wire field & encoding.
+    * Compressed, fixed-layout & batch bodies are a single opaque row.
+    * Summary: bytes per field(count, average, share of total) and the
+      share taken by the type header(identifier + frame header).
+
+Usage:
+    inspect(bytes(message))
+    summary = Summary()
+    for inspection in inspect_file(file):
+        summary.add(inspection)
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from typing import BinaryIO
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+from bitstring import BitStream
+
+from . import stream
+from .constants import FRAME_FLAG
+from .constants import FRAME_FLAGS
+from .constants import WIRE_MASK
+from .decoder import decoder
+from .fields import constants as wire
+from .frame import identifier_end
+from .frame import split
+from .messages.registry import Registry
+from .utils import unpack_varints
+
+
+WIRE_NAMES = {
+    wire.VARINT: "VARINT",
+    wire.I64: "I64",
+    wire.LEN: "LEN",
+    wire.I32: "I32",
+    wire.TYPE: "TYPE",
+}
+
+# (wire type, wire field): encoding
+ENCODINGS = {
+    (wire.TYPE, wire.TYPE_ID): "type_id",
+    (wire.TYPE, wire.STR): "name",
+    (wire.VARINT, wire.INT32): "int32",
+    (wire.VARINT, wire.SINT32): "sint32",
+    (wire.VARINT, wire.BOOL): "bool",
+    (wire.VARINT, wire.ENUM): "enum",
+    (wire.VARINT, wire.STR_REF): "string_ref",
+    (wire.I64, wire.FIXED64): "double",
+    (wire.I64, wire.UFIXED64): "fixed64",
+    (wire.I64, wire.SFIXED64): "sfixed64",
+    (wire.LEN, wire.PACKED): "packed",
+    (wire.LEN, wire.STR): "string",
+    (wire.LEN, wire.MAP): "map",
+    (wire.LEN, wire.STR_DEF): "string_def",
+    (wire.I32, wire.FLOAT32): "float",
+    (wire.I32, wire.FIXED32): "fixed32",
+    (wire.I32, wire.SFIXED32): "sfixed32",
+}
+
+# Frame flags with an opaque(tagless) body, in precedence order
+OPAQUE_BODIES = (
+    ("compressed", FRAME_FLAGS["compressed"]),
+    ("fixed-layout", FRAME_FLAGS["fixed"]),
+    ("batch", FRAME_FLAGS["batch"]),
+)
+
+# Rows counted as type header(see Summary)
+HEADER_ROWS = ("type", "frame")
+
+
+class Row(NamedTuple):
+    """Inspected Byte Range.
+
+    Attributes:
+        offset(int): byte offset.
+        size(int): encoded size(bytes).
+        key(str): field key, or type | frame | attributes | body.
+        bit(int): attribute bit(None for non-record rows).
+        wire(str): wire type name(None for untagged rows).
+        field(int): wire field(None for untagged rows).
+        encoding(str): wire type + field encoding.
+        value(Any): decoded value.
+    """
+
+    offset: int
+    size: int
+    key: str
+    bit: Optional[int] = None
+    wire: Optional[str] = None
+    field: Optional[int] = None
+    encoding: Optional[str] = None
+    value: Any = None
+
+
+class Inspection(NamedTuple):
+    """Inspected Message.
+
+    Attributes:
+        type(str): message type name(or "#<type_id>" when unregistered).
+        type_id(int): registry type_id(None for named messages).
+        size(int): encoded size(bytes).
+        rows(list): Row per byte range, in offset order.
+    """
+
+    type: str
+    type_id: Optional[int]
+    size: int
+    rows: List[Row]
+
+    @property
+    def header_size(self) -> int:
+        """Type Header Size(identifier + frame header)."""
+        return sum(row.size for row in self.rows if row.key in HEADER_ROWS)
+
+
+def identifier(data: bytes) -> Row:
+    """Identifier Row."""
+    tag = data[0]
+    field = (tag >> 3) & 0b111
+    end = identifier_end(data)
+
+    if field == wire.TYPE_ID:
+        (type_id,), _ = unpack_varints(data, 1, 1)
+        value: Any = type_id
+    else:
+        (length,), pos = unpack_varints(data, 2, 1)
+        value = data[pos : pos + length].decode("utf-8")
+
+    return Row(
+        0,
+        end,
+        "type",
+        wire=WIRE_NAMES[tag & WIRE_MASK],
+        field=field,
+        encoding=ENCODINGS[(wire.TYPE, field)],
+        value=value,
+    )
+
+
+def records(data: bytes, pos: int) -> Iterator[tuple]:
+    """Walk Records.
+
+    * Decodes with the decoder module(same wire functions as Message).
+
+    Args:
+        data(bytes): encoded message.
+        pos(int): byte offset of first record.
+
+    Yields:
+        (tuple): offset, size, tag, value
+    """
+    state = decoder.state
+    state.bits = BitStream(bytes=data)
+    state.bits.pos = pos * 8
+    state.length = len(state.bits) - 1
+
+    next_wire = decoder.advance()
+    while next_wire:
+        start = state.bits.pos // 8
+        value, next_wire = next_wire()
+        yield start, state.bits.pos // 8 - start, data[start], value
+
+
+def inspect(
+    data: bytes, classes: Optional[Dict[str, Any]] = None
+) -> Inspection:
+    """Inspect Encoded Message.
+
+    Args:
+        data(bytes): encoded message.
+        classes(dict): name: <Message> sub-class(field keys of named
+            messages; registered type_ids are resolved by Registry).
+
+    Returns:
+        (Inspection): type, size & rows.
+
+    Raises:
+        InvalidMessage: message does not begin with identifier.
+    """
+    data = bytes(data)
+    head = identifier(data)
+    rows = [head]
+
+    # Get Message Class(field keys) & type name
+    type_id = None
+    if head.field == wire.TYPE_ID:
+        type_id = head.value
+        message_cls = Registry.messages.get(type_id)
+        name = Registry.names.get(type_id, f"#{type_id}")
+    else:
+        name = head.value
+        message_cls = (classes or {}).get(name)
+    keys = getattr(message_cls, "_bits", {})
+
+    pos = head.size
+    flags = 0
+    if data[0] & FRAME_FLAG:
+        frame = split(data)
+        flags = frame.flags
+        end = len(data) - len(frame.body)
+        rows.append(
+            Row(
+                pos,
+                end - pos,
+                "frame",
+                encoding="flags",
+                value={"flags": flags, "values": list(frame.values)},
+            )
+        )
+        pos = end
+
+    for encoding, flag in OPAQUE_BODIES:
+        if flags & flag:
+            rows.append(Row(pos, len(data) - pos, "body", encoding=encoding))
+            return Inspection(name, type_id, len(data), rows)
+
+    if pos == len(data):
+        return Inspection(name, type_id, len(data), rows)
+
+    # Attribute bits in record order(ascending)
+    attributes = data[pos]
+    bits = [1 << idx for idx in range(8) if attributes & (1 << idx)]
+    rows.append(
+        Row(pos, 1, "attributes", encoding="bitmap", value=f"{attributes:08b}")
+    )
+
+    for idx, (offset, size, tag, value) in enumerate(records(data, pos + 1)):
+        bit = bits[idx] if idx < len(bits) else None
+        wire_type, field = tag & WIRE_MASK, (tag >> 3) & 0b1111
+        rows.append(
+            Row(
+                offset,
+                size,
+                keys.get(bit, f"bit:{bit}"),
+                bit,
+                WIRE_NAMES.get(wire_type, str(wire_type)),
+                field,
+                ENCODINGS.get((wire_type, field)),
+                value,
+            )
+        )
+
+    return Inspection(name, type_id, len(data), rows)
+
+
+def inspect_file(
+    file: BinaryIO,
+    classes: Optional[Dict[str, Any]] = None,
+    framed: Optional[bool] = None,
+) -> Iterator[Inspection]:
+    """Inspect Messages Of File(one message in memory at a time).
+
+    Args:
+        file(BinaryIO): binary file.
+        classes(dict): name: <Message> sub-class(see inspect).
+        framed(bool): length-prefixed frames(see stream.py) or a single
+            message; None detects from the first byte(identifier tags
+            have wire type 7, frame lengths below 112 MiB do not).
+
+    Yields:
+        (Inspection): inspected message.
+    """
+    if framed is None:
+        first = file.read(1)
+        if not first:
+            return
+        framed = first[0] & WIRE_MASK != wire.TYPE
+        file = _Prefixed(first, file)
+
+    if not framed:
+        yield inspect(file.read(), classes)
+        return
+
+    for data in stream.frames(file):
+        yield inspect(data, classes)
+
+
+class _Prefixed:
+    """Read-Ahead Bytes Followed By File."""
+
+    def __init__(self, data: bytes, file: BinaryIO) -> None:
+        self.data = data
+        self.file = file
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            chunk, self.data = self.data + self.file.read(), b""
+            return chunk
+        chunk, self.data = self.data[:size], self.data[size:]
+        if len(chunk) < size:
+            chunk += self.file.read(size - len(chunk))
+        return chunk
+
+
+class Summary:
+    """Aggregate Statistics Of Inspected Messages.
+
+    Attributes:
+        messages(int): inspected messages.
+        size(int): total bytes.
+        header(int): type header bytes(identifier + frame header).
+        fields(dict): (type, key): [count, bytes]
+    """
+
+    def __init__(self) -> None:
+        self.messages = 0
+        self.size = 0
+        self.header = 0
+        self.fields: Dict[tuple, list] = {}
+
+    def add(self, inspection: Inspection) -> None:
+        """Count Inspected Message."""
+        self.messages += 1
+        self.size += inspection.size
+        self.header += inspection.header_size
+
+        for row in inspection.rows:
+            counts = self.fields.get((inspection.type, row.key))
+            if counts is None:
+                counts = self.fields[(inspection.type, row.key)] = [0, 0]
+            counts[0] += 1
+            counts[1] += row.size
+
+    def as_dict(self) -> dict:
+        """Snapshot.
+
+        Returns:
+            (dict): totals, header share & per field count, bytes,
+                average bytes & share of total bytes(largest first).
+        """
+        size = self.size or 1
+        return {
+            "messages": self.messages,
+            "bytes": self.size,
+            "avg_bytes": round(self.size / (self.messages or 1), 2),
+            "header_bytes": self.header,
+            "header_share": round(self.header / size, 4),
+            "fields": [
+                {
+                    "type": _type,
+                    "key": key,
+                    "count": count,
+                    "bytes": total,
+                    "avg_bytes": round(total / count, 2),
+                    "share": round(total / size, 4),
+                }
+                for (_type, key), (count, total) in sorted(
+                    self.fields.items(), key=lambda item: -item[1][1]
+                )
+            ],
+        }
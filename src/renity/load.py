@@ -0,0 +1,277 @@
+"""Loopback Load Harness.
+
+Round-trip latency under concurrency:
+
+    * Echo server(asyncio | thread) decodes & re-encodes every message.
+    * N client threads send length-prefixed messages(see stream.py)
+      at a target rate each, and time the echoed reply from its scheduled
+      send time(no coordinated omission when clients fall behind).
+    * Report: p50/p99/p999 latency, throughput & process CPU per message.
+
+Encode/decode is re-entrant(per-call serializer state, per-thread decoder
+state), server & client threads share no codec lock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import socketserver
+import threading
+import time
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from . import stream
+from .messages.message import Message
+
+
+HOST = "127.0.0.1"
+
+
+def echo(message_cls: Type[Message], data: bytes) -> bytes:
+    """Decode & Re-Encode Frame."""
+    return stream.pack(bytes(message_cls(data)))
+
+
+class ThreadingServer(socketserver.ThreadingTCPServer):
+    """Threading TCP Server(connection threads do not block exit)."""
+
+    daemon_threads = True
+
+
+class ThreadEchoServer:
+    """Thread-Per-Connection Echo Server.
+
+    Args:
+        message_cls(Message): <Message> sub-class of echoed messages.
+    """
+
+    def __init__(self, message_cls: Type[Message]) -> None:
+        self.message_cls = message_cls
+        self.server: Optional[ThreadingServer] = None
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> Tuple[str, int]:
+        """Start Server.
+
+        Returns:
+            (tuple): host, port
+        """
+        m_cls = self.message_cls
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                sock = self.request
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                while True:
+                    data = stream.recv(sock)
+                    if data is None:
+                        return
+                    sock.sendall(echo(m_cls, data))
+
+        self.server = ThreadingServer((HOST, 0), Handler)
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+        self.thread.start()
+        return self.server.server_address[:2]
+
+    def stop(self) -> None:
+        """Stop Server."""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+class AsyncEchoServer:
+    """Asyncio Echo Server(event loop in background thread).
+
+    Args:
+        message_cls(Message): <Message> sub-class of echoed messages.
+    """
+
+    def __init__(self, message_cls: Type[Message]) -> None:
+        self.message_cls = message_cls
+        self.loop = asyncio.new_event_loop()
+        self.server: Any = None
+        self.thread: Optional[threading.Thread] = None
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Echo Connection."""
+        m_cls = self.message_cls
+        while True:
+            data = await stream.read(reader)
+            if data is None:
+                break
+            writer.write(echo(m_cls, data))
+            await writer.drain()
+        writer.close()
+
+    def start(self) -> Tuple[str, int]:
+        """Start Server.
+
+        Returns:
+            (tuple): host, port
+        """
+        self.server = self.loop.run_until_complete(
+            asyncio.start_server(self.handle, HOST, 0)
+        )
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, daemon=True
+        )
+        self.thread.start()
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def shutdown(self) -> None:
+        """Close Server & Finish Connection Handlers."""
+        self.server.close()
+        tasks = [
+            task
+            for task in asyncio.all_tasks()
+            if task is not asyncio.current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self) -> None:
+        """Stop Server."""
+        asyncio.run_coroutine_threadsafe(self.shutdown(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if self.thread is not None:
+            self.thread.join()
+        self.loop.close()
+
+
+SERVERS = {"asyncio": AsyncEchoServer, "thread": ThreadEchoServer}
+
+
+def percentile(values: List[int], q: float) -> int:
+    """Nearest-Rank Percentile of sorted values."""
+    if not values:
+        return 0
+    rank = max(0, min(len(values) - 1, int(q * len(values) + 0.5) - 1))
+    return values[rank]
+
+
+def client(
+    address: Tuple[str, int],
+    message_cls: Type[Message],
+    message: Any,
+    rate: float,
+    deadline: float,
+    latencies: List[int],
+    errors: List[BaseException],
+) -> None:
+    """Send Messages At Rate Until Deadline.
+
+    Args:
+        address(tuple): server host, port.
+        message_cls(Message): <Message> sub-class.
+        message(dict): message sent(encoded per send).
+        rate(float): messages/second(0 = unthrottled).
+        deadline(float): perf_counter stop time.
+        latencies(list): round-trip ns(appended).
+        errors(list): raised exceptions(appended).
+    """
+    interval = 1 / rate if rate else 0.0
+    try:
+        with socket.create_connection(address) as sock:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            next_send = time.perf_counter()
+            while next_send < deadline and time.perf_counter() < deadline:
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+                sock.sendall(stream.pack(bytes(message_cls(message))))
+                reply = stream.recv(sock)
+                if reply is None:
+                    raise ConnectionError("Server closed connection.")
+                message_cls(reply)
+                latencies.append(int((time.perf_counter() - next_send) * 1e9))
+
+                next_send = (
+                    next_send + interval if interval else time.perf_counter()
+                )
+    except Exception as e:
+        errors.append(e)
+
+
+def run(
+    message_cls: Type[Message],
+    message: Any,
+    server: str = "asyncio",
+    clients: int = 4,
+    rate: float = 100.0,
+    duration: float = 2.0,
+) -> dict:
+    """Run Load Test.
+
+    Args:
+        message_cls(Message): <Message> sub-class.
+        message(dict): message sent by clients.
+        server(str): asyncio | thread.
+        clients(int): concurrent clients.
+        rate(float): messages/second per client(0 = unthrottled).
+        duration(float): seconds.
+
+    Returns:
+        (dict): latency percentiles(us), throughput & CPU per message.
+    """
+    echo_server = SERVERS[server](message_cls)
+    address = echo_server.start()
+
+    latencies: List[int] = []
+    errors: List[BaseException] = []
+    cpu = time.process_time()
+    start = time.perf_counter()
+    deadline = start + duration
+
+    threads = [
+        threading.Thread(
+            target=client,
+            args=(
+                address,
+                message_cls,
+                message,
+                rate,
+                deadline,
+                latencies,
+                errors,
+            ),
+        )
+        for _ in range(clients)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        elapsed = time.perf_counter() - start
+        cpu = time.process_time() - cpu
+        echo_server.stop()
+
+    latencies.sort()
+    count = len(latencies)
+    return {
+        "schema": message_cls.__name__,
+        "server": server,
+        "clients": clients,
+        "rate": rate,
+        "duration": round(elapsed, 3),
+        "messages": count,
+        "errors": [repr(error) for error in errors],
+        "throughput": round(count / elapsed, 1) if elapsed else 0.0,
+        "p50_us": percentile(latencies, 0.5) / 1000,
+        "p99_us": percentile(latencies, 0.99) / 1000,
+        "p999_us": percentile(latencies, 0.999) / 1000,
+        "cpu_us_per_message": round(cpu * 1e6 / count, 1) if count else 0.0,
+    }
@@ -0,0 +1,314 @@
+"""Columnar Batch Messages.
+
+Many messages of one <Message> sub-class in a single frame:
+
+    * Header: identifier(framed, see constants.FRAME_FLAGS) + row count.
+    * Column per field(bit order):
+        - presence: ABSENT | PRESENT | BITMAP + ceil(rows/8) bytes.
+        - values of present rows:
+            varint/bool/enum: packed varints(ints zigzag encoded).
+            fixed-width: raw little-endian block.
+            string: packed varint lengths + one utf-8 data blob.
+            list/map: packed varint lengths + blob of tagged records.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Any
+from typing import Iterable
+from typing import Tuple
+from typing import Type
+
+from ..constants import FRAME_FLAGS
+from ..decoder import decoder as MessageDecoder
+from ..decoder.exceptions import UnsupportedFrame
+from ..encoder.encoder import Encoder
+from ..fields.constants import I32
+from ..fields.constants import I64
+from ..fields.constants import VARINT
+from ..utils import bits_to_bytes
+from ..utils import pack_varints
+from ..utils import unpack_varints
+from ..utils import unzigzag
+from ..utils import zigzag
+from ..validators.exceptions import RequiredMessageField
+from .message import Message
+
+
+# Presence Modes
+ABSENT = 0
+PRESENT = 1
+BITMAP = 2
+
+# [wire type, wire field]: little-endian struct format
+FIXED_FORMATS = {
+    (I64, 1): "d",
+    (I64, 2): "Q",
+    (I64, 3): "q",
+    (I32, 1): "f",
+    (I32, 2): "I",
+    (I32, 3): "i",
+}
+
+
+def column_kind(field: Any) -> str:
+    """Column Encoding of Field.
+
+    Returns:
+        (str): sint, bool, enum, fixed format, string or record.
+    """
+    wire = field.wire
+    if wire == VARINT:
+        if hasattr(field, "index"):
+            return "enum"
+        return "bool" if field.data_type is bool else "sint"
+    if wire in (I64, I32):
+        return FIXED_FORMATS[(wire, field.field)]
+    if field.data_type is str:
+        return "string"
+    return "record"
+
+
+def header(message_cls: Type[Message], rows: int) -> bytes:
+    """Batch Header.
+
+    Args:
+        message_cls(Message): <Message> sub-class of rows.
+        rows(int): row count.
+
+    Returns:
+        (bytes): framed identifier + row count.
+    """
+    identifier = Encoder.record(
+        message_cls.__name__, message_cls._fields["type"]
+    )
+    _bits = (
+        "11"
+        + identifier[2:]
+        + Encoder.varint(FRAME_FLAGS["batch"])
+        + Encoder.varint(rows)
+    )
+    return bits_to_bytes(_bits)
+
+
+def encode(message_cls: Type[Message], messages: Iterable[Any]) -> bytes:
+    """Encode Batch.
+
+    Args:
+        message_cls(Message): <Message> sub-class of rows.
+        messages(Iterable): <Message> instances(validated) or dicts.
+
+    Returns:
+        (bytes): columnar batch frame.
+
+    Raises:
+        TypeError: row of a different <Message> sub-class.
+        RequiredMessageField: dict row missing a required field.
+    """
+    name = message_cls.__name__
+    _fields = message_cls._fields
+    keys = list(message_cls._bits.values())
+    columns: dict = {key: [] for key in keys}
+
+    for message in messages:
+        if isinstance(message, Message):
+            if not isinstance(message, message_cls):
+                raise TypeError(
+                    f"Expected Message type: {name} but found {message}"
+                )
+            for key, column in columns.items():
+                column.append(getattr(message, key))
+            continue
+
+        if message.get("type", name) != name:
+            raise TypeError(
+                f"Expected Message type: {name} but found {message}"
+            )
+
+        # Validate dict row once per value(absent: required check first)
+        for key, column in columns.items():
+            field = _fields[key]
+            value = message.get(key)
+            if value is None:
+                if field.required:
+                    raise RequiredMessageField(key, field.__class__)
+                value = field.default
+            else:
+                field.validate(value)
+            column.append(value)
+
+    rows = len(columns[keys[0]]) if keys else 0
+    out = bytearray(header(message_cls, rows))
+
+    for key in keys:
+        write_column(out, _fields[key], columns[key])
+
+    return bytes(out)
+
+
+def write_column(out: bytearray, field: Any, column: list) -> None:
+    """Append Column.
+
+    Args:
+        out(bytearray): buffer.
+        field(Field): field of column.
+        column(list): value per row(None = absent).
+    """
+    present = [value for value in column if value is not None]
+
+    if not present:
+        out.append(ABSENT)
+        return
+
+    if len(present) == len(column):
+        out.append(PRESENT)
+    else:
+        out.append(BITMAP)
+        bitmap = bytearray((len(column) + 7) // 8)
+        for idx, value in enumerate(column):
+            if value is not None:
+                bitmap[idx >> 3] |= 1 << (idx & 7)
+        out += bitmap
+
+    kind = column_kind(field)
+
+    if kind == "sint":
+        pack_varints(map(zigzag, present), out)
+    elif kind == "bool":
+        pack_varints(map(int, present), out)
+    elif kind == "enum":
+        pack_varints(map(field.index.__getitem__, present), out)
+    elif kind in ("string", "record"):
+        if kind == "string":
+            blobs = [value.encode("utf-8") for value in present]
+        else:
+            blobs = [
+                bits_to_bytes(Encoder.record(value, field)) for value in present
+            ]
+        pack_varints(map(len, blobs), out)
+        out += b"".join(blobs)
+    else:
+        out += struct.pack(f"<{len(present)}{kind}", *present)
+
+
+def columns(message_cls: Type[Message], data: bytes) -> Tuple[int, dict]:
+    """Decode Batch Columns.
+
+    * Absent values restored from field default.
+
+    Args:
+        message_cls(Message): <Message> sub-class of rows.
+        data(bytes): columnar batch frame.
+
+    Returns:
+        (tuple): rows(int), key: column(list)
+
+    Raises:
+        UnsupportedFrame: data is not a batch frame.
+        TypeError: batch of a different <Message> sub-class.
+    """
+    pos = MessageDecoder.identify(data)
+    decoded = MessageDecoder.state.decoded_value
+
+    if "rows" not in decoded:
+        raise UnsupportedFrame("Non-batch", message_cls.__name__)
+
+    if decoded["type"] != message_cls.__name__:
+        raise TypeError(
+            f"Expected Message type: {message_cls.__name__} but found {decoded['type']}"
+        )
+
+    rows = decoded["rows"]
+    result = {}
+
+    for key in message_cls._bits.values():
+        result[key], pos = read_column(
+            data, pos, message_cls._fields[key], rows
+        )
+
+    return rows, result
+
+
+def read_column(
+    data: bytes, pos: int, field: Any, rows: int
+) -> Tuple[list, int]:
+    """Read Column.
+
+    Args:
+        data(bytes): batch frame.
+        pos(int): byte offset of column.
+        field(Field): field of column.
+        rows(int): row count.
+
+    Returns:
+        (tuple): column(list), byte offset after column.
+    """
+    mode = data[pos]
+    pos += 1
+    default = field.default
+
+    if mode == ABSENT:
+        return [default] * rows, pos
+
+    bitmap = b""
+    count = rows
+    if mode == BITMAP:
+        size = (rows + 7) // 8
+        bitmap = data[pos : pos + size]
+        pos += size
+        count = sum(bin(byte).count("1") for byte in bitmap)
+
+    kind = column_kind(field)
+
+    if kind in ("sint", "bool", "enum"):
+        values, pos = unpack_varints(data, pos, count)
+        if kind == "sint":
+            values = [unzigzag(value) for value in values]
+        elif kind == "bool":
+            values = [bool(value) for value in values]
+        else:
+            values = [field.decode(value) for value in values]
+    elif kind in ("string", "record"):
+        lengths, pos = unpack_varints(data, pos, count)
+        values = []
+        for _length in lengths:
+            blob = data[pos : pos + _length]
+            pos += _length
+            if kind == "string":
+                values.append(blob.decode("utf-8"))
+            else:
+                values.append(field.decode(MessageDecoder.record(blob)))
+    else:
+        fmt = f"<{count}{kind}"
+        values = list(struct.unpack_from(fmt, data, pos))
+        pos += struct.calcsize(fmt)
+
+    if mode == PRESENT:
+        return values, pos
+
+    # Scatter present values into rows
+    _values = iter(values)
+    column = [
+        next(_values) if bitmap[idx >> 3] >> (idx & 7) & 1 else default
+        for idx in range(rows)
+    ]
+    return column, pos
+
+
+def decode(message_cls: Type[Message], data: bytes) -> list:
+    """Decode Batch Rows.
+
+    Args:
+        message_cls(Message): <Message> sub-class of rows.
+        data(bytes): columnar batch frame.
+
+    Returns:
+        (list): message dict per row.
+    """
+    rows, _columns = columns(message_cls, data)
+    keys = ("type", *_columns)
+    types = [message_cls.__name__] * rows
+    return [
+        dict(zip(keys, values)) for values in zip(types, *_columns.values())
+    ]
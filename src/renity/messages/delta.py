@@ -0,0 +1,166 @@
+"""Delta Messages.
+
+Encode only fields that changed since a baseline snapshot of the same
+<Message> sub-class, with periodic full keyframes.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+from typing import Optional
+from typing import Type
+
+from ..constants import FRAME_FLAGS
+from ..decoder import decoder as MessageDecoder
+from ..encoder.encoder import Encoder
+from .exceptions import MissingBaseline
+from .message import Message
+
+
+# Sequence numbers wrap to stay within a 2-byte varint
+SEQUENCE_SPAN = 2**14
+
+
+class DeltaEncoder:
+    """Delta Message Encoder.
+
+    * One instance per connection and <Message> sub-class.
+
+    Args:
+        message_cls(Message): <Message> sub-class to encode.
+
+        keyframe_interval(int): frames between full keyframes.
+
+        history(int): max baselines kept.
+    """
+
+    def __init__(
+        self,
+        message_cls: Type[Message],
+        keyframe_interval: int = 30,
+        history: int = 32,
+    ) -> None:
+        self.message_cls = message_cls
+        self.keyframe_interval = keyframe_interval
+        self.history_size = history
+        self.history: OrderedDict = OrderedDict()
+        self.sequence = 0
+        self.last: Optional[int] = None
+        self.frames = 0
+
+    def encode(self, message: Any, baseline: Optional[int] = None) -> bytes:
+        """Encode Delta/Keyframe.
+
+        Args:
+            message(Message, dict): message of message_cls.
+            baseline(int): sequence acknowledged by receiver(default last sent).
+
+        Returns:
+            (bytes): encoded frame.
+        """
+        if not isinstance(message, self.message_cls):
+            message = self.message_cls(message)
+
+        sequence = self.sequence
+        self.sequence = (sequence + 1) % SEQUENCE_SPAN
+
+        if baseline is None:
+            baseline = self.last
+
+        current = message.message
+        base = self.history.get(baseline)
+        changed = None
+
+        if base is not None and self.frames < self.keyframe_interval:
+            changed = {key for key in current if current[key] != base[key]}
+
+            # Removed value can only be sent in keyframe
+            if any(current[key] is None for key in changed):
+                changed = None
+
+        if changed is None:
+            # Keyframe
+            self.frames = 0
+            header = Encoder.varint(FRAME_FLAGS["snapshot"]) + Encoder.varint(
+                sequence
+            )
+            data = Encoder.encode(message._quartets(), header=header)
+        else:
+            self.frames += 1
+            flags = FRAME_FLAGS["snapshot"] | FRAME_FLAGS["delta"]
+            header = (
+                Encoder.varint(flags)
+                + Encoder.varint(sequence)
+                + Encoder.varint(baseline)
+            )
+            data = Encoder.encode(
+                message._quartets(changed), header=header, elide=False
+            )
+
+        self.remember(sequence, current)
+        return data
+
+    def remember(self, sequence: int, snapshot: dict) -> None:
+        """Store Bounded Baseline History."""
+        self.history[sequence] = snapshot
+        self.history.move_to_end(sequence)
+        self.last = sequence
+
+        while len(self.history) > self.history_size:
+            self.history.popitem(last=False)
+
+
+class DeltaDecoder:
+    """Delta Message Decoder.
+
+    * Counterpart of DeltaEncoder(one per connection).
+
+    Args:
+        message_cls(Message): <Message> sub-class to decode.
+
+        history(int): max baselines kept.
+    """
+
+    def __init__(self, message_cls: Type[Message], history: int = 32) -> None:
+        self.message_cls = message_cls
+        self.history_size = history
+        self.history: OrderedDict = OrderedDict()
+
+    def decode(self, data: bytes) -> Message:
+        """Decode Delta/Keyframe.
+
+        Args:
+            data(bytes): encoded frame.
+
+        Returns:
+            (Message): reconstructed full message.
+
+        Raises:
+            MissingBaseline: delta baseline is not in history.
+        """
+        m_cls = self.message_cls
+        decoded = MessageDecoder.decode(data)
+
+        message = {}
+        baseline = decoded.get("baseline")
+
+        if baseline is not None:
+            base = self.history.get(baseline)
+            if base is None:
+                raise MissingBaseline(baseline)
+            message.update(base)
+
+        # Changed fields
+        message.update(m_cls._keyed(decoded))
+
+        instance = m_cls(message)
+
+        sequence = decoded.get("sequence")
+        if sequence is not None:
+            self.history[sequence] = instance.message
+            self.history.move_to_end(sequence)
+            while len(self.history) > self.history_size:
+                self.history.popitem(last=False)
+
+        return instance
@@ -0,0 +1,40 @@
+"""Message Module Exceptions."""
+
+from ..fields.constants import MISSING_BASELINE
+from ..fields.constants import SCHEMA_MISMATCH
+from ..fields.constants import TYPE_ID_COLLISION
+
+
+class TypeIdCollision(Exception):
+    """Message Exception."""
+
+    def __init__(self, type_id: int, current: str, name: str):
+        _message = (
+            f"TypeIdCollision: type_id {type_id} of {name} is registered to {current}, "
+            + "set an explicit type_id."
+        )
+        super().__init__(_message)
+        self.code = TYPE_ID_COLLISION
+        self.message = _message
+
+
+class SchemaMismatch(Exception):
+    """Message Exception."""
+
+    def __init__(self, name: str, type_id: int):
+        _message = f"SchemaMismatch: fingerprint of {name}(type_id {type_id}) does not match."
+        super().__init__(_message)
+        self.code = SCHEMA_MISMATCH
+        self.message = _message
+
+
+class MissingBaseline(Exception):
+    """Message Exception."""
+
+    def __init__(self, baseline: int):
+        _message = (
+            f"MissingBaseline: delta baseline {baseline} is not in history."
+        )
+        super().__init__(_message)
+        self.code = MISSING_BASELINE
+        self.message = _message
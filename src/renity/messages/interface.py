@@ -1,7 +1,135 @@
 """Message Interface Meta Module."""
 
+from renity.encoder.encoder import Encoder
+from renity.fields.constants import TYPE_ID
 from renity.fields.fields import TypeField
 from renity.fields.interface import Field
+from renity.utils import LRUCache
+
+from .layout import FixedLayout
+from .registry import Registry
+from .registry import fingerprint
+
+
+# Class options(see Message): inherit(combine inherited values)
+# Resolved to "_<option>" so fields may reuse option names.
+OPTIONS = {
+    "pool_size": None,
+    "compact_type": any,
+    "elide_defaults": all,
+    "compression": None,
+    "encode_cache_size": max,
+    "decode_cache_size": max,
+    "decode_cache_max_bytes": None,
+    "fixed_layout": None,
+    "validation": None,
+    "sample_rate": None,
+}
+
+# Base attributes used by the runtime(field slots cannot shadow)
+RESERVED = ("data", "message", "serializer")
+
+
+def option(name, attrs, bases, inherit=None):
+    """Class Option.
+
+    * Declared(non-Field) value, else inherited "_<option>" of bases.
+
+    Args:
+        name(str): option name.
+        attrs(dict): class attributes.
+        bases(tuple): base classes.
+        inherit(callable): combine inherited values(default first base).
+
+    Returns:
+        (Any): option value.
+    """
+    if name in attrs and not isinstance(attrs[name], Field):
+        return attrs[name]
+
+    values = [
+        getattr(base, f"_{name}") for base in bases if hasattr(base, f"_{name}")
+    ]
+    if inherit is None:
+        return values[0]
+    return inherit(values)
+
+
+def default_records(_fields, elide):
+    """Pre-Encode Defaults Of Elided Fields(see Field.default_record).
+
+    Args:
+        _fields(dict): key: Field.
+        elide(bool): elide default values(see Message.elide_defaults).
+    """
+    for key, field in _fields.items():
+        field.default_record = None
+        if elide and key != "type" and field.default is not None:
+            field.default_record = Encoder.record(field.default, field)
+
+
+def type_identifier(name, attrs, _fields):
+    """Compact Numeric Type Identifier.
+
+    * Explicit(non-Field) type_id, else derived from fingerprint when
+      compact_type is set.
+
+    Args:
+        name(str): class name.
+        attrs(dict): class attributes.
+        _fields(dict): key: Field(including type field).
+
+    Returns:
+        (bool): compact(register class after creation).
+    """
+    attrs["_fingerprint"] = fingerprint(name, _fields)
+    type_id = attrs.get("type_id")
+    if isinstance(type_id, Field):
+        type_id = None
+    if type_id is None and not attrs["_compact_type"]:
+        return False
+
+    if type_id is None:
+        type_id = Registry.derive(attrs["_fingerprint"])
+    type_field = _fields["type"]
+    attrs["_type_id"] = type_field.type_id = type_id
+    type_field.field = TYPE_ID
+    return True
+
+
+def class_state(attrs, _fields):
+    """Slots & Per-Class State.
+
+    * Per-field slot descriptors(no instance __dict__)
+    * Instance pool, sampled validation counters & encode/decode caches.
+
+    Args:
+        attrs(dict): class attributes.
+        _fields(dict): key: Field.
+    """
+    _keys = [key for key in _fields if key != "type"]
+    for key in _keys:
+        attrs.pop(key)
+    attrs["__slots__"] = tuple(attrs.get("__slots__", ())) + tuple(_keys)
+    attrs["_keys"] = ("type", *_keys)
+
+    # Bounded instance pool(see Message.pool_size)
+    attrs["_pool"] = []
+
+    # Sampled validation counters(see Message.validation)
+    attrs["_validation_counts"] = {
+        "messages": 0,
+        "validated": 0,
+        "failures": 0,
+    }
+
+    # Encode-result cache(see Message.encode_cache_size)
+    cache_size = attrs["_encode_cache_size"]
+    attrs["_encode_cache"] = LRUCache(cache_size) if cache_size else None
+
+    # Decode-result cache(see Message.decode_cache_size)
+    cache_size = attrs["_decode_cache_size"]
+    attrs["_decode_cache"] = LRUCache(cache_size) if cache_size else None
 
 
 class MessageMetaClass(type):
@@ -10,6 +138,9 @@ class MessageMetaClass(type):
     Used for message class creation.
 
     * Creates validation chain from 'validators' attribute
+    * Generates __slots__ storage for field values
+    * Registers compact type_id(see registry.py)
+    * Pre-encodes elided defaults
     """
 
     def __new__(cls, name, bases, attrs):
@@ -17,43 +148,93 @@ class MessageMetaClass(type):
 
         * Initialize validators
         """
-        _fields = {}
-        _bits = {}
-        _length = 0
         if not len(bases):
             cls._all_required = attrs["required"]
 
-        def build(key, val, length):
-            cls.strict(key, val)
+        _fields, _bits = cls.schema(attrs)
 
-            _fields.update({key: val})
+        # Add Type Field
+        type_field = TypeField(default=name)
+        type_field.message_cls = name
 
-            _bit = 2**length
+        _fields.update({"type": type_field})
 
-            _bits.update({_bit: key})
+        attrs["_fields"] = _fields
+        attrs["_bits"] = _bits
+        attrs["_length"] = len(_bits)
 
-        for _name, _value in attrs.items():
-            if isinstance(_value, Field):
-                build(_name, _value, _length)
-                _length += 1
+        for _option, inherit in OPTIONS.items():
+            attrs[f"_{_option}"] = option(_option, attrs, bases, inherit)
 
-        # Add Type Field
-        type_field = TypeField
-        type_field.message_cls = name
+        compact = False
+        if len(bases):
+            default_records(_fields, attrs["_elide_defaults"])
+            compact = type_identifier(name, attrs, _fields)
+            class_state(attrs, _fields)
+
+        inst = super().__new__(cls, name, bases, attrs)
+
+        if compact:
+            Registry.register(inst)
+
+        # Fixed-layout struct codec(see Message.fixed_layout)
+        if len(bases) and inst._fixed_layout:
+            inst._layout = FixedLayout(inst)
+
+        return inst
+
+    @classmethod
+    def schema(cls, attrs):
+        """Message Fields.
+
+        Args:
+            attrs(dict): class attributes.
 
-        _fields.update({"type": type_field(default=name)})
+        Returns:
+            (tuple): fields(key: Field), bits(bit: key) in declaration order.
+
+        Raises:
+            TypeError: field shadows a runtime attribute.
+            Exception: more than 8 fields.
+        """
+        _fields = {}
+        _bits = {}
+        for key, val in attrs.items():
+            if not isinstance(val, Field):
+                continue
+            cls.strict(key, val)
+
+            # Field slots cannot shadow runtime attributes(data, message...)
+            if key in RESERVED:
+                raise TypeError(
+                    f"Attempted to overwrite protected field '{key}'."
+                )
+
+            _bits[2 ** len(_fields)] = key
+            _fields[key] = val
 
         # Limit Message fields to 8bit
-        if _length > 8:
+        if len(_fields) > 8:
             raise Exception(
                 "Renity currently only supports 8 field Message Schema(s)."
             )
 
-        attrs["_fields"] = _fields
-        attrs["_bits"] = _bits
-        attrs["_length"] = _length
+        return _fields, _bits
+
+    @property
+    def encode_cache(cls):
+        """Encode-Result Cache(see Message.encode_cache_size)."""
+        return cls._encode_cache
+
+    @property
+    def decode_cache(cls):
+        """Decode-Result Cache(see Message.decode_cache_size)."""
+        return cls._decode_cache
 
-        return super().__new__(cls, name, bases, attrs)
+    @property
+    def validation_counts(cls):
+        """Sampled Validation Counters(see Message.validation)."""
+        return cls._validation_counts
 
     @classmethod
     def strict(cls, key: str, field: Field) -> None:
@@ -0,0 +1,146 @@
+"""Fixed-Layout Messages.
+
+Schemas of only fixed-width fields(bool, float, fixed-width ints) encoded
+as one precompiled struct(see Message.fixed_layout):
+
+    * Prefix: identifier(framed, see constants.FRAME_FLAGS["fixed"]).
+    * Body: every field in bit order, no tags(little-endian).
+    * Absent values are encoded as field default(or zero).
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Type
+
+from bitstring import Bits
+
+from ..constants import FRAME_FLAGS
+from ..encoder.encoder import Encoder
+from ..fields.constants import BOOL
+from ..fields.constants import I32
+from ..fields.constants import I64
+from ..fields.constants import VARINT
+from ..frame import Frame
+from ..frame import join
+
+
+# [wire type, wire field]: little-endian struct format
+LAYOUT_FORMATS = {
+    (VARINT, BOOL): "?",
+    (I64, 1): "d",
+    (I64, 2): "Q",
+    (I64, 3): "q",
+    (I32, 1): "f",
+    (I32, 2): "I",
+    (I32, 3): "i",
+}
+
+
+class FixedLayout:
+    """Fixed-Layout Codec of <Message> sub-class.
+
+    Args:
+        message_cls(Message): <Message> sub-class.
+
+    Raises:
+        TypeError: field is not fixed-width.
+    """
+
+    def __init__(self, message_cls: Type[Any]) -> None:
+        self.message_cls = message_cls
+        self.keys = tuple(message_cls._bits.values())
+
+        _fields = message_cls._fields
+        formats = []
+        defaults = []
+        for key in self.keys:
+            field = _fields[key]
+            fmt = None
+            if not field.sub_fields:
+                fmt = LAYOUT_FORMATS.get((field.wire, field.field))
+            if fmt is None:
+                raise TypeError(
+                    f"TypeError: Expected fixed-width field for fixed_layout but found '{key}'."
+                )
+            formats.append(fmt)
+            default = field.default
+            defaults.append(field.data_type() if default is None else default)
+
+        self.format = "".join(formats)
+        self.defaults = tuple(defaults)
+        self.body = struct.Struct("<" + self.format)
+        self._prefix: Optional[bytes] = None
+        self._message: Optional[struct.Struct] = None
+
+    @property
+    def prefix(self) -> bytes:
+        """Framed Identifier(built on first use, after type_id registration)."""
+        if self._prefix is None:
+            m_cls = self.message_cls
+            identifier = Bits(
+                bin=Encoder.record(m_cls.__name__, m_cls._fields["type"])
+            ).bytes
+            self._prefix = join(
+                Frame(identifier, FRAME_FLAGS["fixed"], (), b"")
+            )
+        return self._prefix
+
+    @property
+    def message(self) -> struct.Struct:
+        """Whole Message Struct(prefix skipped as pad bytes)."""
+        if self._message is None:
+            self._message = struct.Struct(f"<{len(self.prefix)}x{self.format}")
+        return self._message
+
+    def pack(self, values: Iterable[Any]) -> bytes:
+        """Encode Message.
+
+        Args:
+            values(Iterable): field values in bit order(None -> default).
+
+        Returns:
+            (bytes): prefix + body.
+        """
+        body = self.body.pack(
+            *(
+                default if value is None else value
+                for value, default in zip(values, self.defaults)
+            )
+        )
+        return self.prefix + body
+
+    def match(self, data: bytes) -> bool:
+        """Fixed-Layout Message of message_cls."""
+        prefix = self.prefix
+        return len(data) == self.message.size and data[: len(prefix)] == prefix
+
+    def unpack(self, data: bytes) -> dict:
+        """Decode Message.
+
+        Returns:
+            (dict): type & field values.
+        """
+        message = dict(zip(self.keys, self.message.unpack_from(data)))
+        message["type"] = self.message_cls.__name__
+        return message
+
+    def iter_unpack(self, data: bytes) -> Iterator[dict]:
+        """Bulk Decode.
+
+        Args:
+            data(bytes): concatenated messages of message_cls.
+
+        Yields:
+            (dict): type & field values.
+        """
+        name = self.message_cls.__name__
+        keys = self.keys
+        for values in self.message.iter_unpack(data):
+            message = dict(zip(keys, values))
+            message["type"] = name
+            yield message
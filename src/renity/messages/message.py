@@ -1,64 +1,301 @@
 """Message Interface."""
 
 from typing import Any
+from typing import Iterator
+from typing import Optional
 
-from bitstring import BitStream
-
+from renity.constants import STRICT
+from renity.constants import VALIDATION_MODES
 from renity.messages.interface import MessageMetaClass
+from renity.messages.layout import FixedLayout
+from renity.messages.template import Template
 from renity.serializers import Serializers as Serializer
+from renity.serializers.compression import Compression
+from renity.utils import LRUCache
 
 
 class Message(metaclass=MessageMetaClass):
     """Message Interface.
 
+    Attributes:
+        required(bool): flag all fields required=True.
+
+        pool_size(int): max released instances kept for reuse(see acquire).
+
+        compact_type(bool): identify message by varint type_id instead of name.
+
+        type_id(int): explicit compact type_id(default derived from schema).
+
+        elide_defaults(bool): omit fields equal to their default from the wire,
+        restored from the schema on decode.
+
+        compression(Compression): opt-in compression stage(see compression.py).
+
+        encode_cache_size(int): max cached encodings of identical field values,
+        hit/miss counters on encode_cache(LRUCache).
+
+        decode_cache_size(int): max cached decodes of identical payloads,
+        hit/miss counters on decode_cache(LRUCache). Decoded lists/maps are
+        read-only(tuple/MappingProxyType) while enabled.
+
+        decode_cache_max_bytes(int): larger payloads bypass decode_cache.
+
+        fixed_layout(bool): encode as one struct, no tags(see layout.py),
+        fixed-width fields only.
+
+        validation(str): strict | trusted | sampled(see constants.py),
+        overridden per call(Message(data, validation=...)).
+
+        sample_rate(int): validate 1 in sample_rate messages(sampled mode),
+        counts in validation_counts.
+
     Args:
         _message(Any): Binary protocol message
+        validation(str): validation mode of this call(default cls.validation)
     """
 
-    __slots__ = ["_message", "data", "type", "serializer"]
+    __slots__ = ["data", "type"]
     # prevent pytest from trying to discover tests in the class
     __test__ = False
     required: bool = False
+    pool_size: int = 0
+    compact_type: bool = False
+    elide_defaults: bool = True
+    compression: Optional[Compression] = None
+    encode_cache_size: int = 0
+    _encode_cache: Optional[LRUCache] = None
+    decode_cache_size: int = 0
+    decode_cache_max_bytes: int = 256
+    _decode_cache: Optional[LRUCache] = None
+    fixed_layout: bool = False
+    _layout: Optional[FixedLayout] = None
+    validation: str = STRICT
+    sample_rate: int = 100
+    _validation_counts: dict = {}
+    type_id: Optional[int] = None
+    _type_id: Optional[int] = None
+    _fingerprint: int = 0
     _length: int = 0
+    _keys: tuple = ("type",)
+    _pool: list = []
 
-    def __init__(self, message: Any = None) -> None:
-        self.message = message
+    def __init__(
+        self, message: Any = None, validation: Optional[str] = None
+    ) -> None:
+        self.__load(message, validation)
 
     @property
     def message(self):
-        """Message Dict."""
-        return self._message
+        """Message Dict.
+
+        * Built from field slots.
+        """
+        if not hasattr(self, "type"):
+            return None
+        return {key: getattr(self, key) for key in self._keys}
 
     @message.setter
     def message(self, value: Any) -> None:
-        _message, data = self.__serialize(value)
+        self.__load(value)
+
+    def __load(self, value: Any, validation: Optional[str] = None) -> None:
+        """Serialize & Store Message.
+
+        Args:
+            value(Any): message data.
+            validation(str): validation mode(default cls.validation).
+        """
+        _message, data = self.__serialize(value, validation)
+
+        # Store field values in slots
+        if _message is not None:
+            for key, _value in _message.items():
+                setattr(self, key, _value)
 
-        self._message = _message
         self.data = data
 
-    def __serialize(self, message: Any) -> tuple:
-        """Serialize Message.
+    @property
+    def serializer(self) -> Serializer:
+        """Serializer Chain.
 
-        * Instantiate Serializer Chain on instance.
+        * Instantiated once per <Message> sub-class and reused.
+        """
+        cls = type(self)
+        if "_serializer" not in cls.__dict__:
+            cls._serializer = Serializer(cls)
+        return cls._serializer
+
+    def __serialize(
+        self, message: Any, validation: Optional[str] = None
+    ) -> tuple:
+        """Serialize Message.
 
         Args:
             message(Any): message data.
+            validation(str): validation mode(default cls.validation).
 
         Returns:
             serialized_message(tuple): (<dict>, <bytes>)
-        """
-        # Instantiate Serializer Chain on instance.
-        if not hasattr(self, "serializer"):
-            _serializer = Serializer
-            _serializer.message_cls = self
-            self.serializer = _serializer()
 
+        Raises:
+            ValueError: unknown validation mode.
+        """
         if message:
-            self.serializer.message = message
-            return self.serializer.run()
+            mode = validation or self._validation
+            if mode not in VALIDATION_MODES:
+                raise ValueError(
+                    f"Expected validation mode in {VALIDATION_MODES} but found {mode}."
+                )
+
+            return self.serializer.run(message, mode)
 
         return None, None
 
+    def update(self, message: Any) -> "Message":
+        """Re-serialize Message In Place.
+
+        * dict: merged into current field values.
+        * bytes: replaces current field values.
+
+        Args:
+            message(Any): message data.
+
+        Returns:
+            self(Message): updated instance.
+        """
+        current = self.message
+        if current and isinstance(message, dict):
+            message = {**current, **message}
+
+        self.message = message
+        return self
+
+    @classmethod
+    def decode_into(cls, instance: "Message", data: bytes) -> "Message":
+        """Decode Into Existing Instance.
+
+        Args:
+            instance(Message): instance of this <Message> sub-class to overwrite.
+            data(bytes): encoded message.
+
+        Returns:
+            instance(Message): overwritten instance.
+
+        Raises:
+            TypeError: instance is not of this <Message> sub-class.
+        """
+        if not isinstance(instance, cls):
+            raise TypeError(
+                f"Expected instance of {cls.__name__} but found {type(instance)}."
+            )
+        instance.message = data
+        return instance
+
+    @classmethod
+    def acquire(cls, message: Any = None) -> "Message":
+        """Pooled Instance.
+
+        * Reuse released instance when available(see pool_size).
+
+        Args:
+            message(Any): message data.
+
+        Returns:
+            instance(Message): populated instance.
+        """
+        try:
+            instance = cls._pool.pop()
+        except IndexError:
+            instance = cls.__new__(cls)
+        instance.message = message
+        return instance
+
+    def release(self) -> None:
+        """Return Instance to Pool.
+
+        * Dropped when pool is full(bounded by pool_size).
+        * Field slots are cleared(acquire(None) returns an empty message).
+        """
+        pool = self._pool
+        if len(pool) < self._pool_size and self not in pool:
+            self._clear()
+            pool.append(self)
+
+    def _clear(self) -> None:
+        """Clear Field Slots & Encoded Data."""
+        for key in self._keys:
+            if hasattr(self, key):
+                delattr(self, key)
+        self.data = None
+
+    @classmethod
+    def template(cls, **constant_fields: Any) -> "Template":
+        """Pre-Encoded Template.
+
+        * Fixed-width fields(bool, float, fixed-width ints) patched in place.
+
+        Args:
+            constant_fields(dict): field values.
+
+        Returns:
+            (Template): see messages/template.py
+        """
+        return Template.build(cls, constant_fields)
+
+    @classmethod
+    def iter_unpack(cls, data: bytes) -> Iterator[dict]:
+        """Bulk Decode Fixed-Layout Messages.
+
+        Args:
+            data(bytes): concatenated messages of cls(see fixed_layout).
+
+        Returns:
+            (Iterator): message dicts.
+        """
+        return cls._layout.iter_unpack(data)
+
+    def _quartets(self, keys: Optional[set] = None) -> list:
+        """Encoder Quartets.
+
+        * Populated(validated) field values, no re-validation.
+
+        Args:
+            keys(set): keys to include(default all).
+
+        Returns:
+            (list): field(Field), key(str), value(Any), bit(int) Quartets
+        """
+        _fields = self._fields
+        result = [(_fields["type"], "type", self.type, None)]
+
+        for bit, key in self._bits.items():
+            value = getattr(self, key) if keys is None or key in keys else None
+            result.append((_fields[key], key, value, bit))
+
+        return result
+
+    @classmethod
+    def _keyed(cls, decoded: dict) -> dict:
+        """Message Dict From Decoded Wire Dict.
+
+        * bit -> key
+        * wire value -> field value(see Field.decode)
+
+        Args:
+            decoded(dict): decoder result.
+
+        Returns:
+            (dict): type & fields present in decoded.
+        """
+        message = {"type": decoded["type"]}
+        _fields = cls._fields
+
+        for bit, key in cls._bits.items():
+            if bit in decoded:
+                message[key] = _fields[key].decode(decoded[bit])
+
+        return message
+
     def __iter__(self):
         """Generator Override.
 
@@ -75,4 +312,4 @@ class Message(metaclass=MessageMetaClass):
 
     def __bytes__(self):
         """Bytes Representation Override."""
-        return BitStream(bytes=self.data).bytes
+        return self.data if self.data is not None else b""
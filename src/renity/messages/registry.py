@@ -0,0 +1,155 @@
+"""Message Type Registry.
+
+Compact numeric identifiers for <Message> sub-classes.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Any
+
+from .exceptions import SchemaMismatch
+from .exceptions import TypeIdCollision
+
+
+# Explicit type_id(s) below this value encode in a single byte
+DERIVED_ID_START = 128
+
+# Derived type_id(s) encode in two bytes
+DERIVED_ID_END = 2**14
+
+
+def field_schema(field: Any) -> str:
+    """Canonical Field Schema.
+
+    * Field class, wire type, required flag & default
+    * Sub-fields, enum choices & map key/value fields
+
+    Args:
+        field(Field): field to describe.
+
+    Returns:
+        (str): canonical schema string.
+    """
+    schema = f"{type(field).__name__}:{field.wire}:{field.required}:{field.default!r}"
+
+    if field.sub_fields:
+        subs = ",".join(field_schema(sub) for sub in field.sub_fields)
+        schema += f"[{subs}:{field.sorted}]"
+
+    choices = getattr(field, "choices", None)
+    if choices is not None:
+        schema += f"{choices!r}"
+
+    key_field = getattr(field, "key_field", None)
+    if key_field is not None:
+        schema += (
+            f"{{{field_schema(key_field)}:{field_schema(field.value_field)}}}"
+        )
+
+    return schema
+
+
+def fingerprint(name: str, fields: dict) -> int:
+    """Schema Fingerprint.
+
+    Args:
+        name(str): <Message> sub-class name.
+        fields(dict): key: Field(in bit order).
+
+    Returns:
+        (int): crc32 of canonical schema.
+    """
+    schema = ";".join(
+        f"{key}={field_schema(field)}"
+        for key, field in fields.items()
+        if key != "type"
+    )
+    return zlib.crc32(f"{name}|{schema}".encode("utf-8"))
+
+
+class Registry:
+    """Message Type Registry.
+
+    Attributes:
+        messages(dict): type_id: <Message> sub-class.
+
+        names(dict): type_id: <Message> sub-class name.
+    """
+
+    messages: dict = {}
+    names: dict = {}
+
+    @classmethod
+    def derive(cls, _fingerprint: int) -> int:
+        """Type Id From Schema Fingerprint."""
+        span = DERIVED_ID_END - DERIVED_ID_START
+        return DERIVED_ID_START + _fingerprint % span
+
+    @classmethod
+    def register(cls, message_cls: Any) -> int:
+        """Register <Message> sub-class.
+
+        * Re-definition of an identical schema replaces previous class.
+
+        Args:
+            message_cls(Message): sub-class with _type_id & _fingerprint.
+
+        Returns:
+            type_id(int): registered id.
+
+        Raises:
+            TypeIdCollision: id belongs to a different schema.
+        """
+        type_id = message_cls._type_id
+        current = cls.messages.get(type_id)
+
+        if (
+            current is not None
+            and current._fingerprint != message_cls._fingerprint
+        ):
+            raise TypeIdCollision(
+                type_id, current.__name__, message_cls.__name__
+            )
+
+        cls.messages[type_id] = message_cls
+        cls.names[type_id] = message_cls.__name__
+        return type_id
+
+    @classmethod
+    def resolve(cls, type_id: int) -> Any:
+        """<Message> sub-class of type_id."""
+        return cls.messages[type_id]
+
+    @classmethod
+    def manifest(cls) -> dict:
+        """Registered Schemas.
+
+        * Exchanged once per connection(see verify).
+
+        Returns:
+            (dict): type_id: fingerprint
+        """
+        return {
+            type_id: message_cls._fingerprint
+            for type_id, message_cls in cls.messages.items()
+        }
+
+    @classmethod
+    def verify(cls, manifest: dict) -> bool:
+        """Verify Remote Manifest.
+
+        Args:
+            manifest(dict): type_id: fingerprint(see manifest).
+
+        Returns:
+            (bool): True
+
+        Raises:
+            SchemaMismatch: shared type_id with different fingerprint.
+        """
+        for type_id, _fingerprint in manifest.items():
+            current = cls.messages.get(type_id)
+            if current is not None and current._fingerprint != _fingerprint:
+                raise SchemaMismatch(current.__name__, type_id)
+        return True
@@ -0,0 +1,156 @@
+"""Connection String Table.
+
+Repeated string values are sent once, then referenced by index:
+
+    * Definition: LEN(field 4) string, assigned next table index.
+    * Reference: VARINT(field 5) index of a previously sent string.
+
+Both ends apply the same bounded LRU eviction in wire order, so the
+table requires in-order delivery(one StringTable per connection).
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any
+from typing import Type
+
+from ..decoder import decoder as MessageDecoder
+from ..encoder.encoder import Encoder
+from ..utils import StringDef
+from ..utils import StringRef
+from .message import Message
+
+
+class StringTable:
+    """Connection String Table.
+
+    * Outgoing(encode) & incoming(decode) tables are independent.
+
+    Args:
+        capacity(int): max strings per table(LRU eviction).
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.capacity = capacity
+        # str: index(LRU order)
+        self.sent: OrderedDict = OrderedDict()
+        # index: interned str(LRU order)
+        self.received: OrderedDict = OrderedDict()
+
+    def encode(self, message: Any) -> bytes:
+        """Encode Message With String References.
+
+        Args:
+            message(Message): populated message.
+
+        Returns:
+            (bytes): encoded message.
+        """
+        quartets = [
+            (field, key, self.reference(value, field), bit)
+            if bit is not None
+            and value is not None
+            and value is not field.default
+            else (field, key, value, bit)
+            for field, key, value, bit in message._quartets()
+        ]
+        return Encoder.encode(quartets)
+
+    def decode(self, message_cls: Type[Message], data: bytes) -> Message:
+        """Decode Message With String References.
+
+        Args:
+            message_cls(Message): <Message> sub-class to decode.
+            data(bytes): encoded message(see encode).
+
+        Returns:
+            (Message): message with interned strings.
+        """
+        decoded = MessageDecoder.decode(data)
+
+        # Resolve in wire order(same order as sender)
+        for key, value in decoded.items():
+            if key != "type":
+                decoded[key] = self.resolve(value)
+
+        return message_cls(message_cls._keyed(decoded))
+
+    def reference(self, value: Any, field: Any) -> Any:
+        """Replace Strings With Definitions/References.
+
+        Args:
+            value(Any): field value.
+            field(Field): field of value.
+
+        Returns:
+            (Any): value with StringDef/StringRef strings.
+        """
+        if field.data_type is str:
+            return self.send(value)
+
+        if field.sub_fields and isinstance(value, (list, tuple)):
+            return [
+                self.reference(v, sub)
+                for v, sub in zip(value, field.sub_fields)
+            ]
+
+        key_field = getattr(field, "key_field", None)
+        if key_field is not None and isinstance(value, Mapping):
+            value_field = field.value_field
+            return {
+                self.reference(k, key_field): self.reference(v, value_field)
+                for k, v in value.items()
+            }
+
+        return value
+
+    def send(self, value: str) -> Any:
+        """Outgoing String.
+
+        Returns:
+            (StringRef, StringDef): reference if sent before else definition.
+        """
+        sent = self.sent
+        index = sent.get(value)
+
+        if index is not None:
+            sent.move_to_end(value)
+            return StringRef(index)
+
+        if len(sent) < self.capacity:
+            index = len(sent)
+        else:
+            # Reuse index of least recently used string
+            _, index = sent.popitem(last=False)
+
+        sent[value] = index
+        return StringDef(value)
+
+    def resolve(self, value: Any) -> Any:
+        """Replace Definitions/References With Interned Strings."""
+        if isinstance(value, StringRef):
+            received = self.received
+            received.move_to_end(value)
+            return received[value]
+
+        if isinstance(value, StringDef):
+            received = self.received
+            if len(received) < self.capacity:
+                index = len(received)
+            else:
+                # Reuse index of least recently used string
+                index, _ = received.popitem(last=False)
+
+            string = received[index] = sys.intern(str(value))
+            return string
+
+        if isinstance(value, list):
+            return [self.resolve(v) for v in value]
+
+        if isinstance(value, dict):
+            return {self.resolve(k): self.resolve(v) for k, v in value.items()}
+
+        return value
@@ -0,0 +1,129 @@
+"""Message Templates.
+
+Pre-encoded message whose fixed-width fields(bool, float, fixed-width ints)
+are patched in place, no re-validation or re-encoding:
+
+    * Every field is encoded(no default elision) so offsets are stable.
+    * Patchable value offset = record offset + tag byte.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Any
+from typing import Dict
+from typing import Tuple
+from typing import Type
+
+from ..encoder.encoder import Encoder
+from ..fields.constants import BOOL
+from ..fields.constants import I32
+from ..fields.constants import I64
+from ..fields.constants import VARINT
+
+
+# [wire type, wire field]: big-endian struct format(tagged wire value)
+PATCH_FORMATS = {
+    (VARINT, BOOL): ">?",
+    (I64, 1): ">d",
+    (I64, 2): ">Q",
+    (I64, 3): ">q",
+    (I32, 1): ">f",
+    (I32, 2): ">I",
+    (I32, 3): ">i",
+}
+
+
+def patch_format(field: Any) -> Any:
+    """Patch Struct Format of Field(None when not fixed-width)."""
+    if field.sub_fields:
+        return None
+    return PATCH_FORMATS.get((field.wire, field.field))
+
+
+class Template:
+    """Message Template.
+
+    * Patch: template[key] = value(single struct.pack_into).
+
+    Args:
+        message_cls(Message): <Message> sub-class of template.
+
+        data(bytearray): encoded message.
+
+        offsets(dict): key: (byte offset, struct.Struct) of patchable fields.
+    """
+
+    __slots__ = ("message_cls", "data", "offsets")
+
+    def __init__(
+        self,
+        message_cls: Type[Any],
+        data: bytearray,
+        offsets: Dict[str, Tuple[int, struct.Struct]],
+    ) -> None:
+        self.message_cls = message_cls
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def build(cls, message_cls: Type[Any], constant_fields: dict) -> Template:
+        """Pre-Encode Template.
+
+        * Fixed-width fields not in constant_fields start at default(or zero).
+
+        Args:
+            message_cls(Message): <Message> sub-class to encode.
+            constant_fields(dict): field values(validated once).
+
+        Returns:
+            (Template): template with patchable field offsets.
+        """
+        values = dict(constant_fields)
+        for key, field in message_cls._fields.items():
+            if key not in values and patch_format(field):
+                default = field.default
+                values[key] = field.data_type() if default is None else default
+
+        quartets = message_cls(values)._quartets()
+        data = bytearray(Encoder.encode(quartets, elide=False))
+
+        # Walk records in encoder order
+        offset = 0
+        offsets = {}
+        for field, key, value, bit in quartets:
+            if value is None:
+                continue
+
+            # Identifier(+ attributes byte)
+            if bit is None:
+                offset += len(Encoder.record(value, field)) // 8 + 1
+                continue
+
+            fmt = patch_format(field)
+            if fmt:
+                offsets[key] = (offset + 1, struct.Struct(fmt))
+            # Encoded record length(strings: UTF-8 encoded length)
+            offset += len(Encoder.record(value, field)) // 8
+
+        return cls(message_cls, data, offsets)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Patch Field Value(no validation)."""
+        offset, fmt = self.offsets[key]
+        fmt.pack_into(self.data, offset, value)
+
+    def __getitem__(self, key: str) -> Any:
+        """Current Field Value."""
+        offset, fmt = self.offsets[key]
+        return fmt.unpack_from(self.data, offset)[0]
+
+    def update(self, **values: Any) -> Template:
+        """Patch Field Values."""
+        for key, value in values.items():
+            self[key] = value
+        return self
+
+    def __bytes__(self) -> bytes:
+        """Bytes Representation Override."""
+        return bytes(self.data)
@@ -0,0 +1,235 @@
+"""Renity Instrumentation.
+
+Optional per-<Message> type counters & stage timings(disabled by default):
+
+    * Stages: encode, decode(serializer stage), validate(field checks).
+      Stage timings are inclusive: encode/decode include the validate
+      stage they run, which is also reported on its own.
+    * Counters: messages, bytes in/out, validation failures.
+    * Timings: count, cumulative ns & log2 ns histogram per stage.
+    * Callbacks: called with an Event after every timed stage, after the
+      stage is recorded(callback errors never hide a stage error).
+
+Disabled instrumentation is a single flag check per message.
+
+Usage:
+    instrumentation.enable()
+    instrumentation.subscribe(callback)
+    instrumentation.snapshot()
+"""
+
+from __future__ import annotations
+
+from time import perf_counter_ns
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+from .constants import STRICT
+
+
+class Event(NamedTuple):
+    """Timed Stage Event.
+
+    Attributes:
+        stage(str): encode | decode | validate.
+        message_type(str): <Message> sub-class name.
+        ns(int): stage duration(nanoseconds, encode/decode include the
+            nested validate stage).
+        size(int): bytes in/out(0 for validate).
+        error(Exception): raised by stage(None on success).
+    """
+
+    stage: str
+    message_type: str
+    ns: int
+    size: int = 0
+    error: Optional[BaseException] = None
+
+
+class Stats:
+    """Counters & Timings of one <Message> type."""
+
+    __slots__ = (
+        "messages_out",
+        "messages_in",
+        "bytes_out",
+        "bytes_in",
+        "validation_failures",
+        "stages",
+    )
+
+    def __init__(self) -> None:
+        self.messages_out = 0
+        self.messages_in = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.validation_failures = 0
+        # stage: [count, total_ns, {bucket upper bound(ns): count}]
+        self.stages: Dict[str, list] = {}
+
+    def time(self, stage: str, ns: int) -> None:
+        """Record Stage Timing(log2 histogram bucket)."""
+        timing = self.stages.get(stage)
+        if timing is None:
+            timing = self.stages[stage] = [0, 0, {}]
+
+        timing[0] += 1
+        timing[1] += ns
+        bucket = 1 << ns.bit_length()
+        histogram = timing[2]
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+
+    def as_dict(self) -> dict:
+        """Snapshot."""
+        return {
+            "messages_out": self.messages_out,
+            "messages_in": self.messages_in,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "validation_failures": self.validation_failures,
+            "stages": {
+                stage: {
+                    "count": count,
+                    "total_ns": total,
+                    "histogram": dict(sorted(histogram.items())),
+                }
+                for stage, (count, total, histogram) in self.stages.items()
+            },
+        }
+
+
+class Instrumentation:
+    """Instrumentation Registry.
+
+    Attributes:
+        enabled(bool): record counters/timings.
+        stats(dict): <Message> type name: Stats.
+        callbacks(list): called with Event after each timed stage.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.stats: Dict[str, Stats] = {}
+        self.callbacks: List[Callable[[Event], Any]] = []
+
+    def enable(self) -> None:
+        """Enable Instrumentation."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Disable Instrumentation(recorded stats are kept)."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Clear Recorded Stats."""
+        self.stats.clear()
+
+    def subscribe(self, callback: Callable[[Event], Any]) -> None:
+        """Register Callback."""
+        self.callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Event], Any]) -> None:
+        """Remove Callback."""
+        self.callbacks.remove(callback)
+
+    def snapshot(self) -> dict:
+        """Recorded Stats.
+
+        Returns:
+            (dict): <Message> type name: counters & stage timings.
+        """
+        return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+    def of(self, message_type: str) -> Stats:
+        """Stats of <Message> type."""
+        stats = self.stats.get(message_type)
+        if stats is None:
+            stats = self.stats[message_type] = Stats()
+        return stats
+
+    def serialize(
+        self, serializer: Any, data: Any, validation: str = STRICT
+    ) -> tuple:
+        """Timed Serializer Stage.
+
+        Args:
+            serializer(MessageSerializer): serializer node(stage).
+            data(Any): serializer input.
+            validation(str): validation mode(see Message.validation).
+
+        Returns:
+            (tuple): message, bytes(see MessageSerializer.load).
+        """
+        stage = serializer.stage
+        name = serializer.message_cls.__name__
+        start = perf_counter_ns()
+        try:
+            result = serializer.serialize(data, validation)
+        except BaseException as e:
+            ns = perf_counter_ns() - start
+            self.emit(Event(stage, name, ns, 0, e))
+            raise
+
+        ns = perf_counter_ns() - start
+        stats = self.of(name)
+        stats.time(stage, ns)
+        if stage == "decode":
+            size = len(data)
+            stats.messages_in += 1
+            stats.bytes_in += size
+        else:
+            size = len(result[1] or b"")
+            stats.messages_out += 1
+            stats.bytes_out += size
+        self.emit(Event(stage, name, ns, size))
+        return result
+
+    def validate(
+        self, message_type: str, resolve: Callable, _message: Any
+    ) -> Any:
+        """Timed Validation Stage.
+
+        Args:
+            message_type(str): <Message> sub-class name.
+            resolve(callable): validating resolver.
+            _message(Any): message values.
+
+        Returns:
+            (Any): resolve result.
+        """
+        start = perf_counter_ns()
+        try:
+            result = resolve(_message)
+        except BaseException as e:
+            ns = perf_counter_ns() - start
+            self.of(message_type).validation_failures += 1
+            self.emit(Event("validate", message_type, ns, 0, e))
+            raise
+
+        ns = perf_counter_ns() - start
+        self.of(message_type).time("validate", ns)
+        self.emit(Event("validate", message_type, ns))
+        return result
+
+    def emit(self, event: Event) -> None:
+        """Call Callbacks.
+
+        * Callback errors propagate, except for failed stage events(the
+          stage error is raised by the caller instead).
+        """
+        for callback in self.callbacks:
+            if event.error is None:
+                callback(event)
+                continue
+            try:
+                callback(event)
+            except Exception:
+                pass
+
+
+# Module Instrumentation
+instrumentation = Instrumentation()
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from typing import Any
-from typing import Callable
 from typing import Optional
 from typing import Type
 
@@ -13,6 +12,7 @@ import renity
 from renity.serializers import serializers
 from renity.serializers.interface import MessageSerializer as Serializer
 
+from ..constants import STRICT
 from ..utils import modulesubclasses
 
 
@@ -51,14 +51,6 @@ class FieldElement:
 
     @value.setter
     def value(self, val):
-        # Set <Field> attribute value
-        if val is not None:
-            self.field.value = val
-
-            # Validate Field Value
-            self.field.validate(val)
-
-        # Set value
         self._value = val if val is not None else self.field.default
 
     def __getitem__(self, __name: Any[str, int]) -> Any:
@@ -76,71 +68,54 @@ class FieldElement:
         yield from [self.field, self.key, self.value, self.bit]
 
 
-@typechecked
 class Serializers:
     """Serializer Chain.
 
+    * Built once per <Message> sub-class(field element layout + nodes).
+    * Stateless per run(re-entrant): message, validation mode & result
+      are local to each call.
+    * Type checked on construction only(no typeguard on hot path).
+
     Attributes:
         serializers(list): list of available <Serializer>(s).
 
-        fields(list): list of <Message> sub-class field(s)<dict>
+        fields(list): <Message> sub-class field elements(see FieldElement).
 
     Args:
-        cls_name: Name of <Message> sub-class.
-
-        message_cls: <Message> sub-class instance.
+        message_cls: <Message> sub-class.
     """
 
     message_cls: Any
-    _message: dict
     fields: list = []
     serializers: Serializer
 
-    def __init__(self):
+    @typechecked
+    def __init__(self, message_cls: Any = None):
         """Chain Serializers."""
+        if message_cls is not None:
+            self.message_cls = message_cls
+            self.fields = self.elements()
         self.chain()
 
-    @property
-    def message(self):
-        """Message."""
-        return self._message
-
-    @message.setter
-    def message(self, _message=None):
-        self._message = _message
-        if _message:
-            self.load()
-            self.update_chain()
-
     @property
     def next(self):
         """First link in Serializer Chain."""
         return self.serializers
 
-    def load(self):
-        """Load Message Subclass Attributes.
+    def elements(self) -> list:
+        """Field Elements of <Message> sub-class.
 
-        Attributes:
-            fields(list)<dict>:
-                { bit(int), key(str), field(Field) }
+        Returns:
+            elements(list): type element followed by elements in bit order.
         """
         m_cls = self.message_cls
-        cls_fields = m_cls["_fields"]
-        cls_bits = m_cls["_bits"]
-        cls_length = m_cls["_length"]
-
-        message = self.message if isinstance(self.message, dict) else {}
+        cls_fields = m_cls._fields
+        cls_bits = m_cls._bits
 
         # Get type field
-        type_field = FieldElement(
-            field=cls_fields["type"],
-            key="type",
-            value=message.get("type", None),
-        )
-
-        self.fields.append(type_field)
+        elements = [FieldElement(field=cls_fields["type"], key="type")]
 
-        for x in range(cls_length):
+        for x in range(m_cls._length):
             # Pointer
             pointer = 2**x
 
@@ -150,15 +125,9 @@ class Serializers:
             # Field
             field = cls_fields[key]
 
-            # dict
-            element = FieldElement(
-                field=field,
-                key=key,
-                bit=pointer,
-                value=message.get(key, None),
-            )
+            elements.append(FieldElement(field=field, key=key, bit=pointer))
 
-            self.fields.append(element)
+        return elements
 
     def chain(self) -> None:
         """Chain of Responsibility.
@@ -169,6 +138,7 @@ class Serializers:
         for _, serializer in modulesubclasses(serializers, Serializer):
             self.add_link(serializer)
 
+    @typechecked
     def add_link(self, cls: Type[Serializer]) -> None:
         """Add Chain Link.
 
@@ -180,41 +150,32 @@ class Serializers:
         Args:
             cls (Serializer): Next serializer in Linked List.
         """
-        serializer: Type[Serializer] = cls
-        serializer.fields = [list(field) for field in self.fields]
+        node: Serializer = cls()
+        node.fields = self.fields
+        node.message_cls = self.message_cls
 
         # Defined Fields + built-in 'type' field
-        serializer.message_length = self.message_cls._length + 1
+        node.message_length = self.message_cls._length + 1
 
         if not hasattr(self, "serializers"):
-            self.serializers: Serializer = serializer()
+            self.serializers: Serializer = node
         else:
             pointer = self.serializers
 
             while pointer.next:
                 pointer = pointer.next
-            pointer.next = serializer()
-
-    def update_chain(self):
-        """Update Serializer Chain.
+            pointer.next = node
 
-        * Add Updated Fields to chain.
-        """
-        pointer: Serializer = self.serializers
-        fields = [list(field) for field in self.fields]
-        while pointer.next:
-            pointer.fields = fields
-            pointer: Optional[Callable] = pointer.next
-        pointer.fields = fields
-
-    def run(self) -> tuple:
+    def run(self, message: Any, validation: str = STRICT) -> tuple:
         """Run Method.
 
         * Traverse serializers process or pass to next.
 
+        Args:
+            message(Any): message data(dict | bytes).
+            validation(str): validation mode(see Message.validation).
+
         Returns:
             serialized_data(tuple): (<dict>, <bytes>)
         """
-        _message, _data = self.serializers.load(self.message)
-
-        return self.serializers.load(self.message)
+        return self.serializers.load(message, validation)
@@ -0,0 +1,168 @@
+"""Message Compression.
+
+Opt-in deflate stage of the serializer pipeline(stdlib zlib):
+
+    * Preset dictionary trained from sample messages of a schema.
+    * Bodies smaller than threshold stay uncompressed.
+    * Compressed bodies are marked by the 'compressed' frame flag.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections import Counter
+from typing import Any
+from typing import Iterable
+from typing import Union
+
+from .. import frame as Frame
+from ..constants import FRAME_FLAGS
+from ..decoder.exceptions import MessageTooLarge
+
+
+COMPRESSED = FRAME_FLAGS["compressed"]
+
+# Raw deflate(no zlib header/checksum) keeps small payloads small
+WBITS = -15
+
+
+class Compression:
+    """Message Compression.
+
+    Args:
+        dictionary(bytes): zlib preset dictionary(see train).
+
+        threshold(int): minimum body size(bytes) to compress.
+
+        level(int): zlib compression level.
+
+        max_size(int): maximum decompressed body size(bytes), bounds the
+        memory of untrusted(zip bomb) input.
+    """
+
+    def __init__(
+        self,
+        dictionary: bytes = b"",
+        threshold: int = 32,
+        level: int = 9,
+        max_size: int = 2**20,
+    ) -> None:
+        self.dictionary = dictionary
+        self.threshold = threshold
+        self.level = level
+        self.max_size = max_size
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress Message Body.
+
+        * Identifier & frame header stay uncompressed.
+
+        Args:
+            data(bytes): encoded message.
+
+        Returns:
+            (bytes): compressed message(or data when not smaller).
+        """
+        frame = Frame.split(data)
+        if frame.flags & COMPRESSED or len(frame.body) < self.threshold:
+            return data
+
+        compressor = zlib.compressobj(
+            self.level, zlib.DEFLATED, WBITS, zdict=self.dictionary
+        )
+        body = compressor.compress(frame.body) + compressor.flush()
+
+        if len(body) >= len(frame.body):
+            return data
+
+        return Frame.join(
+            frame._replace(flags=frame.flags | COMPRESSED, body=body)
+        )
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress Message Body.
+
+        Args:
+            data(bytes): encoded message.
+
+        Returns:
+            (bytes): uncompressed message(data when not compressed).
+
+        Raises:
+            MessageTooLarge: body decompresses to more than max_size bytes.
+        """
+        frame = Frame.split(data)
+        if not frame.flags & COMPRESSED:
+            return data
+
+        decompressor = zlib.decompressobj(WBITS, zdict=self.dictionary)
+        body = decompressor.decompress(frame.body, self.max_size + 1)
+        if len(body) > self.max_size or decompressor.unconsumed_tail:
+            raise MessageTooLarge(self.max_size)
+        body += decompressor.flush()
+
+        return Frame.join(
+            frame._replace(flags=frame.flags & ~COMPRESSED, body=body)
+        )
+
+    @classmethod
+    def train(
+        cls,
+        samples: Iterable[Any],
+        size: int = 4096,
+        segment: int = 8,
+        **kwargs: Any,
+    ) -> Compression:
+        """Train Preset Dictionary.
+
+        * Segments shared by most samples are placed last(closest to data).
+
+        Args:
+            samples(Iterable): encoded messages(bytes or <Message>).
+            size(int): max dictionary size in bytes.
+            segment(int): length of counted segments.
+            **kwargs(Any): Compression arguments(threshold, level, max_size).
+
+        Returns:
+            (Compression): compression with trained dictionary.
+        """
+        counts: Counter = Counter()
+
+        for sample in samples:
+            body = Frame.split(bytes(sample)).body
+            # Count each segment once per sample
+            counts.update(
+                {
+                    body[idx : idx + segment]
+                    for idx in range(len(body) - segment + 1)
+                }
+            )
+
+        dictionary = b""
+        for chunk, count in counts.most_common():
+            if len(dictionary) + len(chunk) > size or count < 2:
+                break
+            if chunk not in dictionary:
+                # Most common segment last
+                dictionary = chunk + dictionary
+
+        return cls(dictionary, **kwargs)
+
+    def save(self, path: Union[str, Any]) -> None:
+        """Persist Dictionary."""
+        with open(path, "wb") as file:
+            file.write(self.dictionary)
+
+    @classmethod
+    def load(cls, path: Union[str, Any], **kwargs: Any) -> Compression:
+        """Load Persisted Dictionary.
+
+        Args:
+            path(str, PathLike): dictionary file(see save).
+            **kwargs(Any): Compression arguments(threshold, level, max_size).
+
+        Returns:
+            (Compression): compression with loaded dictionary.
+        """
+        with open(path, "rb") as file:
+            return cls(file.read(), **kwargs)
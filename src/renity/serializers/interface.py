@@ -7,25 +7,33 @@ from typing import Any
 from typing import Optional
 from typing import Type
 
+from renity.constants import SAMPLED
+from renity.constants import STRICT
+from renity.constants import TRUSTED
+from renity.metrics import instrumentation
+
 
 class MessageSerializer(ABC):
     """Message Serializer Interface.
 
-    Attributes:
-        message(dict): deserialized message.
-
-        fields(list): <Message> sub-class fields.
+    * Stateless per call(re-entrant): nodes hold the <Message> sub-class
+      layout only, message/data/validation are passed through.
 
-        data(Any): Encoded message.
+    Attributes:
+        fields(list): <Message> sub-class field elements(see FieldElement).
 
         data_type(type): data type of serializer.
 
         next(MessageSerializer): next node in Serializer Chain.
+
+        message_cls(Message): <Message> sub-class of chain.
+
+        stage(str): instrumentation stage name(see metrics.py).
     """
 
-    _message: dict = {}
+    message_cls: Any = None
+    stage: str = "serialize"
     fields: list = []
-    data: Optional[bytes] = None
     _next: Optional[MessageSerializer] = None
     length = 0
     message_length = 0
@@ -40,58 +48,83 @@ class MessageSerializer(ABC):
             "Serializer sub-classes must have data_type attribute."
         ) from AttributeError
 
-    @property
-    def message(self) -> Optional[dict]:
-        """Message getter."""
-        return self._message
+    def validate(self, _message: dict, validation: str = STRICT) -> tuple:
+        """Validate Message.
 
-    @message.setter
-    def message(self, _message: dict) -> None:
-        """Message setter.
+        Args:
+            _message(dict): message(keys or bits).
+            validation(str): validation mode(see Message.validation).
 
-        Updates:
-            - Message attributes
+        Returns:
+            (tuple): message(key: value), quartets(see Encoder.encode).
+
+        Raises:
+            Exception: invalid value(strict/sampled), counted when sampled.
         """
-        new_message = {}
+        check = validation != TRUSTED
 
-        # Iterate Fields
-        for idx in range(self.message_length):
-            field = self.fields[idx]
+        if validation == SAMPLED:
+            counts = self.message_cls._validation_counts
+            check = counts["messages"] % self.message_cls._sample_rate == 0
+            counts["messages"] += 1
 
-            # <Field>, Key, Current Value, Bit
-            f, key, __, bit = field
+            if check:
+                counts["validated"] += 1
+                try:
+                    return self.resolve(_message, check)
+                except Exception:
+                    counts["failures"] += 1
+                    raise
 
-            # Get value from message
+        return self.resolve(_message, check)
 
-            # Check key
-            _key_value = _message.get(key, None)
+    def resolve(self, _message: dict, check: bool = True) -> tuple:
+        """Resolve Field Values.
 
-            # Check bit
-            _bit_value = _message.get(bit, None)
+        * key -> bit -> default
+        * Validate once(see Field.check)
 
-            # Check Default
-            _field_default = f.default
+        Args:
+            _message(dict): message(keys or bits).
+            check(bool): validate values.
 
-            value = next(
-                (
-                    item
-                    for item in [
-                        _key_value,
-                        _bit_value,
-                        _field_default,
-                    ]
-                    if item is not None
-                ),
-                None,
+        Returns:
+            (tuple): message(key: value), quartets(see Encoder.encode).
+        """
+        # Timed validation(see metrics.py)
+        if check and instrumentation.enabled:
+            return instrumentation.validate(
+                self.message_cls.__name__, self._resolve, _message
             )
 
-            if value:
-                f.validate(value)
+        return self._resolve(_message, check)
+
+    def _resolve(self, _message: dict, check: bool = True) -> tuple:
+        """Resolve Field Values(see resolve)."""
+        new_message = {}
+        quartets = []
+
+        # Iterate Fields(<Field>, Key, Bit)
+        for element in self.fields[: self.message_length]:
+            f, key, bit = element.field, element.key, element.bit
+
+            # Get value from message: key -> bit -> default
+            value = _message.get(key, None)
+            if value is None:
+                value = _message.get(bit, None)
+            if value is None:
+                value = f.default
+
+            # Validate once(see Field.check)
+            if check and value is not None:
+                f.check(value)
+
+            # Encoder input
+            quartets.append((f, key, value, bit))
 
-            # Use key from field to update Dict
-            new_message.update({key: value})
+            new_message[key] = value
 
-        self._message = new_message
+        return new_message, quartets
 
     @property
     def next(self) -> Optional[MessageSerializer]:
@@ -102,7 +135,7 @@ class MessageSerializer(ABC):
     def next(self, _next_node: Any) -> None:
         self._next = _next_node
 
-    def serialize(self, data: Any) -> None:
+    def serialize(self, data: Any, validation: str = STRICT) -> tuple:
         """Serialize Method.
 
         * Must be overriden
@@ -112,13 +145,14 @@ class MessageSerializer(ABC):
         """
         raise NotImplementedError
 
-    def load(self, data: Any) -> tuple:
+    def load(self, data: Any, validation: str = STRICT) -> tuple:
         """Validate Message Processing.
 
         * Validate/Serialize Data or pass to next serializer for processing.
 
         Args:
             data(Any): Data to serialize
+            validation(str): validation mode(see Message.validation).
 
         Returns:
             (tuple): message, bytes.
@@ -129,11 +163,13 @@ class MessageSerializer(ABC):
         pointer: MessageSerializer = self
 
         if isinstance(data, self.data_type):
-            self.serialize(data)
-            return self.message, self.data
+            # Timed stage(see metrics.py)
+            if instrumentation.enabled:
+                return instrumentation.serialize(self, data, validation)
+            return self.serialize(data, validation)
 
         if pointer.next:
-            next: tuple = pointer.next.load(data)
+            next: tuple = pointer.next.load(data, validation)
             return next
         else:
             raise Exception(
@@ -2,9 +2,14 @@
 
 from typing import Optional
 
+from renity.constants import STRICT
 from renity.decoder import decoder as MessageDecoder
+from renity.decoder.exceptions import UnsupportedFrame
 from renity.encoder.encoder import Encoder
+from renity.messages.exceptions import MissingBaseline
 from renity.serializers.interface import MessageSerializer
+from renity.utils import canonical
+from renity.utils import freeze
 
 
 class DictionarySerializer(MessageSerializer):
@@ -14,11 +19,45 @@ class DictionarySerializer(MessageSerializer):
     """
 
     data_type = dict
+    stage = "encode"
 
-    def serialize(self, message: Optional[dict] = None) -> None:
+    def serialize(
+        self, message: Optional[dict] = None, validation: str = STRICT
+    ) -> tuple:
         """Method Override."""
-        self.message = message
-        self.data = Encoder.encode(self.fields)
+        message, quartets = self.validate(message or {}, validation)
+
+        # Fixed-layout struct(see Message.fixed_layout)
+        layout = self.message_cls._layout
+        if layout is not None:
+            return message, layout.pack(quartet[2] for quartet in quartets[1:])
+
+        # Optional encode-result cache(see Message.encode_cache_size)
+        cache = self.message_cls._encode_cache
+        if cache is not None:
+            key = tuple(canonical(quartet[2]) for quartet in quartets)
+            data = cache.get(key)
+            if data is None:
+                data = self.encode(quartets)
+                cache.put(key, data)
+            return message, data
+
+        return message, self.encode(quartets)
+
+    def encode(self, quartets: list) -> bytes:
+        """Encode Fields.
+
+        Args:
+            quartets(list): field, key, value, bit(see Encoder.encode).
+
+        Returns:
+            (bytes): encoded(optionally compressed) message.
+        """
+        data = Encoder.encode(quartets)
+
+        # Optional compression stage
+        compression = self.message_cls._compression
+        return compression.compress(data) if compression else data
 
 
 class ByteSerializer(MessageSerializer):
@@ -28,9 +67,60 @@ class ByteSerializer(MessageSerializer):
     """
 
     data_type = bytes
+    stage = "decode"
 
-    def serialize(self, data: bytes) -> None:
+    def serialize(self, data: bytes, validation: str = STRICT) -> tuple:
         """Method Override."""
-        self.data = data
+        # Optional decode-result cache(see Message.decode_cache_size)
+        cache = self.message_cls._decode_cache
+        max_bytes = self.message_cls._decode_cache_max_bytes
+        if cache is None or len(data) > max_bytes:
+            return self.decode(data, validation), data
+
+        # Unvalidated results are not reused by strict calls
+        cached = cache.get(data)
+        if cached is not None and (cached[1] or validation != STRICT):
+            return cached[0], data
+
+        # Shared between calls: lists/maps are read-only(no copy on hit)
+        message = {
+            key: freeze(value)
+            for key, value in self.decode(data, validation).items()
+        }
+        cache.put(data, (message, validation == STRICT))
+        return message, data
+
+    def decode(self, data: bytes, validation: str = STRICT) -> dict:
+        """Decode Message.
+
+        Returns:
+            (dict): validated message(key: value).
+        """
+        # Fixed-layout struct(see Message.fixed_layout)
+        layout = self.message_cls._layout
+        if layout is not None and layout.match(data):
+            return self.validate(layout.unpack(data), validation)[0]
+
+        # Optional compression stage
+        compression = self.message_cls._compression
+        if compression:
+            data = compression.decompress(data)
+
         # Decode message bytes -> dict
-        self.message = MessageDecoder.decode(data)
+        decoded = MessageDecoder.decode(data)
+
+        # Batch frame is columnar(see messages/batch.py)
+        if "rows" in decoded:
+            raise UnsupportedFrame("Batch", "renity.messages.batch.decode")
+
+        # Delta message requires baseline(see messages/delta.py)
+        if "baseline" in decoded:
+            raise MissingBaseline(decoded["baseline"])
+
+        # Convert wire values(enum index...) -> field values
+        for element in self.fields:
+            bit = element.bit
+            if bit in decoded:
+                decoded[bit] = element.field.decode(decoded[bit])
+
+        return self.validate(decoded, validation)[0]
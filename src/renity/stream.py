@@ -0,0 +1,72 @@
+"""Length-Prefixed Message Streams.
+
+Encoded messages on a byte stream(socket, file):
+
+    * Frame: length(4 byte big-endian unsigned) + encoded message.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import struct
+from typing import BinaryIO
+from typing import Iterator
+from typing import Optional
+
+
+LENGTH = struct.Struct(">I")
+
+
+def pack(data: bytes) -> bytes:
+    """Length-Prefixed Frame."""
+    return LENGTH.pack(len(data)) + data
+
+
+def recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Read Exactly size Bytes(None on closed connection)."""
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv(sock: socket.socket) -> Optional[bytes]:
+    """Read Frame From Socket(None on closed connection)."""
+    header = recv_exact(sock, LENGTH.size)
+    if header is None:
+        return None
+    return recv_exact(sock, LENGTH.unpack(header)[0])
+
+
+async def read(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """Read Frame From Stream(None on closed connection)."""
+    try:
+        header = await reader.readexactly(LENGTH.size)
+        return await reader.readexactly(LENGTH.unpack(header)[0])
+    except asyncio.IncompleteReadError:
+        return None
+
+
+def frames(file: BinaryIO) -> Iterator[bytes]:
+    """Iterate Frames Of File(one frame in memory at a time).
+
+    Raises:
+        EOFError: truncated frame.
+    """
+    while True:
+        header = file.read(LENGTH.size)
+        if not header:
+            return
+        if len(header) < LENGTH.size:
+            raise EOFError("Truncated frame length.")
+
+        size = LENGTH.unpack(header)[0]
+        data = file.read(size)
+        if len(data) < size:
+            raise EOFError(f"Truncated frame: expected {size} bytes.")
+        yield data
@@ -0,0 +1,294 @@
+"""NDJSON <-> Binary Transcoding.
+
+Streams newline-delimited JSON messages to length-prefixed frames(see
+stream.py) and back:
+
+    * Message classes are imported from a module path(by type name;
+      compact type_ids resolve through Registry).
+    * Records are converted in batches, at most 2 * workers batches are
+      in flight(memory is bounded by batch_size, not input size).
+    * workers > 1 converts batches in a process pool, output order is
+      input order.
+    * Enum choices are written by member name, map keys(JSON strings) are
+      converted by the map key_field(see from_json).
+
+Usage:
+    for frame in encode(lines, "app.messages", workers=4):
+        file.write(frame)
+"""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from itertools import islice
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from . import stream
+from .fields.constants import TYPE_ID
+from .inspector import identifier
+from .messages.message import Message
+from .messages.registry import Registry
+from .utils import importsubclasses
+
+
+# Module Vars(per process, see load)
+classes: Dict[str, Type[Message]] = {}
+default_type: Optional[str] = None
+
+
+def load(module: str, _type: Optional[str] = None) -> None:
+    """Load Message Classes Of Module.
+
+    * Called once per worker process(pool initializer).
+
+    Args:
+        module(str): dotted module path of <Message> sub-classes.
+        _type(str): type of records without "type"(default: only class).
+
+    Raises:
+        ValueError: module has no <Message> sub-classes, unknown _type.
+    """
+    global default_type
+
+    classes.clear()
+    classes.update(importsubclasses(module, Message))
+    if not classes:
+        raise ValueError(f"No Message classes in {module}.")
+
+    if _type is None and len(classes) == 1:
+        _type = next(iter(classes))
+    if _type is not None and _type not in classes:
+        raise ValueError(f"Unknown message type {_type!r} in {module}.")
+    default_type = _type
+
+
+def message_cls(name: Optional[str]) -> Type[Message]:
+    """Message Class Of Type Name.
+
+    Raises:
+        ValueError: unknown type name.
+    """
+    try:
+        return classes[name or default_type]  # type: ignore[index]
+    except KeyError:
+        raise ValueError(f"Unknown message type {name!r}.") from None
+
+
+def to_json(value: Any) -> Any:
+    """Field Value To JSON Value(Enum members by name)."""
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, Mapping):
+        return {to_json(key): to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in value]
+    return value
+
+
+def from_json(field: Any, value: Any) -> Any:
+    """JSON Value To Field Value(see to_json).
+
+    * Enum member names -> members, map keys -> key_field type.
+    * Unconvertible values are left for field validation.
+    """
+    if value is None:
+        return None
+
+    if hasattr(field, "choices"):
+        return choice(field, value)
+
+    key_field = getattr(field, "key_field", None)
+    if key_field is not None and isinstance(value, dict):
+        value_field = field.value_field
+        return {
+            from_key(key_field, key): from_json(value_field, item)
+            for key, item in value.items()
+        }
+
+    subs = field.sub_fields
+    if subs and field.sorted and isinstance(value, list):
+        items = [from_json(sub, item) for sub, item in zip(subs, value)]
+        return items + value[len(subs) :]
+
+    return value
+
+
+def choice(field: Any, value: Any) -> Any:
+    """Enum Member Of Name(choices by value are kept)."""
+    if not isinstance(value, str) or value in field.index:
+        return value
+    for member in field.choices:
+        if isinstance(member, Enum) and member.name == value:
+            return member
+    return value
+
+
+def from_key(key_field: Any, key: str) -> Any:
+    """Map Key Of JSON Object Key."""
+    if hasattr(key_field, "choices"):
+        return choice(key_field, key)
+
+    data_type = key_field.data_type
+    if data_type is bool:
+        return {"true": True, "false": False}.get(key, key)
+    if data_type in (int, float):
+        try:
+            return data_type(key)
+        except ValueError:
+            return key
+    return key
+
+
+def encode_record(line: str) -> bytes:
+    """NDJSON Line To Frame."""
+    value = json.loads(line)
+    m_cls = message_cls(value.get("type"))
+    fields = m_cls._fields
+    message = {
+        key: from_json(fields[key], item) if key in fields else item
+        for key, item in value.items()
+    }
+    return stream.pack(bytes(m_cls(message)))
+
+
+def decode_record(data: bytes) -> str:
+    """Encoded Message To NDJSON Line."""
+    head = identifier(data)
+    if head.field == TYPE_ID:
+        m_cls: Any = Registry.messages.get(head.value)
+        if m_cls is None:
+            raise ValueError(f"Unknown message type_id {head.value}.")
+    else:
+        m_cls = message_cls(head.value)
+    return json.dumps(to_json(m_cls(data).message)) + "\n"
+
+
+def convert(fn: Callable, batch: Tuple[int, list]) -> list:
+    """Convert Batch.
+
+    Args:
+        fn(callable): encode_record | decode_record.
+        batch(tuple): record number of first record, records.
+
+    Raises:
+        ValueError: record failed to convert(with record number).
+    """
+    start, records = batch
+    result = []
+    for number, record in enumerate(records, start):
+        try:
+            result.append(fn(record))
+        except Exception as e:
+            # Plain ValueError(renity exceptions may not pickle)
+            raise ValueError(
+                f"Record {number}: {type(e).__name__}: {e}"
+            ) from None
+    return result
+
+
+def batches(records: Iterable, batch_size: int) -> Iterator[Tuple[int, list]]:
+    """Numbered Batches(record numbers start at 1)."""
+    records = iter(records)
+    start = 1
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield start, batch
+        start += len(batch)
+
+
+def transcode(
+    fn: Callable,
+    records: Iterable,
+    module: str,
+    _type: Optional[str] = None,
+    workers: int = 1,
+    batch_size: int = 1000,
+) -> Iterator:
+    """Convert Records In Batches.
+
+    Args:
+        fn(callable): encode_record | decode_record.
+        records(Iterable): input records.
+        module(str): dotted module path of <Message> sub-classes.
+        _type(str): type of records without "type".
+        workers(int): processes(1 = in process).
+        batch_size(int): records per batch.
+
+    Yields:
+        (Any): converted records, in input order.
+    """
+    if workers <= 1:
+        load(module, _type)
+        for batch in batches(records, batch_size):
+            yield from convert(fn, batch)
+        return
+
+    # Fail early(import errors) before starting workers
+    load(module, _type)
+
+    with ProcessPoolExecutor(
+        workers, initializer=load, initargs=(module, _type)
+    ) as pool:
+        pending: deque = deque()
+        for batch in batches(records, batch_size):
+            pending.append(pool.submit(convert, fn, batch))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def encode(
+    lines: Iterable[str],
+    module: str,
+    _type: Optional[str] = None,
+    workers: int = 1,
+    batch_size: int = 1000,
+) -> Iterator[bytes]:
+    """NDJSON Lines To Length-Prefixed Frames(blank lines skipped).
+
+    Args:
+        lines(Iterable[str]): JSON message per line.
+        module(str): dotted module path of <Message> sub-classes.
+        _type(str): type of lines without "type".
+        workers(int): processes(1 = in process).
+        batch_size(int): lines per batch.
+
+    Yields:
+        (bytes): frame.
+    """
+    records = (line for line in lines if line.strip())
+    return transcode(encode_record, records, module, _type, workers, batch_size)
+
+
+def decode(
+    frames: Iterable[bytes],
+    module: str,
+    workers: int = 1,
+    batch_size: int = 1000,
+) -> Iterator[str]:
+    """Encoded Messages To NDJSON Lines.
+
+    Args:
+        frames(Iterable[bytes]): encoded messages(see stream.frames).
+        module(str): dotted module path of <Message> sub-classes.
+        workers(int): processes(1 = in process).
+        batch_size(int): messages per batch.
+
+    Yields:
+        (str): JSON message line.
+    """
+    return transcode(decode_record, frames, module, None, workers, batch_size)
@@ -1,11 +1,17 @@
 """Renity Utils."""
 
+from collections import OrderedDict
+from importlib import import_module
 from inspect import getmembers
 from inspect import isclass
+from threading import Lock
+from types import MappingProxyType
 from types import ModuleType
 from typing import Any
 from typing import Callable
+from typing import Iterable
 from typing import Optional
+from typing import Tuple
 from typing import Type
 
 
@@ -41,6 +47,22 @@ def modulesubclasses(__module: ModuleType, _type: Any) -> list:
     return getmembers(__module, lambda cls: subclassonly(cls, _type))
 
 
+def importsubclasses(path: str, _type: Any) -> dict:
+    """Import Module Subclasses.
+
+    Args:
+        path(str): dotted module path.
+        _type(Any): Object Type
+
+    Returns:
+        dict: class name, class
+    """
+    return {
+        cls.__name__: cls
+        for _, cls in modulesubclasses(import_module(path), _type)
+    }
+
+
 class Inventory:
     """Inventory Object.
 
@@ -86,3 +108,165 @@ class Inventory:
         """Return all values."""
         for _, val in self.__value.items():
             yield from val["values"]
+
+
+class LRUCache:
+    """Bounded LRU Cache(thread-safe).
+
+    Attributes:
+        maxsize(int): max number of entries.
+
+        hits(int): lookups found in cache.
+
+        misses(int): lookups not found in cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__value: OrderedDict = OrderedDict()
+        self.__lock = Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get Cached Value(counts hit/miss)."""
+        with self.__lock:
+            try:
+                value = self.__value[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self.__value.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Cache Value(evict least recently used)."""
+        with self.__lock:
+            self.__value[key] = value
+            self.__value.move_to_end(key)
+            if len(self.__value) > self.maxsize:
+                self.__value.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove All Entries & Reset Counters."""
+        with self.__lock:
+            self.__value.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of Entries."""
+        return len(self.__value)
+
+
+def canonical(value: Any) -> Any:
+    """Canonical Hashable Form.
+
+    * Distinguishes values that compare equal but encode differently
+      (1/True/1.0, 0.0/-0.0, list/dict order).
+
+    Args:
+        value(Any): validated field value.
+
+    Returns:
+        (Any): hashable key.
+    """
+    _type = type(value)
+    if _type is float:
+        return (_type, value.hex())
+    if _type in (list, tuple):
+        return (list, tuple(canonical(v) for v in value))
+    if _type in (dict, MappingProxyType):
+        return (
+            dict,
+            tuple((canonical(k), canonical(v)) for k, v in value.items()),
+        )
+    return (_type, value)
+
+
+def freeze(value: Any) -> Any:
+    """Read-Only Form(shared decode-cache results).
+
+    * list -> tuple, dict -> MappingProxyType(recursive).
+    """
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {key: freeze(item) for key, item in value.items()}
+        )
+    return value
+
+
+class StringRef(int):
+    """String Table Reference(index of previously sent string)."""
+
+
+class StringDef(str):
+    """String Table Definition(string assigned next table index)."""
+
+
+def pack_varints(
+    values: Iterable[int], out: Optional[bytearray] = None
+) -> bytearray:
+    """Pack Varints.
+
+    * Little-endian 7-bit groups, MSB continuation(same as Encoder.varint).
+
+    Args:
+        values(Iterable[int]): non-negative integers.
+        out(bytearray): buffer to append to.
+
+    Returns:
+        out(bytearray): buffer.
+    """
+    if out is None:
+        out = bytearray()
+    append = out.append
+    for value in values:
+        while value > 0x7F:
+            append((value & 0x7F) | 0x80)
+            value >>= 7
+        append(value)
+    return out
+
+
+def unpack_varints(data: bytes, pos: int, count: int) -> Tuple[list, int]:
+    """Unpack Varints.
+
+    Args:
+        data(bytes): buffer.
+        pos(int): byte offset of first varint.
+        count(int): number of varints.
+
+    Returns:
+        (tuple): values(list), byte offset after last varint.
+    """
+    values = []
+    append = values.append
+    for _ in range(count):
+        value = shift = 0
+        byte = 0x80
+        while byte & 0x80:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+        append(value)
+    return values, pos
+
+
+def zigzag(value: int) -> int:
+    """ZigZag Encode Signed Integer(arbitrary size)."""
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def unzigzag(value: int) -> int:
+    """ZigZag Decode Signed Integer."""
+    return (value >> 1) ^ -(value & 1)
+
+
+def bits_to_bytes(bits: str) -> bytes:
+    """Bytes From Bit-Str(see Encoder)."""
+    return int(bits, 2).to_bytes(len(bits) // 8, "big") if bits else b""
@@ -2,9 +2,11 @@
 
 from ..fields.constants import EMPTY_LIST_FIELD
 from ..fields.constants import INCORRECT_MESSAGE_TYPE
+from ..fields.constants import INVALID_CHOICE
 from ..fields.constants import MISSING_PRIMITIVE
 from ..fields.constants import REQUIRED_MESSAGE_FIELD
 from ..fields.constants import TOO_MANY_VALUES
+from ..fields.constants import VALUE_OUT_OF_RANGE
 
 
 class MissingPrimitiveException(Exception):
@@ -70,3 +72,25 @@ class TooManyValues(Exception):
         super().__init__(_message)
         self.code = TOO_MANY_VALUES
         self.message = _message
+
+
+class ValueOutOfRange(Exception):
+    """Field Exception."""
+
+    def __init__(self, value: int, minimum: int, maximum: int):
+        _message = f"ValueOutOfRange: Expected value between {minimum} and {maximum} but found {value}."
+        super().__init__(_message)
+        self.code = VALUE_OUT_OF_RANGE
+        self.message = _message
+
+
+class InvalidChoice(Exception):
+    """Field Exception."""
+
+    def __init__(self, value, choices):
+        _message = (
+            f"InvalidChoice: Expected one of {choices} but found {value}."
+        )
+        super().__init__(_message)
+        self.code = INVALID_CHOICE
+        self.message = _message
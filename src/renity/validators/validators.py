@@ -6,12 +6,17 @@ Subclasses of type Validator
 from __future__ import annotations
 
 from inspect import isclass
+from math import isfinite
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
 
 from renity.validators.interface import Validator
 
-from ..utils import Inventory
 from .exceptions import RequiredMessageField
 from .exceptions import TooManyValues
+from .exceptions import ValueOutOfRange
 
 
 class RequiredField(Validator):
@@ -96,8 +101,71 @@ class OverflowValidator(Validator):
         return super().verify(request)
 
 
+class MapValidator(Validator):
+    """Validate Map Keys/Values.
+
+    Ensure Map LEN has key/value fields and each item matches them.
+    """
+
+    def __init__(self, field, **_):
+        self._field = field
+        self._data_type = dict
+
+    def verify(self, request):
+        """Verify Field."""
+        key_field = self._field.key_field
+        value_field = self._field.value_field
+
+        # Missing key/value fields
+        if key_field is None or value_field is None:
+            raise TypeError(
+                "Missing key_field/value_field argument of type: <Field>"
+            )
+
+        if request is not None:
+            for key, value in request.items():
+                key_field.validate(key)
+                value_field.validate(value)
+
+        return super().verify(request)
+
+
+class RangeValidator(Validator):
+    """Validate Fixed-Width Integer Range.
+
+    Ensure value is an int(not bool) within field's minimum/maximum.
+    """
+
+    def verify(self, request):
+        """Verify Field."""
+        if isinstance(request, bool):
+            raise TypeError(f"Expected {int} but found {bool}.")
+        low, high = self._field.minimum, self._field.maximum
+        if request is not None and not low <= request <= high:
+            raise ValueOutOfRange(request, low, high)
+        return super().verify(request)
+
+
+class FloatRangeValidator(Validator):
+    """Validate Fixed-Width Float Range.
+
+    Ensure finite value fits within field's minimum/maximum(inf/nan pass).
+    """
+
+    def verify(self, request):
+        """Verify Field."""
+        low, high = self._field.minimum, self._field.maximum
+        if request is not None and isfinite(request):
+            if not low <= request <= high:
+                raise ValueOutOfRange(request, low, high)
+        return super().verify(request)
+
+
 class UnorderedValidator(Validator):
-    """Validate Unorderd Packed List Elements(experimental)."""
+    """Validate Unordered Packed List Elements.
+
+    Match values to sub-fields by type(see Field.match).
+    """
 
     def __init__(self, field, **_):
         self._field = field
@@ -105,16 +173,17 @@ class UnorderedValidator(Validator):
 
     def verify(self, request):
         """Verify Field."""
-        valid = Inventory()
-        for v in request:
-            valid.add(str(type(v)), v)
-        for sub in self._field.sub_fields:
-            _type = str(sub.data_type)
-            item = valid.pop(_type)
+        pairs, unexpected, missing = self._field.match(request)
+
+        if unexpected:
+            raise TypeError(f"Unexpected value(s) of {unexpected}")
+
+        for sub, item in pairs:
             sub.validate(item)
 
-        if len(valid):
-            raise TypeError(f"Unexpected value(s) of {list(valid)}")
+        # Absent sub-field values(required check)
+        for sub in missing:
+            sub.validate(None)
 
         return super().verify(request)
 
@@ -131,3 +200,123 @@ class MessageTypeValidator(Validator):
             )
 
         return super().verify(request)
+
+
+def required_step(field: Any, link: Validator) -> Callable:
+    """Inlined RequiredField."""
+
+    def required(value):
+        if value is None:
+            raise RequiredMessageField(field.key, field.__class__)
+
+    return required
+
+
+def typed_step(field: Any, link: Validator) -> Callable:
+    """Inlined IncorrectFieldType."""
+    data_type = link._data_type
+
+    def typed(value):
+        if value is not None and not isinstance(value, data_type):
+            raise TypeError(f"Expected {data_type} but found {type(value)}.")
+
+    return typed
+
+
+def overflow_step(field: Any, link: Validator) -> Callable:
+    """Inlined OverflowValidator."""
+    subs = len(field.sub_fields)
+
+    def overflow(value):
+        _input = len(value)
+        if subs < _input:
+            raise TooManyValues(subs, _input)
+
+    return overflow
+
+
+def sub_field_step(field: Any, link: Validator) -> Optional[Callable]:
+    """SubFieldValidator(schema check resolved once, None when valid)."""
+    try:
+        SubFieldValidator(field).verify(None)
+    except TypeError:
+        return SubFieldValidator(field).verify
+    return None
+
+
+def standalone_step(field: Any, link: Validator) -> Callable:
+    """Standalone Link(no _next) verifies only itself."""
+    return type(link)(field=field, data_type=link._data_type).verify
+
+
+# Built-in validator: compiled step(see compile_chain)
+STEPS: Dict[type, Callable] = {
+    RequiredField: required_step,
+    IncorrectFieldType: typed_step,
+    OverflowValidator: overflow_step,
+    SubFieldValidator: sub_field_step,
+}
+
+
+def compile_chain(field: Any) -> Callable[[Any], bool]:
+    """Compile Validation Chain.
+
+    * Flattens field.validator chain(+ sorted sub-fields) into one callable.
+    * Built-in validators are inlined(see STEPS), others verified as
+      standalone links.
+    * SubFieldValidator(schema check) is resolved once at compile time.
+
+    Args:
+        field(Field): field with validator chain.
+
+    Returns:
+        (callable): check(value) -> True, raises on invalid value.
+    """
+    steps = []
+    link = field.validator._next
+
+    while link:
+        step = STEPS.get(type(link), standalone_step)(field, link)
+        if step is not None:
+            steps.append(step)
+        link = link._next
+
+    # Invalid sub-field(not <Field>) fails on use, as SubFieldValidator would
+    sub_checks = tuple(
+        getattr(sub, "check", None)
+        or (lambda item, sub=sub: sub.validate(item))
+        for sub in field.sub_fields
+        if field.sorted
+    )
+
+    return combine(steps, sub_checks)
+
+
+def combine(steps: list, sub_checks: tuple) -> Callable[[Any], bool]:
+    """Single Check Of Compiled Steps & Sub-Field Checks.
+
+    Returns:
+        (callable): check(value) -> True, raises on invalid value.
+    """
+    # Fast paths
+    if not sub_checks:
+        if not steps:
+            return lambda value: True
+
+        if len(steps) == 1:
+            step = steps[0]
+
+            def single(value):
+                step(value)
+                return True
+
+            return single
+
+    def check(value):
+        for step in steps:
+            step(value)
+        for idx, sub_check in enumerate(sub_checks):
+            sub_check(value[idx])
+        return True
+
+    return check
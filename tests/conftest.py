@@ -34,10 +34,17 @@ def invalid_dictionary_test_message_dict() -> dict:
     test_dict = {
         "IntField": 3.14,
         "BoolField": "Hello World",
+        "EnumField": [],
         # List Values in alpha ordersame as field_classes fixture
         # [BoolField, FloatField, IntField, StringField, TypeField...]
         "ListField": True,
+        "MapField": [],
         "FloatField": 144,
+        "Float32Field": 144,
+        "Fixed32Field": 3.14,
+        "SFixed32Field": "Hello World",
+        "Fixed64IntField": 3.14,
+        "SFixed64IntField": [],
         "StringField": [],
         "type": 144,
     }
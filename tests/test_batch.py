@@ -0,0 +1,97 @@
+"""Renity Batch Message(s) Unit Test Module."""
+
+import pytest
+
+from renity.decoder.exceptions import UnsupportedFrame
+from renity.fields import fields
+from renity.messages import batch
+from renity.messages.message import Message
+from renity.validators.exceptions import RequiredMessageField
+
+
+class RowMessage(Message):
+    """Row Message Subclass."""
+
+    x = fields.FloatField()
+    y = fields.Float32Field()
+    hp = fields.IntField(default=100)
+    alive = fields.BoolField()
+    name = fields.StringField()
+    items = fields.ListField(fields.IntField(), fields.StringField())
+    counts = fields.MapField(fields.StringField(), fields.IntField())
+    digest = fields.Fixed64IntField()
+
+
+class RequiredRowMessage(Message):
+    """Required Row Message Subclass."""
+
+    a = fields.IntField(required=True)
+    b = fields.IntField()
+
+
+def rows(count):
+    """Generate Row Dicts."""
+    return [
+        {
+            "type": "RowMessage",
+            "x": idx / 2,
+            "y": 0.25,
+            "hp": 100 - idx * 7,
+            "alive": bool(idx % 2),
+            "name": f"player-{idx}" if idx % 3 else None,
+            "items": [idx, "sword"],
+            "counts": {"arrow": idx},
+            "digest": 2**64 - 1 - idx,
+        }
+        for idx in range(count)
+    ]
+
+
+def test_batch_round_trip():
+    """Test Columnar Batch De/serialization."""
+    dcts = rows(20)
+    messages = [RowMessage(dct) for dct in dcts[:10]] + dcts[10:]
+
+    data = batch.encode(RowMessage, messages)
+    decoded = batch.decode(RowMessage, data)
+
+    assert decoded == dcts
+
+    # Columnar decode
+    count, columns = batch.columns(RowMessage, data)
+    assert count == 20
+    assert columns["hp"] == [dct["hp"] for dct in dcts]
+
+    # Smaller than independent encodes
+    assert len(data) < sum(len(bytes(RowMessage(dct))) for dct in dcts)
+
+
+def test_batch_absent_columns():
+    """Test Absent Values Restored From Defaults."""
+    data = batch.encode(RowMessage, [{"x": 1.0}, {"x": 2.0, "hp": -5}])
+
+    decoded = batch.decode(RowMessage, data)
+    assert [row["hp"] for row in decoded] == [100, -5]
+    assert decoded[0]["name"] is None
+
+    assert batch.decode(RowMessage, batch.encode(RowMessage, [])) == []
+
+
+def test_batch_missing_required():
+    """Test Missing Required Field In Dict Row."""
+    with pytest.raises(RequiredMessageField):
+        batch.encode(RequiredRowMessage, [{"a": 1}, {"b": 2}])
+
+
+def test_batch_frame_errors():
+    """Test Batch/Message Frame Mismatch."""
+    data = batch.encode(RowMessage, rows(2))
+
+    with pytest.raises(UnsupportedFrame):
+        RowMessage(data)
+
+    with pytest.raises(UnsupportedFrame):
+        batch.decode(RowMessage, bytes(RowMessage({"x": 1.0})))
+
+    with pytest.raises(TypeError):
+        batch.encode(RowMessage, [{"type": "Other", "x": 1.0}])
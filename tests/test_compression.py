@@ -0,0 +1,95 @@
+"""Renity Compression Unit Test Module."""
+
+import pytest
+
+from renity import frame
+from renity.constants import FRAME_FLAGS
+from renity.decoder.exceptions import MessageTooLarge
+from renity.decoder.exceptions import UnsupportedFrame
+from renity.fields import fields
+from renity.messages.message import Message
+from renity.serializers.compression import Compression
+
+
+class ChatMessage(Message):
+    """Chat Message Subclass."""
+
+    channel = fields.StringField()
+    author = fields.StringField()
+    text = fields.StringField()
+
+
+def samples():
+    """Sample Chat Dicts."""
+    return [
+        {
+            "channel": "world-chat-global",
+            "author": f"player-{idx}",
+            "text": f"looking for group to run the dungeon {idx}",
+        }
+        for idx in range(50)
+    ]
+
+
+def test_compression_round_trip(tmp_path):
+    """Test Trained Dictionary Compression."""
+    corpus = [ChatMessage(dct) for dct in samples()]
+    compression = Compression.train(corpus, size=1024, threshold=16)
+
+    assert 0 < len(compression.dictionary) <= 1024
+
+    # Persist dictionary
+    path = tmp_path / "chat.dict"
+    compression.save(path)
+    assert Compression.load(path).dictionary == compression.dictionary
+
+    class CompressedChatMessage(Message):
+        compression = Compression.load(path, threshold=16)
+        channel = fields.StringField()
+        author = fields.StringField()
+        text = fields.StringField()
+
+    dct = {
+        "channel": "world-chat-global",
+        "author": "player-99",
+        "text": "looking for group to run the dungeon 99",
+    }
+
+    compressed = bytes(CompressedChatMessage(dct))
+    plain = bytes(ChatMessage(dct))
+
+    assert frame.split(compressed).flags & FRAME_FLAGS["compressed"]
+    assert len(compressed) < len(plain) - len("CompressedChat") + len("Chat")
+
+    decoded = CompressedChatMessage(compressed).message
+    assert decoded == {"type": "CompressedChatMessage", **dct}
+
+    # Below threshold stays uncompressed
+    small = bytes(CompressedChatMessage({"author": "a"}))
+    assert not frame.split(small).flags
+
+    # Uncompressed payloads are accepted
+    assert CompressedChatMessage(small).author == "a"
+
+
+def test_compressed_frame_requires_compression():
+    """Test Compressed Frame Without Compression Stage."""
+    compression = Compression(b"looking for group", threshold=0)
+    data = compression.compress(bytes(ChatMessage(samples()[0])))
+
+    assert compression.decompress(data) == bytes(ChatMessage(samples()[0]))
+
+    with pytest.raises(UnsupportedFrame):
+        ChatMessage(data)
+
+
+def test_decompress_max_size():
+    """Test Decompressed Size Bound."""
+    data = bytes(ChatMessage({"text": "a" * 4096}))
+    compressed = Compression(threshold=0).compress(data)
+
+    assert len(compressed) < 100
+    assert Compression(max_size=4200).decompress(compressed) == data
+
+    with pytest.raises(MessageTooLarge):
+        Compression(max_size=1024).decompress(compressed)
@@ -0,0 +1,95 @@
+"""Renity Decoder Unit Tests Module."""
+
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+from renity.decoder import decoder
+from renity.fields import fields
+from renity.messages.message import Message
+
+
+class CachedDecodeMessage(Message):
+    """Test Message Subclass."""
+
+    decode_cache_size = 4
+    x = fields.FloatField()
+    tags = fields.ListField(fields.IntField(), fields.IntField())
+    counts = fields.MapField(fields.StringField(), fields.IntField())
+
+
+def test_decode_cache(monkeypatch):
+    """Test Decode-Result Cache."""
+    dct = {"x": 0.5, "tags": [1, 2], "counts": {"a": 1}}
+    data = bytes(CachedDecodeMessage(dct))
+    cache = CachedDecodeMessage.decode_cache
+
+    first = CachedDecodeMessage(data)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # Hit bypasses decoding
+    monkeypatch.setattr(decoder, "decode", None)
+    second = CachedDecodeMessage(data)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second.message == first.message
+    monkeypatch.undo()
+
+    # Shared read-only values(no copy)
+    assert second.tags is first.tags
+    assert second.tags == (1, 2)
+    assert isinstance(second.counts, MappingProxyType)
+
+    # Read-only values re-encode
+    assert bytes(CachedDecodeMessage(second.message)) == data
+    assert second.update({"x": 1.5}).counts == {"a": 1}
+
+    # Trusted results are not reused by strict calls
+    calls = []
+    decode = decoder.decode
+    monkeypatch.setattr(
+        decoder, "decode", lambda _bits: calls.append(_bits) or decode(_bits)
+    )
+    other = bytes(CachedDecodeMessage({"x": 2.5}))
+    CachedDecodeMessage(other, validation="trusted")
+    CachedDecodeMessage(other, validation="trusted")
+    CachedDecodeMessage(other)
+    CachedDecodeMessage(other)
+    assert len(calls) == 2
+    monkeypatch.undo()
+
+    # Large payload bypasses cache
+    class LargeMessage(CachedDecodeMessage):
+        decode_cache_max_bytes = 8
+
+    LargeMessage(bytes(LargeMessage(dct)))
+    large_cache = LargeMessage.decode_cache
+    assert (large_cache.hits, large_cache.misses) == (0, 0)
+
+    # Disabled by default
+    assert Message.decode_cache is None
+
+
+def test_concurrent_decode():
+    """Test Per-Thread Decoder State."""
+
+    class ThreadedMessage(Message):
+        x = fields.IntField()
+        name = fields.StringField()
+        tags = fields.ListField(fields.IntField(), fields.StringField())
+
+    messages = [
+        {
+            "type": "ThreadedMessage",
+            "x": idx,
+            "name": str(idx),
+            "tags": [idx, "t"],
+        }
+        for idx in range(200)
+    ]
+    encoded = [bytes(ThreadedMessage(message)) for message in messages]
+
+    with ThreadPoolExecutor(8) as pool:
+        decoded = list(
+            pool.map(lambda data: ThreadedMessage(data).message, encoded)
+        )
+
+    assert decoded == messages
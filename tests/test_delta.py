@@ -0,0 +1,72 @@
+"""Renity Delta Message(s) Unit Test Module."""
+
+import pytest
+
+from renity.fields import fields
+from renity.messages.delta import DeltaDecoder
+from renity.messages.delta import DeltaEncoder
+from renity.messages.exceptions import MissingBaseline
+from renity.messages.message import Message
+
+
+class StateMessage(Message):
+    """State Message Subclass."""
+
+    x = fields.FloatField()
+    y = fields.FloatField()
+    hp = fields.IntField(default=100)
+    name = fields.StringField()
+
+
+def test_delta_round_trip():
+    """Test Delta Frames Reconstruct Full Message."""
+    encoder = DeltaEncoder(StateMessage, keyframe_interval=2)
+    decoder = DeltaDecoder(StateMessage)
+
+    states = [
+        {"x": 1.0, "y": 2.0, "hp": 50, "name": "Player"},
+        {"x": 1.5, "y": 2.0, "hp": 50, "name": "Player"},
+        # Changed back to default(not elided in delta)
+        {"x": 1.5, "y": 2.0, "hp": 100, "name": "Player"},
+        {"x": 2.0, "y": 2.0, "hp": 100, "name": "Player"},
+    ]
+
+    frames = [encoder.encode(state) for state in states]
+
+    # Keyframe, delta, delta, keyframe
+    assert len(frames[1]) < len(frames[0])
+    assert len(frames[2]) < len(frames[0])
+    assert len(frames[3]) > len(frames[2])
+
+    for state, frame in zip(states, frames):
+        assert decoder.decode(frame).message == {
+            "type": "StateMessage",
+            **state,
+        }
+
+
+def test_delta_baseline_history():
+    """Test Bounded Baseline History."""
+    encoder = DeltaEncoder(StateMessage, history=2)
+    decoder = DeltaDecoder(StateMessage, history=1)
+
+    first = encoder.encode({"x": 1.0, "y": 1.0, "name": "a"})
+    encoder.encode({"x": 2.0, "y": 1.0, "name": "a"})
+    encoder.encode({"x": 3.0, "y": 1.0, "name": "a"})
+
+    assert list(encoder.history) == [1, 2]
+
+    # Delta against explicit baseline(acknowledged by receiver)
+    delta = encoder.encode({"x": 4.0, "y": 1.0, "name": "a"}, baseline=2)
+
+    decoder.decode(first)
+    with pytest.raises(MissingBaseline):
+        decoder.decode(delta)
+
+    # Delta requires DeltaDecoder
+    with pytest.raises(MissingBaseline):
+        StateMessage(delta)
+
+    # Baseline no longer in history -> keyframe
+    keyframe = encoder.encode({"x": 5.0, "y": 1.0, "name": "a"}, baseline=0)
+    assert decoder.decode(keyframe).x == 5.0
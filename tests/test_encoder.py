@@ -0,0 +1,48 @@
+"""Renity Encoder Unit Test Module."""
+
+from enum import Enum
+
+import pytest
+
+from renity.encoder.encoder import Encoder
+from renity.fields import fields
+from renity.utils import StringDef
+from renity.utils import StringRef
+
+
+class Color(Enum):
+    """Test Enum."""
+
+    RED = 0
+    GREEN = 1
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        (fields.IntField(), 0),
+        (fields.IntField(), 300),
+        (fields.IntField(), -300),
+        (fields.BoolField(), True),
+        (fields.FloatField(), 3.14),
+        (fields.Float32Field(), 3.14),
+        (fields.SFixed64IntField(), -1),
+        (fields.EnumField(Color), Color.GREEN),
+        (fields.StringField(), "Hello World"),
+        (fields.ListField(fields.IntField(), fields.StringField()), [1, "a"]),
+        (
+            fields.MapField(fields.StringField(), fields.IntField()),
+            {"potion": 3, "arrow": 2**20},
+        ),
+        (
+            fields.MapField(fields.StringField(), fields.StringField()),
+            {StringDef("potion"): StringRef(300), StringRef(1): "arrow"},
+        ),
+    ],
+)
+def test_record_size(field, value):
+    """Test Size Computation Matches Encoded Record."""
+    field.value = value
+    record = Encoder.protocol(field)(value, field)
+
+    assert Encoder.size(value, field) == len(record) // 8
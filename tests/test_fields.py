@@ -1,5 +1,6 @@
 """Renity Field(s) Unit Test Module."""
 
+from enum import Enum
 from typing import Any
 from typing import Optional
 
@@ -7,9 +8,12 @@ import pytest
 
 from renity.constants import FIELDS
 from renity.constants import WIRE_TYPES
+from renity.decoder.exceptions import InvalidChoiceIndex
 from renity.fields import fields
 from renity.fields.interface import Field
 from renity.utils import modulesubclasses
+from renity.validators.exceptions import InvalidChoice
+from renity.validators.exceptions import ValueOutOfRange
 from renity.validators.interface import Validator
 from renity.validators.validators import IncorrectFieldType
 from renity.validators.validators import RequiredField
@@ -57,35 +61,66 @@ def test_all_fields_used_in_test_dict(
     valid_dct = {
         "IntField": 144,
         "BoolField": False,
-        "ListField": [True, 3.14, 144, "Hello World"],
+        "EnumField": "Idle",
+        "ListField": [
+            True,
+            "Running",
+            4294967295,
+            18446744073709551615,
+            3.14,
+            3.14,
+            144,
+            -2147483648,
+            -9223372036854775808,
+            "Hello World",
+        ],
+        "MapField": {"Hello World": 144},
         "FloatField": 3.14,
+        "Float32Field": 3.14,
+        "Fixed32Field": 4294967295,
+        "SFixed32Field": -2147483648,
+        "Fixed64IntField": 18446744073709551615,
+        "SFixed64IntField": -9223372036854775808,
         "StringField": "Hello World",
         "type": "TestMessage",
     }
 
+    # Fields requiring arguments
+    field_kwargs = {
+        "EnumField": {"choices": ("Idle", "Running")},
+        "MapField": {
+            "key_field": fields.StringField(),
+            "value_field": fields.IntField(),
+        },
+    }
+
     def sub_fields(_type):
         subs = []
         if _type is list:
             for _, f in field_classes:
-                if f.data_type is not list and _ != "TypeField":
-                    subs.append(f())
+                if f.data_type not in (list, dict) and _ != "TypeField":
+                    subs.append(f(**field_kwargs.get(_, {})))
 
         return subs
 
     for n, field in field_classes:
-        test_field = field(*sub_fields(field.data_type))
+        test_field = field(
+            *sub_fields(field.data_type), **field_kwargs.get(n, {})
+        )
 
         name = n
 
         # 'type' field case
         if name == "TypeField":
             name = "type"
+            test_field.message_cls = "TestMessage"
 
         # Test valid value
         assert test_field.validate(valid_dct[name]) is True
 
-        # Test invalid value
-        with pytest.raises(TypeError):
+        # Test invalid value(choice fields check membership, not type)
+        error = InvalidChoice if name == "EnumField" else TypeError
+        with pytest.raises(error):
             test_field.validate(invalid_dictionary_test_message_dict[name])
 
     # Test valid_test_dict_length == field_subclasses_length == invalid_test_dict_length
@@ -96,6 +131,78 @@ def test_all_fields_used_in_test_dict(
     )
 
 
+@pytest.mark.parametrize(
+    "field, low, high",
+    [
+        (fields.Fixed32Field, 0, 2**32 - 1),
+        (fields.SFixed32Field, -(2**31), 2**31 - 1),
+        (fields.Fixed64IntField, 0, 2**64 - 1),
+        (fields.SFixed64IntField, -(2**63), 2**63 - 1),
+    ],
+)
+def test_fixed_width_range(field, low, high):
+    """Test Fixed-Width Integer Field Range."""
+    test_field = field()
+
+    assert test_field.validate(low) is True
+    assert test_field.validate(high) is True
+
+    with pytest.raises(ValueOutOfRange):
+        test_field.validate(low - 1)
+
+    with pytest.raises(ValueOutOfRange):
+        test_field.validate(high + 1)
+
+
+def test_enum_field():
+    """Test Enum Field Choice Tables."""
+
+    class State(Enum):
+        IDLE = "idle"
+        RUNNING = "running"
+
+    enum_field = fields.EnumField(State, default=State.IDLE)
+
+    assert enum_field.index == {State.IDLE: 0, State.RUNNING: 1}
+    assert enum_field.decode(1) is State.RUNNING
+    assert enum_field.validate(State.RUNNING) is True
+
+    # Enum value(not member) is not a valid choice
+    with pytest.raises(InvalidChoice):
+        enum_field.validate("running")
+
+    with pytest.raises(InvalidChoice):
+        fields.EnumField(State, default="idle")
+
+    # Wire index outside choice table
+    with pytest.raises(InvalidChoiceIndex):
+        enum_field.decode(2)
+
+    with pytest.raises(ValueError):
+        fields.EnumField(("a", "a"))
+
+
+def test_map_field():
+    """Test Map Field Key/Value Validation."""
+    map_field = fields.MapField(fields.StringField(), fields.IntField())
+
+    assert map_field.validate({"apples": 2, "pears": -1}) is True
+
+    # Invalid value type
+    with pytest.raises(TypeError):
+        map_field.validate({"apples": "two"})
+
+    # Missing key/value fields
+    with pytest.raises(TypeError):
+        fields.MapField().validate({})
+
+    # Nested data structures
+    with pytest.raises(TypeError):
+        fields.MapField(
+            fields.StringField(), fields.ListField(fields.IntField())
+        )
+
+
 def test_sub_fields():
     """Test Sub Fields Length."""
     sub_list = fields.ListField(fields.IntField(), fields.IntField())
@@ -0,0 +1,85 @@
+"""Renity Message Inspector Unit Tests Module."""
+
+import io
+
+from renity import stream
+from renity.fields import fields
+from renity.inspector import Summary
+from renity.inspector import inspect
+from renity.inspector import inspect_file
+from renity.messages.message import Message
+
+
+class InspectedMessage(Message):
+    """Test Message Subclass."""
+
+    name = fields.StringField(required=True)
+    hp = fields.IntField()
+    pos = fields.ListField(fields.FloatField(), fields.FloatField())
+
+
+class CompactInspectedMessage(Message):
+    """Test Compact Message Subclass."""
+
+    compact_type = True
+    x = fields.IntField()
+
+
+def test_inspect_rows():
+    """Test Rows Cover Message With Wire Details."""
+    data = bytes(InspectedMessage({"name": "bob", "hp": -5, "pos": [1.0, 2.0]}))
+    inspection = inspect(data, {"InspectedMessage": InspectedMessage})
+
+    assert inspection.type == "InspectedMessage"
+    assert inspection.size == len(data)
+    assert [row.key for row in inspection.rows] == [
+        "type",
+        "attributes",
+        "name",
+        "hp",
+        "pos",
+    ]
+    # Rows are contiguous
+    assert sum(row.size for row in inspection.rows) == len(data)
+    for row, following in zip(inspection.rows, inspection.rows[1:]):
+        assert row.offset + row.size == following.offset
+
+    name, hp, pos = inspection.rows[2:]
+    assert (name.wire, name.encoding, name.value) == ("LEN", "string", "bob")
+    assert (hp.wire, hp.encoding, hp.value) == ("VARINT", "sint32", -5)
+    assert (pos.encoding, pos.value, pos.bit) == ("packed", [1.0, 2.0], 4)
+    assert inspection.header_size == inspection.rows[0].size
+
+    # Unknown class -> attribute bits
+    unknown = inspect(data)
+    assert unknown.rows[2].key == "bit:1"
+
+    # Registered type_id resolves keys
+    compact = inspect(bytes(CompactInspectedMessage({"x": 300})))
+    assert compact.type == "CompactInspectedMessage"
+    assert compact.rows[0].encoding == "type_id"
+    assert (compact.rows[-1].key, compact.rows[-1].value) == ("x", 300)
+
+
+def test_inspect_file_summary():
+    """Test Framed/Raw Files & Aggregate Statistics."""
+    data = bytes(InspectedMessage({"name": "a", "hp": 3}))
+    framed = io.BytesIO(stream.pack(data) * 3)
+
+    summary = Summary()
+    for inspection in inspect_file(framed):
+        summary.add(inspection)
+    report = summary.as_dict()
+
+    assert report["messages"] == 3
+    assert report["bytes"] == 3 * len(data)
+    assert report["header_share"] == round(
+        inspection.header_size / len(data), 4
+    )
+    shares = {field["key"]: field for field in report["fields"]}
+    assert shares["bit:2"]["avg_bytes"] == inspection.rows[-1].size
+    assert sum(field["bytes"] for field in report["fields"]) == report["bytes"]
+
+    # Single message file is detected
+    raw = list(inspect_file(io.BytesIO(data)))
+    assert len(raw) == 1 and raw[0].size == len(data)
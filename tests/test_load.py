@@ -0,0 +1,57 @@
+"""Renity Load Harness Unit Tests Module."""
+
+import io
+import socketserver
+
+import pytest
+
+from renity import load
+from renity import stream
+from renity.fields import fields
+from renity.messages.message import Message
+
+
+class EchoMessage(Message):
+    """Test Message Subclass."""
+
+    x = fields.IntField()
+    name = fields.StringField()
+
+
+@pytest.mark.parametrize("server", sorted(load.SERVERS))
+def test_loopback_echo(server):
+    """Test Echo Servers Under Concurrent Clients."""
+    report = load.run(
+        EchoMessage,
+        {"x": 1, "name": "a"},
+        server=server,
+        clients=2,
+        rate=50,
+        duration=0.2,
+    )
+
+    assert report["errors"] == []
+    assert report["messages"] > 0
+    assert 0 < report["p50_us"] <= report["p99_us"] <= report["p999_us"]
+    assert report["throughput"] > 0
+
+    # Server option set on local subclass only
+    assert not socketserver.ThreadingTCPServer.daemon_threads
+
+
+def test_percentile():
+    """Test Nearest-Rank Percentile."""
+    values = list(range(1, 101))
+    assert load.percentile(values, 0.5) == 50
+    assert load.percentile(values, 0.99) == 99
+    assert load.percentile(values, 0.999) == 100
+    assert load.percentile([], 0.5) == 0
+
+
+def test_stream_frames():
+    """Test Length-Prefixed Frames."""
+    file = io.BytesIO(stream.pack(b"ab") + stream.pack(b"") + stream.pack(b"c"))
+    assert list(stream.frames(file)) == [b"ab", b"", b"c"]
+
+    with pytest.raises(EOFError):
+        list(stream.frames(io.BytesIO(stream.pack(b"abc")[:-1])))
@@ -1,5 +1,7 @@
 """Test cases for the __main__ module."""
 
+import json
+
 import pytest
 from click.testing import CliRunner
 
@@ -16,3 +18,132 @@ def test_main_succeeds(runner: CliRunner) -> None:
     """It exits with a status code of zero."""
     result = runner.invoke(__main__.main)
     assert result.exit_code == 0
+
+
+def test_bench(runner: CliRunner, tmp_path) -> None:
+    """It benchmarks scenarios and flags regressions."""
+    args = ["bench", "--number", "2", "--repeat", "1", "--filter", "width:1"]
+    output = tmp_path / "baseline.json"
+
+    result = runner.invoke(__main__.main, [*args, "--output", str(output)])
+    assert result.exit_code == 0
+    assert "width:1" in result.output
+
+    report = json.loads(output.read_text())
+    names = {(r["name"], r["operation"]) for r in report["results"]}
+    assert ("width:1", "round-trip") in names
+    assert ("baseline:struct:width:1", "decode") in names
+
+    # Within threshold -> no regressions
+    compare = ["--compare", str(output), "--threshold", "1000"]
+    result = runner.invoke(__main__.main, [*args, *compare])
+    assert result.exit_code == 0
+
+    # Much faster baseline -> regressions flagged
+    for r in report["results"]:
+        r["ns_per_op"] /= 10**6
+    output.write_text(json.dumps(report))
+    result = runner.invoke(__main__.main, [*args, *compare])
+    assert result.exit_code == 1
+
+
+def test_bench_memory_budget(runner: CliRunner, tmp_path) -> None:
+    """It reports allocations and fails over budget."""
+    args = [
+        "bench",
+        "--memory",
+        "--number",
+        "5",
+        "--filter",
+        "width:2",
+        "--json",
+    ]
+    budget = tmp_path / "budget.json"
+
+    budget.write_text(json.dumps({"*": {"*": {"alloc_bytes": 10**9}}}))
+    result = runner.invoke(__main__.main, [*args, "--budget", str(budget)])
+    assert result.exit_code == 0
+
+    report = json.loads(result.output)
+    operations = {r["operation"]: r for r in report["results"]}
+    assert set(operations) == {"encode", "decode", "construct", "instance"}
+    assert operations["instance"]["retained_bytes"] > 0
+
+    budget.write_text(
+        json.dumps({"width:2": {"instance": {"retained_bytes": 1}}})
+    )
+    result = runner.invoke(__main__.main, [*args, "--budget", str(budget)])
+    assert result.exit_code == 1
+
+
+def test_load(runner: CliRunner) -> None:
+    """It runs the loopback load harness."""
+    args = [
+        "load",
+        "--scenario",
+        "width:1",
+        "--clients",
+        "1",
+        "--duration",
+        "0.1",
+    ]
+    result = runner.invoke(__main__.main, args)
+    assert result.exit_code == 0
+    assert json.loads(result.output)["messages"] > 0
+
+    result = runner.invoke(__main__.main, ["load", "--scenario", "nope"])
+    assert result.exit_code == 2
+
+    # User schema, generated payload
+    schema = ["--schema", "tests.test_load:EchoMessage"]
+    result = runner.invoke(__main__.main, [*args, *schema])
+    assert result.exit_code == 0
+    assert json.loads(result.output)["messages"] > 0
+
+    for target in ("tests.test_load", "tests.test_load:Nope"):
+        result = runner.invoke(__main__.main, ["load", "--schema", target])
+        assert result.exit_code == 2
+
+
+def test_inspect(runner: CliRunner, tmp_path) -> None:
+    """It prints per-field rows and a summary of a framed file."""
+    from renity import stream
+    from tests.test_inspector import InspectedMessage
+
+    path = tmp_path / "messages.bin"
+    data = bytes(InspectedMessage({"name": "a", "hp": 3}))
+    path.write_bytes(stream.pack(data) * 2)
+
+    args = ["inspect", str(path), "--schema", "tests.test_inspector"]
+    result = runner.invoke(__main__.main, args)
+    assert result.exit_code == 0
+    assert "2 messages" in result.output
+    assert "InspectedMessage.hp" in result.output
+
+    result = runner.invoke(__main__.main, [*args, "--json", "--summary"])
+    assert result.exit_code == 0
+    assert json.loads(result.output)["messages"] == 2
+
+
+def test_encode_decode(runner: CliRunner, tmp_path) -> None:
+    """It transcodes NDJSON to frames and back."""
+    from tests.test_transcode import records
+
+    source = tmp_path / "messages.ndjson"
+    target = tmp_path / "messages.bin"
+    source.write_text("".join(records(10)))
+
+    module = "tests.test_transcode"
+    args = ["encode", module, str(source), str(target), "--workers", "2"]
+    result = runner.invoke(__main__.main, args)
+    assert result.exit_code == 0
+
+    result = runner.invoke(__main__.main, ["decode", module, str(target)])
+    assert result.exit_code == 0
+    assert result.output == source.read_text()
+
+    # Truncated input
+    target.write_bytes(target.read_bytes()[:-1])
+    result = runner.invoke(__main__.main, ["decode", module, str(target)])
+    assert result.exit_code == 1
+    assert "Truncated" in result.output
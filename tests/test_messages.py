@@ -1,11 +1,21 @@
 """Renity Message(s) Unit Tests Module."""
 
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
 from typing import Type
 
 import pytest
 
+from renity.decoder.exceptions import InvalidChoiceIndex
+from renity.decoder.exceptions import UnknownMessageType
+from renity.decoder.exceptions import UnsupportedFrame
 from renity.fields import fields
+from renity.messages.exceptions import SchemaMismatch
+from renity.messages.exceptions import TypeIdCollision
 from renity.messages.message import Message
+from renity.messages.registry import Registry
+from renity.validators.exceptions import InvalidChoice
+from renity.validators.exceptions import ValueOutOfRange
 
 
 class TestMessage(Message):
@@ -71,3 +81,495 @@ def test_byte_serializer(
             and message_instance[k] == valid_dictionary_test_message_dict[k]
         }
     ) == len(valid_dictionary_test_message_dict)
+
+
+def test_fixed_width_round_trip():
+    """Test Fixed-Width Fields De/serialization."""
+
+    class FixedWidthMessage(Message):
+        position = fields.Float32Field()
+        identifier = fields.Fixed32Field()
+        offset = fields.SFixed32Field()
+        digest = fields.Fixed64IntField()
+        delta = fields.SFixed64IntField()
+        packed = fields.ListField(fields.Float32Field(), fields.SFixed32Field())
+
+    dct = {
+        "position": 0.5,
+        "identifier": 4294967295,
+        "offset": -2147483648,
+        "digest": 18446744073709551615,
+        "delta": -1,
+        "packed": [-2.25, 7],
+    }
+
+    message_instance = FixedWidthMessage(dct)
+
+    # Float32(4 bytes) + Fixed32(4 bytes) + TLV(1 byte)
+    assert len(bytes(FixedWidthMessage({"position": 0.5}))) + 5 == len(
+        bytes(FixedWidthMessage({"position": 0.5, "identifier": 1}))
+    )
+
+    decoded = FixedWidthMessage(bytes(message_instance)).message
+
+    assert decoded == {"type": "FixedWidthMessage", **dct}
+
+    # Float32 range(finite values), inf passes
+    with pytest.raises(ValueOutOfRange):
+        FixedWidthMessage({"position": 1e40})
+    with pytest.raises(ValueOutOfRange):
+        FixedWidthMessage({"packed": [-1e40, 0]})
+    infinite = FixedWidthMessage({"position": float("inf")})
+    assert FixedWidthMessage(bytes(infinite)).position == float("inf")
+
+    # bool is not a fixed-width int
+    for key in ("identifier", "offset", "digest", "delta"):
+        with pytest.raises(TypeError):
+            FixedWidthMessage({key: True})
+
+
+def test_enum_round_trip():
+    """Test Enum Field De/serialization."""
+
+    class State(Enum):
+        IDLE = 0
+        RUNNING = 1
+        JUMPING = 2
+
+    class EnumMessage(Message):
+        state = fields.EnumField(State)
+        mode = fields.EnumField(("easy", "hard"), default="easy")
+        packed = fields.ListField(fields.EnumField(State), fields.IntField())
+
+    dct = {"state": State.JUMPING, "packed": [State.RUNNING, 3]}
+
+    message_instance = EnumMessage(dct)
+
+    # TLV(1 byte) + Varint(1 byte) per enum(default mode elided)
+    assert bytes(message_instance).startswith(
+        b"\x97\x88\x0bEnumMessage\x05\xa0\x02\x8a"
+    )
+
+    decoded = EnumMessage(bytes(message_instance)).message
+
+    assert decoded == {"type": "EnumMessage", "mode": "easy", **dct}
+
+    with pytest.raises(InvalidChoice):
+        EnumMessage({"state": "JUMPING"})
+
+    # Out of range wire index(3) for State
+    data = bytes(EnumMessage({"state": State.JUMPING}))
+    with pytest.raises(InvalidChoiceIndex):
+        EnumMessage(data.replace(b"\xa0\x02", b"\xa0\x03"))
+
+
+def test_map_round_trip():
+    """Test Map Field De/serialization."""
+
+    class InventoryMessage(Message):
+        counts = fields.MapField(fields.StringField(), fields.IntField())
+        scores = fields.MapField(fields.Fixed32Field(), fields.Float32Field())
+
+    dct = {
+        "counts": {"potion": 3, "arrow": 0, "debt": -20},
+        "scores": {4294967295: 0.5, 7: -1.25},
+    }
+
+    message_instance = InventoryMessage(dct)
+
+    decoded = InventoryMessage(bytes(message_instance)).message
+
+    assert decoded == {"type": "InventoryMessage", **dct}
+
+
+def test_message_slots():
+    """Test Generated Field Slots."""
+
+    class SlotMessage(Message):
+        hp = fields.IntField()
+        name = fields.StringField(default="Player")
+
+    message_instance = SlotMessage({"hp": 100})
+
+    # Field values stored in slots(no instance __dict__)
+    assert not hasattr(message_instance, "__dict__")
+    assert "hp" in SlotMessage.__slots__
+
+    assert message_instance.hp == message_instance["hp"] == 100
+    assert message_instance.name == "Player"
+    assert message_instance.message == {
+        "type": "SlotMessage",
+        "hp": 100,
+        "name": "Player",
+    }
+
+    # Empty message
+    assert SlotMessage().message is None
+
+    # Field shadowing runtime attribute
+    with pytest.raises(TypeError):
+
+        class ProtectedMessage(Message):
+            data = fields.IntField()
+
+    # Option & helper names stay available as field names
+    class OptionNamedMessage(Message):
+        validation = fields.StringField()
+        compression = fields.IntField()
+        pool_size = fields.IntField()
+        update = fields.BoolField()
+        template = fields.FloatField()
+
+    values = {
+        "validation": "strict",
+        "compression": 9,
+        "pool_size": 2,
+        "update": True,
+        "template": 1.5,
+    }
+    option_instance = OptionNamedMessage(values)
+    assert option_instance.compression == 9
+    assert OptionNamedMessage(bytes(option_instance)).message == {
+        "type": "OptionNamedMessage",
+        **values,
+    }
+
+
+def test_message_reuse():
+    """Test In-Place Update, decode_into & Pooling."""
+
+    class PoolMessage(Message):
+        pool_size = 1
+        x = fields.FloatField()
+        hp = fields.IntField(default=100)
+
+    message_instance = PoolMessage({"x": 1.5})
+    encoded = bytes(message_instance)
+
+    # Serializer chain is shared by sub-class
+    assert message_instance.serializer is PoolMessage().serializer
+
+    # Merge dict into current values
+    assert message_instance.update({"hp": 3}) is message_instance
+    assert message_instance.message == {
+        "type": "PoolMessage",
+        "x": 1.5,
+        "hp": 3,
+    }
+    assert bytes(message_instance) == bytes(PoolMessage({"x": 1.5, "hp": 3}))
+
+    # Overwrite existing instance
+    assert PoolMessage.decode_into(message_instance, encoded).hp == 100
+    assert bytes(message_instance) == encoded
+
+    with pytest.raises(TypeError):
+        TestMessage.decode_into(message_instance, encoded)
+
+    # Bounded pool
+    message_instance.release()
+    message_instance.release()
+    PoolMessage({"x": 2.0}).release()
+
+    reused = PoolMessage.acquire({"x": 2.5})
+    assert reused is message_instance
+    assert reused.x == 2.5
+    assert PoolMessage.acquire({"x": 3.0}) is not message_instance
+
+    # Released instances keep no stale values
+    reused.release()
+    empty = PoolMessage.acquire()
+    assert empty is reused
+    assert empty.message is None
+    assert empty.data is None
+    assert not hasattr(empty, "x")
+
+
+def test_concurrent_encode():
+    """Test Shared Serializer Chain Across Threads."""
+
+    class ConcurrentMessage(Message):
+        hp = fields.IntField()
+        name = fields.StringField()
+
+    values = [{"hp": idx - 100, "name": str(idx)} for idx in range(200)]
+    expected = [bytes(ConcurrentMessage(value)) for value in values]
+
+    with ThreadPoolExecutor(8) as pool:
+        encoded = list(
+            pool.map(lambda value: bytes(ConcurrentMessage(value)), values)
+        )
+
+    assert encoded == expected
+
+
+def test_compact_type_id():
+    """Test Registry Type Identifier."""
+
+    class ExplicitMessage(Message):
+        type_id = 5
+        hp = fields.IntField()
+
+    class DerivedMessage(Message):
+        compact_type = True
+        hp = fields.IntField()
+
+    explicit = ExplicitMessage({"hp": 1})
+
+    # Identifier TLV + Varint(type_id) instead of LEN: String
+    assert bytes(explicit) == b"\x8f\x05\x01\x88\x01"
+    assert ExplicitMessage(bytes(explicit)).message == {
+        "type": "ExplicitMessage",
+        "hp": 1,
+    }
+
+    derived = DerivedMessage({"hp": 1})
+    assert 128 <= DerivedMessage._type_id < 2**14
+    assert len(bytes(derived)) == len(bytes(explicit)) + 1
+    assert Registry.resolve(DerivedMessage._type_id) is DerivedMessage
+
+    # Registered to a different Message sub-class
+    with pytest.raises(TypeError):
+        DerivedMessage(bytes(explicit))
+
+    with pytest.raises(UnknownMessageType):
+        ExplicitMessage(b"\x8f\x06\x01\x88\x01")
+
+    # Same type_id different schema
+    with pytest.raises(TypeIdCollision):
+
+        class CollisionMessage(Message):
+            type_id = 5
+            mp = fields.IntField()
+
+    assert Registry.verify({5: ExplicitMessage._fingerprint})
+    with pytest.raises(SchemaMismatch):
+        Registry.verify({5: DerivedMessage._fingerprint})
+
+
+def test_default_elision():
+    """Test Default Value Elision."""
+
+    class ElidedMessage(Message):
+        name = fields.StringField(default="World")
+        hp = fields.IntField(default=100)
+        x = fields.FloatField()
+
+    class FullMessage(Message):
+        elide_defaults = False
+        name = fields.StringField(default="World")
+        hp = fields.IntField(default=100)
+        x = fields.FloatField()
+
+    dct = {"type": "ElidedMessage", "name": "World", "hp": 100, "x": 0.5}
+
+    # Default(s) left out of presence bitmap
+    elided = ElidedMessage({"x": 0.5})
+    assert bytes(elided) == bytes(ElidedMessage(dct))
+    assert bytes(elided)[16] == 0b100
+    assert bytes(FullMessage({"x": 0.5}))[14] == 0b111
+
+    # Restored from schema on decode
+    assert ElidedMessage(bytes(elided)).message == dct
+
+    # Non-default value is encoded
+    changed = ElidedMessage({"x": 0.5, "hp": 99})
+    assert ElidedMessage(bytes(changed)).hp == 99
+
+
+def test_encode_cache(monkeypatch):
+    """Test Encode-Result Cache."""
+
+    class CachedMessage(Message):
+        encode_cache_size = 2
+        x = fields.FloatField()
+        tags = fields.MapField(fields.StringField(), fields.IntField())
+
+    cache = CachedMessage.encode_cache
+    data = bytes(CachedMessage({"x": 1.5, "tags": {"a": 1}}))
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # Hit bypasses Encoder
+    from renity.serializers import serializers
+
+    monkeypatch.setattr(serializers.Encoder, "encode", None)
+    assert bytes(CachedMessage({"x": 1.5, "tags": {"a": 1}})) == data
+    assert (cache.hits, cache.misses) == (1, 1)
+    monkeypatch.undo()
+
+    # Equal but differently-encoded values are distinct keys
+    assert bytes(CachedMessage({"x": -0.0})) != bytes(CachedMessage({"x": 0.0}))
+    assert cache.misses == 3 and len(cache) == 2
+
+    # Disabled by default
+    assert Message.encode_cache is None
+    assert TestMessage.encode_cache is None
+
+
+def test_template():
+    """Test Template In-Place Patching."""
+
+    class PositionMessage(Message):
+        name = fields.StringField()
+        x = fields.FloatField()
+        y = fields.Float32Field()
+        moving = fields.BoolField(default=False)
+        tick = fields.Fixed32Field()
+        hp = fields.IntField(default=100)
+
+    template = PositionMessage.template(name="player")
+    assert set(template.offsets) == {"x", "y", "moving", "tick"}
+
+    template.update(x=1.5, y=-2.0, moving=True)
+    template["tick"] = 7
+    assert template["x"] == 1.5
+
+    decoded = PositionMessage(bytes(template))
+    assert decoded.message == {
+        "type": "PositionMessage",
+        "name": "player",
+        "x": 1.5,
+        "y": -2.0,
+        "moving": True,
+        "tick": 7,
+        "hp": 100,
+    }
+
+    # Non-ASCII constant string
+    template = PositionMessage.template(name="José")
+    template.update(x=0.5, tick=9)
+    assert PositionMessage(bytes(template)).message == {
+        "type": "PositionMessage",
+        "name": "José",
+        "x": 0.5,
+        "y": 0.0,
+        "moving": False,
+        "tick": 9,
+        "hp": 100,
+    }
+
+
+def test_fixed_layout():
+    """Test Fixed-Layout Struct Mode."""
+
+    class BodyMessage(Message):
+        fixed_layout = True
+        x = fields.FloatField()
+        y = fields.Float32Field()
+        sleeping = fields.BoolField(default=False)
+        tick = fields.Fixed32Field()
+
+    class TaggedBodyMessage(Message):
+        x = fields.FloatField()
+        y = fields.Float32Field()
+        sleeping = fields.BoolField(default=False)
+        tick = fields.Fixed32Field()
+
+    dct = {
+        "type": "BodyMessage",
+        "x": 1.5,
+        "y": 2.0,
+        "sleeping": True,
+        "tick": 3,
+    }
+    data = bytes(BodyMessage(dct))
+    layout = BodyMessage._layout
+    assert data == layout.prefix + layout.body.pack(1.5, 2.0, True, 3)
+    assert BodyMessage(data).message == dct
+
+    # Absent values encoded as default/zero
+    assert BodyMessage(bytes(BodyMessage({"x": 1.0}))).message == {
+        "type": "BodyMessage",
+        "x": 1.0,
+        "y": 0.0,
+        "sleeping": False,
+        "tick": 0,
+    }
+
+    # Bulk decode
+    rows = list(BodyMessage.iter_unpack(data * 3))
+    assert rows == [dct] * 3
+
+    # Tagged decoder rejects fixed-layout frame
+    with pytest.raises(UnsupportedFrame):
+        TaggedBodyMessage(data)
+
+    # Fixed-width fields only
+    with pytest.raises(TypeError):
+
+        class NamedBodyMessage(Message):
+            fixed_layout = True
+            name = fields.StringField()
+
+
+def test_validation_modes():
+    """Test Strict/Trusted/Sampled Validation."""
+
+    class TrustedMessage(Message):
+        validation = "trusted"
+        x = fields.IntField()
+
+    class SampledMessage(Message):
+        validation = "sampled"
+        sample_rate = 2
+        x = fields.IntField()
+
+    def reject(value):
+        raise TypeError(value)
+
+    TrustedMessage._fields["x"].check = reject
+
+    # Trusted skips validators(per class)
+    assert TrustedMessage({"x": 1}).x == 1
+
+    # Per call overrides class mode
+    with pytest.raises(TypeError):
+        TrustedMessage({"x": 1}, validation="strict")
+
+    # Sampled validates 1 in sample_rate & counts failures
+    with pytest.raises(TypeError):
+        SampledMessage({"x": "a"})
+    SampledMessage({"x": 1})
+    SampledMessage({"x": 2})
+    assert SampledMessage.validation_counts == {
+        "messages": 3,
+        "validated": 2,
+        "failures": 1,
+    }
+
+    with pytest.raises(ValueError):
+        SampledMessage({"x": 1}, validation="lenient")
+
+
+def test_unordered_list_round_trip():
+    """Test Unordered ListField Type Matching."""
+
+    class LooseMessage(Message):
+        values = fields.ListField(
+            fields.IntField(),
+            fields.FloatField(),
+            fields.StringField(),
+            fields.IntField(),
+            sorted=False,
+        )
+
+    dct = {"type": "LooseMessage", "values": ["a", -3, 2.5, 7]}
+    data = bytes(LooseMessage(dct))
+    assert LooseMessage(data).message == dct
+
+    # Any order is accepted
+    assert LooseMessage(bytes(LooseMessage({"values": [1.5, 1]}))).values == [
+        1.5,
+        1,
+    ]
+
+    # Value without a matching sub-field
+    with pytest.raises(TypeError):
+        LooseMessage({"values": [1, 2, 3]})
+
+    # Sub-field data_type must be concrete
+    with pytest.raises(TypeError):
+        fields.ListField(
+            fields.EnumField(choices=("a", "b")),
+            fields.IntField(),
+            sorted=False,
+        )
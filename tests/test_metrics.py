@@ -0,0 +1,83 @@
+"""Renity Instrumentation Unit Tests Module."""
+
+import pytest
+
+from renity.fields import fields
+from renity.messages.message import Message
+from renity.metrics import instrumentation
+
+
+class MeteredMessage(Message):
+    """Test Message Subclass."""
+
+    x = fields.IntField()
+
+
+@pytest.fixture
+def metrics():
+    """Enabled instrumentation(restored after test)."""
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.callbacks.clear()
+    instrumentation.reset()
+
+
+def test_disabled_records_nothing():
+    """Test Disabled Instrumentation."""
+    instrumentation.reset()
+    MeteredMessage(bytes(MeteredMessage({"x": 1})))
+    assert instrumentation.snapshot() == {}
+
+
+def test_counters_and_timings(metrics):
+    """Test Counters, Stage Timings & Callbacks."""
+    events = []
+    metrics.subscribe(events.append)
+
+    data = bytes(MeteredMessage({"x": 1}))
+    MeteredMessage(data)
+
+    with pytest.raises(TypeError):
+        MeteredMessage({"x": "1"})
+
+    stats = metrics.snapshot()["MeteredMessage"]
+    assert stats["messages_out"] == 1
+    assert stats["messages_in"] == 1
+    assert stats["bytes_out"] == stats["bytes_in"] == len(data)
+    assert stats["validation_failures"] == 1
+    assert set(stats["stages"]) == {"encode", "decode", "validate"}
+
+    encode = stats["stages"]["encode"]
+    assert encode["count"] == 1
+    assert sum(encode["histogram"].values()) == 1
+    assert encode["total_ns"] <= max(encode["histogram"])
+
+    assert [(e.stage, e.error is None) for e in events] == [
+        ("validate", True),
+        ("encode", True),
+        ("validate", True),
+        ("decode", True),
+        ("validate", False),
+        ("encode", False),
+    ]
+
+
+def test_callback_errors(metrics):
+    """Test Callback Errors Do Not Hide Stage Errors."""
+
+    def callback(event):
+        raise RuntimeError(event.stage)
+
+    metrics.subscribe(callback)
+
+    # Stage error is raised, failure recorded
+    with pytest.raises(TypeError):
+        MeteredMessage({"x": "1"})
+    assert metrics.snapshot()["MeteredMessage"]["validation_failures"] == 1
+
+    # Successful stage is recorded before callbacks run
+    with pytest.raises(RuntimeError):
+        MeteredMessage({"x": 1})
+    assert metrics.snapshot()["MeteredMessage"]["stages"]["validate"]["count"]
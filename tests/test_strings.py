@@ -0,0 +1,57 @@
+"""Renity String Table Unit Test Module."""
+
+from renity.fields import fields
+from renity.messages.message import Message
+from renity.messages.strings import StringTable
+
+
+class LootMessage(Message):
+    """Loot Message Subclass."""
+
+    player = fields.StringField()
+    zone = fields.StringField(default="lobby")
+    items = fields.ListField(fields.StringField(), fields.IntField())
+    counts = fields.MapField(fields.StringField(), fields.IntField())
+
+
+def test_string_table_round_trip():
+    """Test String References Round Trip."""
+    sender = StringTable()
+    receiver = StringTable()
+
+    dct = {
+        "player": "DmitrievichLevin",
+        "zone": "dungeon-of-repetition",
+        "items": ["DmitrievichLevin", 3],
+        "counts": {"dungeon-of-repetition": 1},
+    }
+
+    first = sender.encode(LootMessage(dct))
+    second = sender.encode(LootMessage(dct))
+
+    # Repeated strings sent as varint references
+    assert len(second) < len(first) - 2 * len("DmitrievichLevin")
+    assert len(first) < len(bytes(LootMessage(dct)))
+
+    for data in (first, second):
+        decoded = receiver.decode(LootMessage, data)
+        assert decoded.message == {"type": "LootMessage", **dct}
+
+    # Interned str objects
+    assert decoded.player is decoded.items[0]
+    assert decoded.player is receiver.decode(LootMessage, second).player
+
+
+def test_string_table_eviction():
+    """Test Bounded LRU Eviction on Both Ends."""
+    sender = StringTable(capacity=2)
+    receiver = StringTable(capacity=2)
+
+    players = ["a", "b", "a", "c", "b", "a", "c", "c"]
+
+    for player in players:
+        data = sender.encode(LootMessage({"player": player}))
+        assert receiver.decode(LootMessage, data).player == player
+
+    assert len(sender.sent) == len(receiver.received) == 2
+    assert set(sender.sent) == set(receiver.received.values())
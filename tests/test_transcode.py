@@ -0,0 +1,117 @@
+"""Renity NDJSON Transcoding Unit Tests Module."""
+
+import io
+import json
+from enum import Enum
+
+import pytest
+
+from renity import stream
+from renity import transcode
+from renity.fields import fields
+from renity.messages.message import Message
+
+
+MODULE = "tests.test_transcode"
+
+
+class TranscodedMessage(Message):
+    """Test Message Subclass."""
+
+    name = fields.StringField(required=True)
+    hp = fields.IntField()
+
+
+class CompactTranscodedMessage(Message):
+    """Test Compact Message Subclass."""
+
+    compact_type = True
+    x = fields.FloatField()
+
+
+class Color(Enum):
+    """Test Enum."""
+
+    RED = 1
+    GREEN = 2
+
+
+class ChoiceMapMessage(Message):
+    """Test Enum & Int-Key Map Message Subclass."""
+
+    color = fields.EnumField(Color)
+    names = fields.MapField(fields.IntField(), fields.StringField())
+    flags = fields.MapField(fields.BoolField(), fields.EnumField(Color))
+
+
+def records(count):
+    """NDJSON Test Lines."""
+    for idx in range(count):
+        message = {"type": "TranscodedMessage", "name": f"n{idx}", "hp": idx}
+        yield json.dumps(message) + "\n"
+        message = {"type": "CompactTranscodedMessage", "x": idx / 2}
+        yield json.dumps(message) + "\n"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_round_trip(workers):
+    """Test NDJSON -> Frames -> NDJSON In Order."""
+    lines = list(records(50))
+    frames = b"".join(
+        transcode.encode(lines, MODULE, workers=workers, batch_size=7)
+    )
+
+    decoded = transcode.decode(
+        stream.frames(io.BytesIO(frames)),
+        MODULE,
+        workers=workers,
+        batch_size=7,
+    )
+    assert list(decoded) == lines
+
+
+def test_errors():
+    """Test Record Numbers & Default Type."""
+    # Lines without type(ambiguous module -> --type)
+    lines = ['{"name": "a"}\n', "\n", '{"hp": 1, "name": "b"}\n']
+    with pytest.raises(ValueError, match="Record 1"):
+        list(transcode.encode(lines, MODULE))
+
+    frames = list(transcode.encode(lines, MODULE, "TranscodedMessage"))
+    assert len(frames) == 2
+
+    with pytest.raises(ValueError, match="Unknown message type"):
+        list(transcode.encode(lines, MODULE, "Missing"))
+
+    bad = ['{"type": "TranscodedMessage", "name": 1}\n']
+    with pytest.raises(ValueError, match="Record 1"):
+        list(transcode.encode(bad, MODULE, workers=2))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_enum_and_map_keys(workers):
+    """Test Enum Names & Non-String Map Keys Round-Trip."""
+    message = {
+        "type": "ChoiceMapMessage",
+        "color": "GREEN",
+        "names": {"1": "a", "-20": "b"},
+        "flags": {"true": "RED"},
+    }
+    lines = [json.dumps(message) + "\n"]
+    frames = b"".join(transcode.encode(lines, MODULE, workers=workers))
+
+    (data,) = stream.frames(io.BytesIO(frames))
+    decoded = ChoiceMapMessage(data)
+    assert decoded.color is Color.GREEN
+    assert decoded.names == {1: "a", -20: "b"}
+    assert decoded.flags == {True: Color.RED}
+
+    lines_out = transcode.decode(
+        stream.frames(io.BytesIO(frames)), MODULE, workers=workers
+    )
+    assert list(lines_out) == lines
+
+    # Unknown member name fails validation
+    bad = [lines[0].replace("GREEN", "BLUE")]
+    with pytest.raises(ValueError, match="InvalidChoice"):
+        list(transcode.encode(bad, MODULE))
@@ -102,3 +102,41 @@ def test_list_order_validators():
     unordered_validator = UnorderedValidator(unordered)
     with pytest.raises(TypeError):
         unordered_validator.verify([3.14, 2, 99])
+
+
+def test_compiled_chain_validates_once():
+    """Test Compiled Validation Runs Once Per Serialization."""
+    from renity.fields.constants import FIXED64
+    from renity.fields.constants import I64
+    from renity.messages.message import Message
+    from renity.validators.interface import Validator
+
+    calls = []
+
+    class CountingValidator(Validator):
+        def verify(self, request):
+            calls.append(request)
+            return super().verify(request)
+
+    class CountedField(FloatField):
+        wire = I64
+        field = FIXED64
+        data_type = float
+        validators = [CountingValidator]
+
+    class CountedMessage(Message):
+        x = CountedField()
+        values = ListField(IntField(), CountedField())
+
+    data = bytes(CountedMessage({"x": 0.5, "values": [1, 1.5]}))
+    assert calls == [0.5, 1.5]
+
+    CountedMessage(data)
+    assert calls == [0.5, 1.5, 0.5, 1.5]
+
+    # Compiled chain raises like the linked chain
+    with pytest.raises(TypeError):
+        CountedMessage({"values": [1, 2]})
+
+    with pytest.raises(TooManyValues):
+        CountedMessage({"values": [1, 1.5, 2]})